@@ -22,6 +22,51 @@ except ImportError:
         return wrapper
 
 
+class GroupbyNumThreads(object):
+    goal_time = 0.2
+
+    def setup(self):
+        np.random.seed(1234)
+        self.N = 1000000
+        self.ngroups = 1000
+        self.df = DataFrame(np.random.randn(self.N, 8))
+        self.df['key'] = np.random.randint(0, self.ngroups, size=self.N)
+        self.grouped = self.df.groupby('key')
+
+    def time_sum_1(self):
+        self.grouped.agg('sum', num_threads=1)
+
+    def time_sum_4(self):
+        self.grouped.agg('sum', num_threads=4)
+
+    def time_series_sum_4(self):
+        self.grouped[0].agg('sum', num_threads=4)
+
+    def time_mean_4(self):
+        self.grouped.agg('mean', num_threads=4)
+
+
+class MergeNumThreads(object):
+    goal_time = 0.2
+
+    def setup(self):
+        np.random.seed(1234)
+        self.N = 1000000
+        self.left = DataFrame({'key': np.random.randint(0, self.N, self.N),
+                               'value': np.random.randn(self.N)})
+        self.right = DataFrame({'key': np.arange(self.N),
+                                'other': np.random.randn(self.N)})
+
+    def time_merge_1(self):
+        merge(self.left, self.right, on='key', num_threads=1)
+
+    def time_merge_4(self):
+        merge(self.left, self.right, on='key', num_threads=4)
+
+    def time_merge_left_4(self):
+        merge(self.left, self.right, on='key', how='left', num_threads=4)
+
+
 class NoGilGroupby(object):
     goal_time = 0.2
 
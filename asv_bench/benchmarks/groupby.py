@@ -268,6 +268,9 @@ class groupby_agg_multi(object):
     def time_groupby_multi_different_numpy_functions(self):
         self.df.groupby(['key1', 'key2']).agg({'value1': np.mean, 'value2': np.var, 'value3': np.sum})
 
+    def time_groupby_multi_functions_per_column(self):
+        self.df.groupby(['key1', 'key2']).agg(['count', 'sum', 'mean', 'std', 'min', 'max'])
+
 
 class groupby_multi_index(object):
     goal_time = 0.2
@@ -403,6 +406,12 @@ class GroupBySuite(object):
     def time_head(self, dtype, ngroups):
         self.df.groupby('key')['values'].head()
 
+    def time_idxmax(self, dtype, ngroups):
+        self.df.groupby('key')['values'].idxmax()
+
+    def time_idxmin(self, dtype, ngroups):
+        self.df.groupby('key')['values'].idxmin()
+
     def time_last(self, dtype, ngroups):
         self.df.groupby('key')['values'].last()
 
@@ -430,6 +439,9 @@ class GroupBySuite(object):
     def time_prod(self, dtype, ngroups):
         self.df.groupby('key')['values'].prod()
 
+    def time_quantile(self, dtype, ngroups):
+        self.df.groupby('key')['values'].quantile(0.25)
+
     def time_rank(self, dtype, ngroups):
         self.df.groupby('key')['values'].rank()
 
@@ -572,6 +584,28 @@ class groupby_sum_multiindex(object):
         self.df.groupby(level=[0, 1]).sum()
 
 
+#-------------------------------------------------------------------------------
+# rolling and expanding windows on many short groups
+
+class groupby_rolling(object):
+    goal_time = 0.2
+
+    def setup(self):
+        np.random.seed(1234)
+        self.N = 100000
+        self.df = DataFrame({'key': np.random.randint(0, 20000, self.N),
+                             'val': np.random.randn(self.N)})
+
+    def time_rolling_mean(self):
+        self.df.groupby('key')['val'].rolling(5).mean()
+
+    def time_rolling_max(self):
+        self.df.groupby('key')['val'].rolling(5).max()
+
+    def time_expanding_sum(self):
+        self.df.groupby('key')['val'].expanding().sum()
+
+
 #-------------------------------------------------------------------------------
 # Transform testing
 
@@ -200,6 +200,27 @@ class MultiIndexing(object):
         self.mdt2.loc[self.idx[(self.test_A - self.eps_A):(self.test_A + self.eps_A), (self.test_B - self.eps_B):(self.test_B + self.eps_B), (self.test_C - self.eps_C):(self.test_C + self.eps_C), (self.test_D - self.eps_D):(self.test_D + self.eps_D)], :]
 
 
+class MultiIndexGetLoc(object):
+    goal_time = 0.2
+
+    def setup(self):
+        self.levels = [np.arange(1000), np.arange(100),
+                       tm.makeStringIndex(50)]
+        self.mi = MultiIndex.from_product(self.levels)
+        self.key = (999, 99, self.levels[2][-1])
+        self.target = self.mi[::10]
+        self.mi.get_loc(self.key)
+
+    def time_get_loc(self):
+        self.mi.get_loc(self.key)
+
+    def time_contains(self):
+        self.key in self.mi
+
+    def time_get_indexer(self):
+        self.mi.get_indexer(self.target)
+
+
 class PanelIndexing(object):
     goal_time = 0.2
 
@@ -49,6 +49,10 @@ class Concat(object):
         self.pieces = (self.pieces * 50)
 
         self.df_small = pd.DataFrame(randn(5, 4))
+        self.mixed_frames = [pd.DataFrame({'A': np.arange(10),
+                                           'B': randn(10),
+                                           'C': (['foo'] * 10)})
+                             for _ in range(10000)]
 
         # empty
         self.df = pd.DataFrame(dict(A=range(10000)), index=date_range('20130101', periods=10000, freq='s'))
@@ -60,6 +64,9 @@ class Concat(object):
     def time_concat_small_frames(self):
         concat(([self.df_small] * 1000))
 
+    def time_concat_many_mixed_frames(self):
+        concat(self.mixed_frames)
+
     def time_concat_empty_frames1(self):
         concat([self.df, self.empty])
 
@@ -257,6 +264,76 @@ class i8merge(object):
         merge(self.left, self.right, how='outer')
 
 
+class MergeSortedKeys(object):
+    goal_time = 0.2
+
+    def setup(self):
+        np.random.seed(1234)
+        n = 1000000
+        self.left = DataFrame({'key': np.sort(np.random.randint(0, n, n)),
+                               'key2': np.random.randint(0, 10, n),
+                               'value': np.random.randn(n)})
+        self.left = self.left.sort_values(['key', 'key2'])
+        self.right = DataFrame({'key': np.arange(n),
+                                'key2': np.random.randint(0, 10, n),
+                                'other': np.random.randn(n)})
+        self.right['time'] = pd.date_range('20160101', periods=n, freq='s')
+        self.left['time'] = self.right['time'].take(self.left['key']).values
+
+    def time_merge_sorted_int(self):
+        merge(self.left, self.right, on='key')
+
+    def time_merge_sorted_datetime_left(self):
+        merge(self.left, self.right, on='time', how='left')
+
+    def time_merge_sorted_2key_outer(self):
+        merge(self.left, self.right, on=['key', 'key2'], how='outer')
+
+
+class MergePrepared(object):
+    goal_time = 0.2
+
+    def setup(self):
+        np.random.seed(1234)
+        n = 1000000
+        self.dim = DataFrame({'key': np.random.permutation(n),
+                              'value': np.random.randn(n)})
+        self.chunk = DataFrame({'key': np.random.randint(0, 2 * n, 10000),
+                                'other': np.random.randn(10000)})
+        self.prepared = pd.PreparedJoin(self.dim, on='key')
+
+    def time_merge_chunk(self):
+        merge(self.chunk, self.dim, on='key', how='left')
+
+    def time_prepared_merge_chunk(self):
+        self.prepared.merge(self.chunk, how='left')
+
+    def time_merge_iter(self):
+        chunks = [self.chunk] * 10
+        for result in pd.merge_iter(chunks, self.dim, on='key', how='left'):
+            pass
+
+
+class SemiJoin(object):
+    goal_time = 0.2
+
+    def setup(self):
+        np.random.seed(1234)
+        n = 1000000
+        self.left = DataFrame({'key': np.random.randint(0, n, n),
+                               'key2': np.random.randint(0, 10, n),
+                               'value': np.random.randn(n)})
+        self.right = DataFrame({'key': np.random.randint(0, n, n // 2),
+                                'key2': np.random.randint(0, 10, n // 2),
+                                'other': np.random.randn(n // 2)})
+
+    def time_semi_join(self):
+        self.left.semi_join(self.right, on='key')
+
+    def time_anti_join_2key(self):
+        self.left.anti_join(self.right, on=['key', 'key2'])
+
+
 #----------------------------------------------------------------------
 # Ordered merge
 
@@ -308,6 +385,8 @@ class MergeAsof(object):
         self.df2b = self.df2[['time', 'key', 'value2']]
         self.df1c = self.df1[['time', 'key2', 'value1']]
         self.df2c = self.df2[['time', 'key2', 'value2']]
+        self.df1d = self.df1[['time', 'key', 'key2', 'value1']]
+        self.df2d = self.df2[['time', 'key', 'key2', 'value2']]
 
     def time_noby(self):
         merge_asof(self.df1a, self.df2a, on='time')
@@ -318,6 +397,46 @@ class MergeAsof(object):
     def time_by_int(self):
         merge_asof(self.df1c, self.df2c, on='time', by='key2')
 
+    def time_multiby(self):
+        merge_asof(self.df1d, self.df2d, on='time', by=['key', 'key2'])
+
+    def time_nearest_by_int(self):
+        merge_asof(self.df1c, self.df2c, on='time', by='key2',
+                   direction='nearest')
+
+
+# ----------------------------------------------------------------------
+# interval merge
+
+class MergeIntervals(object):
+
+    def setup(self):
+        np.random.seed(0)
+        n = 1000000
+        m = 100000
+
+        self.points = pd.DataFrame(
+            {'time': np.random.randint(0, 10 ** 8, n),
+             'key': np.random.randint(0, 100, n),
+             'value1': np.random.randn(n)})
+        self.intervals = pd.DataFrame(
+            {'start': np.random.randint(0, 10 ** 8, m),
+             'key': np.random.randint(0, 100, m),
+             'value2': np.random.randn(m)})
+        self.intervals['end'] = (self.intervals['start'] +
+                                 np.random.randint(0, 10 ** 5, m))
+        self.spans = self.points.rename(columns={'time': 'start'})
+        self.spans['end'] = self.spans['start'] + 1000
+
+    def time_point_by(self):
+        merge_intervals(self.points, self.intervals, left_on='time',
+                        right_start='start', right_end='end', by='key')
+
+    def time_overlap_by(self):
+        merge_intervals(self.spans, self.intervals, left_start='start',
+                        left_end='end', right_start='start', right_end='end',
+                        by='key')
+
 
 #----------------------------------------------------------------------
 # data alignment
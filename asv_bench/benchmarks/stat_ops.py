@@ -259,3 +259,47 @@ class stats_rolling_mean(object):
 
     def time_rolling_kurt(self):
         rolling_kurt(self.arr, self.win)
+
+
+class stats_rolling_frame(object):
+    goal_time = 0.2
+
+    def setup(self):
+        self.df = DataFrame(np.random.randn(10000, 200))
+        self.win = 100
+        self.pairs = DataFrame(np.random.randn(1000, 50))
+
+    def time_rolling_frame_mean(self):
+        self.df.rolling(self.win).mean()
+
+    def time_rolling_frame_sum(self):
+        self.df.rolling(self.win).sum()
+
+    def time_rolling_frame_var(self):
+        self.df.rolling(self.win).var()
+
+    def time_rolling_frame_skew(self):
+        self.df.rolling(self.win).skew()
+
+    def time_rolling_frame_quantiles(self):
+        self.df.rolling(self.win).quantile([0.05, 0.25, 0.5, 0.75, 0.95])
+
+    def time_rolling_frame_cov_pairwise(self):
+        self.pairs.rolling(self.win).cov()
+
+    def time_rolling_frame_corr_pairwise(self):
+        self.pairs.rolling(self.win).corr()
+
+
+class stats_rolling_apply(object):
+    goal_time = 0.2
+
+    def setup(self):
+        self.s = Series(np.random.randn(100000))
+        self.win = 100
+
+    def time_rolling_apply(self):
+        self.s.rolling(self.win).apply(np.std)
+
+    def time_rolling_apply_batch(self):
+        self.s.rolling(self.win).apply(lambda x: x.std(axis=1), batch=True)
@@ -44,8 +44,10 @@ from pandas.io.api import *
 from pandas.computation.api import *
 
 from pandas.tools.merge import (merge, concat, ordered_merge,
-                                merge_ordered, merge_asof)
+                                merge_ordered, merge_asof, merge_intervals,
+                                merge_iter, PreparedJoin)
 from pandas.tools.pivot import pivot_table, crosstab
+from pandas.tools.streaming import streaming_groupby
 from pandas.tools.plotting import scatter_matrix, plot_params
 from pandas.tools.tile import cut, qcut
 from pandas.tools.util import to_numeric
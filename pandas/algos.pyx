@@ -66,6 +66,21 @@ tiebreakers = {
     'dense': TIEBREAK_DENSE,
 }
 
+cdef:
+    int INTERPOLATION_LINEAR = 0
+    int INTERPOLATION_LOWER = 1
+    int INTERPOLATION_HIGHER = 2
+    int INTERPOLATION_NEAREST = 3
+    int INTERPOLATION_MIDPOINT = 4
+
+interpolations = {
+    'linear': INTERPOLATION_LINEAR,
+    'lower': INTERPOLATION_LOWER,
+    'higher': INTERPOLATION_HIGHER,
+    'nearest': INTERPOLATION_NEAREST,
+    'midpoint': INTERPOLATION_MIDPOINT,
+}
+
 
 # ctypedef fused pvalue_t:
 #     float64_t
@@ -53,7 +53,7 @@ class TestPDApi(Base, tm.TestCase):
     classes = ['Categorical', 'CategoricalIndex', 'DataFrame', 'DateOffset',
                'DatetimeIndex', 'ExcelFile', 'ExcelWriter', 'Float64Index',
                'Grouper', 'HDFStore', 'Index', 'Int64Index', 'MultiIndex',
-               'Period', 'PeriodIndex', 'RangeIndex',
+               'Period', 'PeriodIndex', 'PreparedJoin', 'RangeIndex',
                'Series', 'SparseArray', 'SparseDataFrame',
                'SparseSeries', 'TimeGrouper', 'Timedelta',
                'TimedeltaIndex', 'Timestamp']
@@ -78,11 +78,12 @@ class TestPDApi(Base, tm.TestCase):
              'factorize', 'get_dummies', 'get_store',
              'infer_freq', 'isnull', 'lreshape',
              'match', 'melt', 'notnull', 'offsets',
-             'merge', 'merge_ordered', 'merge_asof',
-             'period_range',
+             'merge', 'merge_ordered', 'merge_asof', 'merge_intervals',
+             'merge_iter', 'period_range',
              'pivot', 'pivot_table', 'plot_params', 'qcut',
              'scatter_matrix',
-             'show_versions', 'timedelta_range', 'unique',
+             'show_versions', 'streaming_groupby', 'timedelta_range',
+             'unique',
              'value_counts', 'wide_to_long']
 
     # top-level option funcs
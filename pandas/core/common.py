@@ -606,3 +606,63 @@ def _random_state(state=None):
     else:
         raise ValueError("random_state must be an integer, a numpy "
                          "RandomState, or None")
+
+
+def _get_num_threads(num_threads=None):
+    """
+    Resolve the number of threads to use for an operation that can run
+    with the GIL released.
+
+    Parameters
+    ----------
+    num_threads : int, optional
+        If None, the ``compute.num_threads`` option is used.
+
+    Returns
+    -------
+    int, at least 1
+    """
+    if num_threads is None:
+        num_threads = get_option('compute.num_threads')
+
+    if not types.is_integer(num_threads):
+        raise TypeError("num_threads must be an integer, "
+                        "got {0!r}".format(num_threads))
+    return max(int(num_threads), 1)
+
+
+def _run_threaded(func, args_list):
+    """
+    Call ``func(*args)`` for each ``args`` in ``args_list``, each on its own
+    thread, and wait for all of them to finish.
+
+    This is only beneficial if ``func`` releases the GIL. The first
+    exception raised on a worker thread is re-raised on the calling thread.
+
+    Returns
+    -------
+    list of the results, in the order of ``args_list``
+    """
+    import threading
+
+    args_list = list(args_list)
+    results = [None] * len(args_list)
+    errors = []
+
+    def target(i, args):
+        try:
+            results[i] = func(*args)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=target, args=(i, args))
+               for i, args in enumerate(args_list)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return results
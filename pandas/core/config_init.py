@@ -384,6 +384,17 @@ with cf.config_prefix('mode'):
     cf.register_option('use_inf_as_null', False, use_inf_as_null_doc,
                        cb=use_inf_as_null_cb)
 
+compute_num_threads_doc = """
+: int
+    The number of threads used by operations that can release the GIL
+    (e.g. the cythonized groupby aggregations and merge). The default of 1
+    runs everything on the calling thread.
+"""
+
+with cf.config_prefix('compute'):
+    cf.register_option('num_threads', 1, compute_num_threads_doc,
+                       validator=is_int)
+
 # user warnings
 chained_assignment = """
 : string
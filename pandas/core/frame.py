@@ -166,6 +166,13 @@ indicator : boolean or string, default False
 
     .. versionadded:: 0.17.0
 
+num_threads : int, default None
+    Number of threads to factorize and join the keys on, each taking a
+    partition of them. The result is the same for any number of threads.
+    If None, uses the ``compute.num_threads`` option
+
+    .. versionadded:: 0.20.0
+
 Examples
 --------
 
@@ -198,6 +205,57 @@ merge_asof
 
 """
 
+_semi_join_doc = """
+The rows of this DataFrame %(which)s a matching row in other, on the
+keys a merge would join them on (a %(kind)s-join).
+
+Unlike filtering a merge, the result has the columns and index of this
+DataFrame, with each of its rows at most once, and the rows of other are
+never copied: the keys of other are hashed once, then those of each row
+looked up.
+
+.. versionadded:: 0.20.0
+
+Parameters
+----------
+other : DataFrame
+on : label or list
+    Field names to match on. Must be found in both DataFrames. If on is
+    None and not matching on indexes, then it matches on the intersection
+    of the columns by default.
+left_on : label or list, or array-like
+    Field names to match on in this DataFrame
+right_on : label or list, or array-like
+    Field names to match on in other
+left_index : boolean, default False
+    Use the index of this DataFrame as the key(s)
+right_index : boolean, default False
+    Use the index of other as the key(s)
+
+Returns
+-------
+%(kind)s_joined : DataFrame
+    Equivalent to ``df[%(op)smask]`` where ``mask`` is whether each row has
+    a match; missing keys match missing keys, as in ``merge``
+
+See also
+--------
+merge
+DataFrame.isin
+
+Examples
+--------
+>>> df = pd.DataFrame({'key': ['a', 'b', 'c'], 'value': [1, 2, 3]})
+>>> other = pd.DataFrame({'key': ['a', 'a', 'c'], 'flag': [0, 1, 1]})
+>>> df.semi_join(other, on='key')
+  key  value
+0   a      1
+2   c      3
+>>> df.anti_join(other, on='key')
+  key  value
+1   b      2
+"""
+
 # -----------------------------------------------------------------------
 # DataFrame class
 
@@ -4546,12 +4604,33 @@ class DataFrame(NDFrame):
     @Appender(_merge_doc, indents=2)
     def merge(self, right, how='inner', on=None, left_on=None, right_on=None,
               left_index=False, right_index=False, sort=False,
-              suffixes=('_x', '_y'), copy=True, indicator=False):
+              suffixes=('_x', '_y'), copy=True, indicator=False,
+              num_threads=None):
         from pandas.tools.merge import merge
         return merge(self, right, how=how, on=on, left_on=left_on,
                      right_on=right_on, left_index=left_index,
                      right_index=right_index, sort=sort, suffixes=suffixes,
-                     copy=copy, indicator=indicator)
+                     copy=copy, indicator=indicator, num_threads=num_threads)
+
+    @Substitution(kind='semi', which='with', op='')
+    @Appender(_semi_join_doc)
+    def semi_join(self, other, on=None, left_on=None, right_on=None,
+                  left_index=False, right_index=False):
+        from pandas.tools.merge import _SemiJoinOperation
+        op = _SemiJoinOperation(self, other, on=on, left_on=left_on,
+                                right_on=right_on, left_index=left_index,
+                                right_index=right_index)
+        return self[op.get_mask()]
+
+    @Substitution(kind='anti', which='without', op='~')
+    @Appender(_semi_join_doc)
+    def anti_join(self, other, on=None, left_on=None, right_on=None,
+                  left_index=False, right_index=False):
+        from pandas.tools.merge import _SemiJoinOperation
+        op = _SemiJoinOperation(self, other, on=on, left_on=left_on,
+                                right_on=right_on, left_index=left_index,
+                                right_index=right_index)
+        return self[~op.get_mask()]
 
     def round(self, decimals=0, *args, **kwargs):
         """
@@ -5565,12 +5565,12 @@ class NDFrame(PandasObject):
 
         @Appender(rwindow.rolling.__doc__)
         def rolling(self, window, min_periods=None, freq=None, center=False,
-                    win_type=None, on=None, axis=0):
+                    win_type=None, on=None, axis=0, closed=None):
             axis = self._get_axis_number(axis)
             return rwindow.rolling(self, window=window,
                                    min_periods=min_periods, freq=freq,
                                    center=center, win_type=win_type,
-                                   on=on, axis=axis)
+                                   on=on, axis=axis, closed=closed)
 
         cls.rolling = rolling
 
@@ -5585,11 +5585,12 @@ class NDFrame(PandasObject):
         @Appender(rwindow.ewm.__doc__)
         def ewm(self, com=None, span=None, halflife=None, alpha=None,
                 min_periods=0, freq=None, adjust=True, ignore_na=False,
-                axis=0):
+                axis=0, times=None):
             axis = self._get_axis_number(axis)
             return rwindow.ewm(self, com=com, span=span, halflife=halflife,
                                alpha=alpha, min_periods=min_periods, freq=freq,
-                               adjust=adjust, ignore_na=ignore_na, axis=axis)
+                               adjust=adjust, ignore_na=ignore_na, axis=axis,
+                               times=times)
 
         cls.ewm = ewm
 
@@ -1,8 +1,9 @@
 import types
-from functools import wraps
+from functools import wraps, partial
 import numpy as np
 import datetime
 import collections
+import itertools
 import warnings
 import copy
 
@@ -20,6 +21,7 @@ from pandas.types.common import (_DATELIKE_DTYPES,
                                  is_categorical_dtype,
                                  is_datetime_or_timedelta_dtype,
                                  is_bool, is_integer_dtype,
+                                 is_float_dtype,
                                  is_complex_dtype,
                                  is_bool_dtype,
                                  is_scalar,
@@ -97,7 +99,43 @@ _series_apply_whitelist = \
 _dataframe_apply_whitelist = \
     _common_apply_whitelist | frozenset(['dtypes', 'corrwith'])
 
-_cython_transforms = frozenset(['cumprod', 'cumsum', 'shift'])
+_cython_transforms = frozenset(['cumprod', 'cumsum', 'shift',
+                                'cummin', 'cummax'])
+
+# cython kernels that run without the GIL for numeric input and can therefore
+# be spread over several threads (see the ``compute.num_threads`` option)
+_cython_nogil_functions = frozenset(['add', 'prod', 'min', 'max', 'mean',
+                                     'var', 'first', 'last',
+                                     'cumprod', 'cumsum', 'cummin', 'cummax'])
+
+# aggregations of a numeric column computed together in a single pass by
+# group_fused, see SeriesGroupBy._aggregate_fused
+_fused_aggregations = frozenset(['count', 'sum', 'mean', 'var', 'std', 'sem',
+                                 'min', 'max', 'first', 'last'])
+
+
+def _merge_partial_sums(partials):
+    mask = isnull(partials)
+    out = np.where(mask, 0, partials).sum(axis=0)
+    out[mask.all(axis=0)] = np.nan
+    return out
+
+
+def _merge_partial_prods(partials):
+    mask = isnull(partials)
+    out = np.where(mask, 1, partials).prod(axis=0)
+    out[mask.all(axis=0)] = np.nan
+    return out
+
+
+# how to combine the per-partition results of a reduction, each partition
+# having NaN for the groups it did not observe
+_cython_partial_merge = {
+    'add': _merge_partial_sums,
+    'prod': _merge_partial_prods,
+    'min': lambda partials: np.fmin.reduce(partials, axis=0),
+    'max': lambda partials: np.fmax.reduce(partials, axis=0),
+}
 
 
 def _groupby_function(name, alias, npfunc, numeric_only=True,
@@ -231,6 +269,42 @@ class Grouper(object):
     def ax(self):
         return self.grouper
 
+    @classmethod
+    def prepare(cls, obj, key=None, level=None, axis=0, sort=True):
+        """
+        Compute the grouping of `obj` once, so that it can be reused by any
+        number of subsequent groupby operations.
+
+        .. versionadded:: 0.20.0
+
+        Parameters
+        ----------
+        obj : Series or DataFrame
+        key, level, axis, sort :
+            as for ``obj.groupby``
+
+        Returns
+        -------
+        grouper : an internal grouper object, to be passed as the ``by``
+            argument of ``groupby`` on `obj`, or on any object sharing the
+            same axis as `obj`
+
+        Examples
+        --------
+        >>> prepared = pd.Grouper.prepare(df, ['A', 'B'])
+        >>> df.groupby(prepared).sum()
+        >>> df.groupby(prepared).max()
+        >>> other_df.groupby(prepared).mean()  # aligned to df
+        """
+        grouper, _, _ = _get_grouper(obj, key, axis=axis, level=level,
+                                     sort=sort)
+
+        # compute the state shared by all of the aggregations
+        grouper.group_info
+        grouper.result_index
+        grouper._sort_idx
+        return grouper
+
     def _get_grouper(self, obj):
         """
         Parameters
@@ -655,23 +729,38 @@ class _GroupBy(PandasObject, SelectionMixin):
         Parameters
         ----------
         func : function
+        engine : {'python', 'processes'}, default 'python'
+            With 'processes', the groups are handed out to a pool of worker
+            processes, which pays off for expensive functions on many
+            groups. func and its arguments then have to be picklable, so
+            e.g. lambdas can't be used.
+
+            .. versionadded:: 0.20.0
 
         Notes
         -----
         See online documentation for full exposition on how to use apply.
 
-        In the current implementation apply calls func twice on the
-        first group to decide whether it can take a fast or slow code
-        path. This can lead to unexpected behavior if func has
-        side-effects, as they will take effect twice for the first
-        group.
-
+        func is called once on every group, the first group included, but
+        for a group on which it raises: that group is evaluated again on a
+        frame of its own before the error propagates.
 
         See also
         --------
         aggregate, transform"""
 
         func = self._is_builtin_func(func)
+        engine = kwargs.pop('engine', 'python')
+
+        if engine == 'processes':
+            if not callable(func):
+                raise ValueError("func must be a callable with "
+                                 "engine='processes'")
+
+            # a closure could not be sent to the workers
+            f = partial(func, *args, **kwargs) if args or kwargs else func
+            with option_context('mode.chained_assignment', None):
+                return self._python_apply_general(f, engine=engine)
 
         # this is needed so we don't try and wrap strings. If we could
         # resolve functions to their callable functions prior, this
@@ -691,11 +780,11 @@ class _GroupBy(PandasObject, SelectionMixin):
 
         # ignore SettingWithCopy here in case the user mutates
         with option_context('mode.chained_assignment', None):
-            return self._python_apply_general(f)
+            return self._python_apply_general(f, engine=engine)
 
-    def _python_apply_general(self, f):
+    def _python_apply_general(self, f, engine='python'):
         keys, values, mutated = self.grouper.apply(f, self._selected_obj,
-                                                   self.axis)
+                                                   self.axis, engine=engine)
 
         return self._wrap_applied_output(
             keys,
@@ -721,7 +810,7 @@ class _GroupBy(PandasObject, SelectionMixin):
         (though the default is sort=True) for groupby in general
         """
         ids, _, ngroups = self.grouper.group_info
-        sorter = _get_group_index_sorter(ids, ngroups)
+        sorter = self.grouper._sort_idx
         ids, count = ids[sorter], len(ids)
 
         if count == 0:
@@ -1317,6 +1406,16 @@ class GroupBy(_GroupBy):
             axis = self.grouper.axis
             grouper = axis[axis.isin(dropped.index)]
 
+        elif isinstance(self.keys, BaseGrouper):
+
+            # a prepared grouper is aligned with the original object, keep
+            # the group labels of the rows which are not dropped
+            labels, _, _ = self.grouper.group_info
+            axis = self.grouper.axis
+            grouper = labels[axis.isin(dropped.index)]
+            if self.exclusions:
+                dropped = dropped.drop(list(self.exclusions), axis=1)
+
         else:
 
             # create a grouper with the original parameters, but on the dropped
@@ -1334,6 +1433,11 @@ class GroupBy(_GroupBy):
         if len(result) and mask.any():
             result.loc[mask] = np.nan
 
+        if isinstance(self.keys, BaseGrouper):
+            # the groups are labelled by their position in the result index,
+            # the rows without a group by -1
+            result = result.reindex(np.arange(self.grouper.ngroups))
+
         # reset/reindex to the original groups
         if len(self.obj) == len(dropped) or \
            len(result) == len(self.grouper.result_index):
@@ -1415,6 +1519,243 @@ class GroupBy(_GroupBy):
 
         return self._cython_transform('cumsum')
 
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def cummin(self, axis=0, **kwargs):
+        """Cumulative min for each group"""
+        if axis != 0 or kwargs or not self._is_cythonizable():
+            return self._make_wrapper('cummin')(axis=axis, **kwargs)
+
+        return self._cython_transform('cummin')
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def cummax(self, axis=0, **kwargs):
+        """Cumulative max for each group"""
+        if axis != 0 or kwargs or not self._is_cythonizable():
+            return self._make_wrapper('cummax')(axis=axis, **kwargs)
+
+        return self._cython_transform('cummax')
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def any(self, skipna=True, **kwargs):
+        """
+        Return True if any value in the group is truthful, else False
+
+        Parameters
+        ----------
+        skipna : bool, default True
+            Flag to ignore nan values during truth testing
+        """
+        if kwargs or not self._is_cythonizable(bool_agg=True):
+            return self._make_wrapper('any')(skipna=skipna, **kwargs)
+
+        return self._bool_agg('any', skipna)
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def all(self, skipna=True, **kwargs):
+        """
+        Return True if all values in the group are truthful, else False
+
+        Parameters
+        ----------
+        skipna : bool, default True
+            Flag to ignore nan values during truth testing
+        """
+        if kwargs or not self._is_cythonizable(bool_agg=True):
+            return self._make_wrapper('all')(skipna=skipna, **kwargs)
+
+        return self._bool_agg('all', skipna)
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def rank(self, method='average', ascending=True, na_option='keep',
+             pct=False, axis=0, **kwargs):
+        """
+        Provides the rank of values within each group
+
+        Parameters
+        ----------
+        method : {'average', 'min', 'max', 'first', 'dense'}, default 'average'
+            * average: average rank of group
+            * min: lowest rank in group
+            * max: highest rank in group
+            * first: ranks assigned in order they appear in the array
+            * dense: like 'min', but rank always increases by 1 between groups
+        ascending : boolean, default True
+            False for ranks by high (1) to low (N)
+        na_option : {'keep', 'top', 'bottom'}, default 'keep'
+            * keep: leave NA values where they are
+            * top: smallest rank if ascending
+            * bottom: smallest rank if descending
+        pct : boolean, default False
+            Compute percentage rank of data within each group
+        """
+        if axis != 0 or kwargs or not self._is_cythonizable():
+            return self._make_wrapper('rank')(
+                method=method, ascending=ascending, na_option=na_option,
+                pct=pct, axis=axis, **kwargs)
+
+        labels, _, _ = self.grouper.group_info
+
+        output = collections.OrderedDict()
+        for name, obj in self._iterate_slices():
+            values = _ensure_float64(obj.values)
+            mask = isnull(values)
+
+            # sort each group by value, with the missing values at the end
+            # of the group unless they are to be ranked first; sorting on
+            # the mask keeps them apart from real infinities
+            if not ascending:
+                values = -values
+            values = np.where(mask, -np.inf if na_option == 'top' else np.inf,
+                              values)
+            na_key = ~mask if na_option == 'top' else mask
+            sorter = _ensure_int64(np.lexsort((values, na_key, labels)))
+
+            result = np.empty(len(values), dtype=np.float64)
+            _algos.group_rank_float64(result, values, labels, sorter,
+                                      mask.view(np.uint8), method,
+                                      na_option == 'keep', pct)
+            output[name] = result
+
+        return self._wrap_transformed_output(output)
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def quantile(self, q=0.5, interpolation='linear', **kwargs):
+        """
+        Return group values at the given quantile, a la numpy.percentile.
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5 (50%% quantile)
+            0 <= q <= 1, the quantile(s) to compute
+        interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
+            Method to use when the desired quantile falls between two points.
+        """
+        if kwargs or is_list_like(q) or not self._is_cythonizable():
+            return self._make_wrapper('quantile')(
+                q=q, interpolation=interpolation, **kwargs)
+
+        self._selected_obj._check_percentile(q)
+
+        labels, _, ngroups = self.grouper.group_info
+
+        output = {}
+        for name, obj in self._iterate_slices():
+            values = _ensure_float64(obj.values)
+
+            # np.lexsort places nan last within each group
+            sorter = _ensure_int64(np.lexsort((values, labels)))
+
+            result = np.empty(ngroups, dtype=np.float64)
+            result.fill(np.nan)
+            _algos.group_quantile_float64(result, values, labels, sorter,
+                                          q, interpolation)
+
+            # only interpolating methods produce values not in the data
+            if interpolation in ('lower', 'higher', 'nearest'):
+                result = self._try_cast(result, obj)
+            output[name] = result
+
+        result = self._wrap_aggregated_output(output)
+        if isinstance(result, DataFrame):
+            # as DataFrame.quantile labels its result with q
+            result.columns = result.columns.rename(q)
+        return result
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def idxmin(self, skipna=True, **kwargs):
+        """
+        Index of first occurrence of minimum of values within each group
+
+        Parameters
+        ----------
+        skipna : boolean, default True
+            Exclude NA/null values
+        """
+        if kwargs or not self._is_cythonizable():
+            return self._make_wrapper('idxmin')(skipna=skipna, **kwargs)
+
+        return self._idx_agg('idxmin', skipna)
+
+    @Substitution(name='groupby')
+    @Appender(_doc_template)
+    def idxmax(self, skipna=True, **kwargs):
+        """
+        Index of first occurrence of maximum of values within each group
+
+        Parameters
+        ----------
+        skipna : boolean, default True
+            Exclude NA/null values
+        """
+        if kwargs or not self._is_cythonizable():
+            return self._make_wrapper('idxmax')(skipna=skipna, **kwargs)
+
+        return self._idx_agg('idxmax', skipna)
+
+    def _is_cythonizable(self, bool_agg=False):
+        """
+        Whether the groupwise Cython kernels give the same result as calling
+        the method on every group: all of the columns to operate on must be
+        real numeric (any dtype at all for the truth tests of any/all, bar
+        categoricals)
+        """
+        if self.axis != 0:
+            return False
+
+        dtypes = [obj.dtype for _, obj in self._iterate_slices()]
+        if not dtypes:
+            return False
+
+        if bool_agg:
+            return not any(is_categorical_dtype(dtype) for dtype in dtypes)
+
+        return all(is_numeric_dtype(dtype) and not is_bool_dtype(dtype) and
+                   not is_complex_dtype(dtype) for dtype in dtypes)
+
+    def _bool_agg(self, val_test, skipna):
+        labels, _, ngroups = self.grouper.group_info
+
+        output = {}
+        for name, obj in self._iterate_slices():
+            values = obj.values
+            mask = isnull(values)
+
+            result = np.empty(ngroups, dtype=np.uint8)
+            _algos.group_any_all(result, labels,
+                                 values.astype(bool).view(np.uint8),
+                                 mask.view(np.uint8), val_test, skipna)
+            output[name] = result.view(np.bool_)
+
+        return self._wrap_aggregated_output(output)
+
+    def _idx_agg(self, how, skipna):
+        labels, _, ngroups = self.grouper.group_info
+
+        output = {}
+        for name, obj in self._iterate_slices():
+            values = obj.values
+            if values.dtype not in (np.float32, np.float64, np.int64):
+                if is_integer_dtype(values) and values.dtype != np.uint64:
+                    values = _ensure_int64(values)
+                else:
+                    values = _ensure_float64(values)
+
+            func = getattr(_algos, 'group_%s_%s' % (how, values.dtype.name))
+            result = np.empty(ngroups, dtype=np.int64)
+            func(result, values, labels, skipna)
+
+            # groups without a valid value get nan
+            output[name] = algos.take_nd(obj.index.values, result)
+
+        return self._wrap_aggregated_output(output)
+
     @Substitution(name='groupby')
     @Appender(_doc_template)
     def shift(self, periods=1, freq=None, axis=0):
@@ -1518,6 +1859,15 @@ def _get_axes(group):
         return group.axes
 
 
+def _apply_named_group(args):
+    # run in a worker process by BaseGrouper._apply_processes, the name of
+    # a group does not survive pickling
+    f, name, group = args
+    object.__setattr__(group, 'name', name)
+    with np.errstate(all='ignore'):
+        return f(group)
+
+
 def _is_indexed_like(obj, axes):
     if isinstance(obj, Series):
         if len(axes) > 1:
@@ -1571,7 +1921,8 @@ class BaseGrouper(object):
 
     def _get_splitter(self, data, axis=0):
         comp_ids, _, ngroups = self.group_info
-        return get_splitter(data, comp_ids, ngroups, axis=axis)
+        return get_splitter(data, comp_ids, ngroups, axis=axis,
+                            sort_idx=self._sort_idx)
 
     def _get_group_keys(self):
         if len(self.groupings) == 1:
@@ -1582,28 +1933,36 @@ class BaseGrouper(object):
             mapper = _KeyMapper(comp_ids, ngroups, self.labels, self.levels)
             return [mapper.get_key(i) for i in range(ngroups)]
 
-    def apply(self, f, data, axis=0):
+    def apply(self, f, data, axis=0, engine='python'):
         mutated = self.mutated
         splitter = self._get_splitter(data, axis=axis)
         group_keys = self._get_group_keys()
 
+        if engine == 'processes':
+            return self._apply_processes(f, splitter, group_keys)
+        elif engine != 'python':
+            raise ValueError("engine must be either 'python' or "
+                             "'processes', got {0!r}".format(engine))
+
         # oh boy
+        result_values = []
         f_name = com._get_callable_name(f)
         if (f_name not in _plotting_methods and
                 hasattr(splitter, 'fast_apply') and axis == 0):
             try:
-                values, mutated = splitter.fast_apply(f, group_keys)
-                return group_keys, values, mutated
+                result_values, mutated = splitter.fast_apply(f, group_keys)
             except (lib.InvalidApply):
                 # we detect a mutation of some kind
                 # so take slow path
                 pass
-            except Exception:
-                # raise this error to the caller
-                pass
 
-        result_values = []
-        for key, (i, group) in zip(group_keys, splitter):
+            if len(result_values) == len(group_keys):
+                return group_keys, result_values, mutated
+
+        # the groups the fast path left over, each evaluated only once
+        done = len(result_values)
+        for key, (i, group) in zip(group_keys[done:],
+                                   itertools.islice(splitter, done, None)):
             object.__setattr__(group, 'name', key)
 
             # group might be modified
@@ -1615,6 +1974,30 @@ class BaseGrouper(object):
 
         return group_keys, result_values, mutated
 
+    def _apply_processes(self, f, splitter, group_keys):
+        """
+        Apply f to the groups on a pool of worker processes, one task per
+        group; f has to be picklable
+        """
+        import multiprocessing
+
+        groups = [(f, key, group)
+                  for key, (i, group) in zip(group_keys, splitter)]
+
+        pool = multiprocessing.Pool()
+        try:
+            result_values = pool.map(_apply_named_group, groups)
+        finally:
+            pool.close()
+            pool.join()
+
+        mutated = self.mutated
+        for (_, _, group), res in zip(groups, result_values):
+            if not _is_indexed_like(res, _get_axes(group)):
+                mutated = True
+
+        return group_keys, result_values, mutated
+
     @cache_readonly
     def indices(self):
         """ dict {group name -> group indices} """
@@ -1675,6 +2058,12 @@ class BaseGrouper(object):
         # return if my group orderings are monotonic
         return Index(self.group_info[0]).is_monotonic
 
+    @cache_readonly
+    def _sort_idx(self):
+        # stable indexer sorting the data by group
+        comp_ids, _, ngroups = self.group_info
+        return _get_group_index_sorter(comp_ids, ngroups)
+
     @cache_readonly
     def group_info(self):
         comp_ids, obs_group_ids = self._get_compressed_labels()
@@ -1686,6 +2075,13 @@ class BaseGrouper(object):
     def _get_compressed_labels(self):
         all_labels = [ping.labels for ping in self.groupings]
         if len(all_labels) > 1:
+            if not self.sort:
+                # no need for the lexically ordered cartesian product ids;
+                # hash the observed label combinations directly
+                result = _hash_group_index(all_labels, self.shape)
+                if result is not None:
+                    return result
+
             group_index = get_group_index(all_labels, self.shape,
                                           sort=True, xnull=True)
             return _compress_group_index(group_index, sort=self.sort)
@@ -1752,6 +2148,8 @@ class BaseGrouper(object):
         'transform': {
             'cumprod': 'group_cumprod',
             'cumsum': 'group_cumsum',
+            'cummin': 'group_cummin',
+            'cummax': 'group_cummax',
         }
     }
 
@@ -1860,7 +2258,7 @@ class BaseGrouper(object):
                                  fill_value=np.nan)
             counts = np.zeros(self.ngroups, dtype=np.int64)
             result = self._aggregate(
-                result, counts, values, labels, func, is_numeric)
+                result, counts, values, labels, func, is_numeric, how)
         elif kind == 'transform':
             result = _maybe_fill(np.empty_like(values, dtype=out_dtype),
                                  fill_value=np.nan)
@@ -1868,7 +2266,7 @@ class BaseGrouper(object):
             # temporary storange for running-total type tranforms
             accum = np.empty(out_shape, dtype=out_dtype)
             result = self._transform(
-                result, accum, values, labels, func, is_numeric)
+                result, accum, values, labels, func, is_numeric, how)
 
         if is_integer_dtype(result):
             if len(result[result == tslib.iNaT]) > 0:
@@ -1909,7 +2307,7 @@ class BaseGrouper(object):
         return self._cython_operation('transform', values, how, axis)
 
     def _aggregate(self, result, counts, values, comp_ids, agg_func,
-                   is_numeric):
+                   is_numeric, how=None):
         if values.ndim > 3:
             # punting for now
             raise NotImplementedError("number of dimensions is currently "
@@ -1920,12 +2318,57 @@ class BaseGrouper(object):
                 chunk = chunk.squeeze()
                 agg_func(result[:, :, i], counts, chunk, comp_ids)
         else:
-            agg_func(result, counts, values, comp_ids)
+            num_threads = com._get_num_threads()
+            if (num_threads > 1 and is_numeric and
+                    how in _cython_nogil_functions):
+                self._aggregate_threaded(result, counts, values, comp_ids,
+                                         agg_func, how, num_threads)
+            else:
+                agg_func(result, counts, values, comp_ids)
 
         return result
 
+    def _aggregate_threaded(self, result, counts, values, comp_ids, agg_func,
+                            how, num_threads):
+        """
+        Run a GIL-releasing aggregation kernel on ``num_threads`` threads.
+
+        A 2-d block is split into column ranges, each of which is aggregated
+        directly into its own slice of ``result``. A single column is split
+        into row partitions with a partial result per partition; the partial
+        results are then merged, which is only possible for the reductions
+        in ``_cython_partial_merge``.
+        """
+        N, K = values.shape
+
+        if K > 1:
+            edges = np.linspace(0, K, min(num_threads, K) + 1).astype(int)
+            args = [(result[:, start:end], np.zeros_like(counts),
+                     values[:, start:end], comp_ids)
+                    for start, end in zip(edges[:-1], edges[1:])]
+            com._run_threaded(agg_func, args)
+
+            # every column range observes the same group sizes
+            counts[:] = args[0][1]
+
+        elif (how in _cython_partial_merge and values.dtype.kind == 'f' and
+              N >= num_threads):
+            edges = np.linspace(0, N, num_threads + 1).astype(int)
+            args = [(_maybe_fill(np.empty_like(result), fill_value=np.nan),
+                     np.zeros_like(counts),
+                     values[start:end], comp_ids[start:end])
+                    for start, end in zip(edges[:-1], edges[1:])]
+            com._run_threaded(agg_func, args)
+
+            partials = np.array([arg[0] for arg in args])
+            result[:] = _cython_partial_merge[how](partials)
+            counts[:] = sum(arg[1] for arg in args)
+
+        else:
+            agg_func(result, counts, values, comp_ids)
+
     def _transform(self, result, accum, values, comp_ids, transform_func,
-                   is_numeric):
+                   is_numeric, how=None):
         comp_ids, _, ngroups = self.group_info
         if values.ndim > 3:
             # punting for now
@@ -1938,7 +2381,20 @@ class BaseGrouper(object):
                 transform_func(result[:, :, i], values,
                                comp_ids, accum)
         else:
-            transform_func(result, values, comp_ids, accum)
+            num_threads = min(com._get_num_threads(), values.shape[1])
+            if (num_threads > 1 and is_numeric and
+                    how in _cython_nogil_functions):
+
+                # running totals are per column, so transform column
+                # ranges independently
+                edges = np.linspace(0, values.shape[1],
+                                    num_threads + 1).astype(int)
+                args = [(result[:, start:end], values[:, start:end],
+                         comp_ids, accum[:, start:end])
+                        for start, end in zip(edges[:-1], edges[1:])]
+                com._run_threaded(transform_func, args)
+            else:
+                transform_func(result, values, comp_ids, accum)
 
         return result
 
@@ -1958,7 +2414,7 @@ class BaseGrouper(object):
 
         # avoids object / Series creation overhead
         dummy = obj._get_values(slice(None, 0)).to_dense()
-        indexer = _get_group_index_sorter(group_index, ngroups)
+        indexer = self._sort_idx
         obj = obj.take(indexer, convert=False)
         group_index = algos.take_nd(group_index, indexer, allow_fill=False)
         grouper = lib.SeriesGrouper(obj, func, group_index, ngroups,
@@ -2397,7 +2853,18 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True,
 
     # already have a BaseGrouper, just return it
     elif isinstance(key, BaseGrouper):
-        return key, [], obj
+        key_axis = getattr(key, 'axis', None)
+        if key_axis is not None and not key_axis.equals(group_axis):
+            raise ValueError('grouper is not aligned with the %s of the '
+                             'object to group' % obj._get_axis_name(axis))
+
+        # when reusing a grouper which was created from columns, those
+        # columns are keys and not values
+        exclusions = []
+        if isinstance(obj, DataFrame):
+            exclusions = [ping.name for ping in key.groupings
+                          if ping.in_axis and ping.name in obj]
+        return key, exclusions, obj
 
     if not isinstance(key, (tuple, list)):
         keys = [key]
@@ -2620,6 +3087,10 @@ class SeriesGroupBy(GroupBy):
             List/dict of functions will produce DataFrame with column names
             determined by the function names themselves (list) or the keys in
             the dict
+        num_threads : int, optional
+            Number of threads to use for the cythonized aggregations, which
+            run without the GIL. Defaults to the ``compute.num_threads``
+            option.
 
         Notes
         -----
@@ -2660,6 +3131,12 @@ class SeriesGroupBy(GroupBy):
         Series or DataFrame
         """
         _level = kwargs.pop('_level', None)
+        num_threads = kwargs.pop('num_threads', None)
+        if num_threads is not None:
+            with option_context('compute.num_threads', num_threads):
+                return self.aggregate(func_or_funcs, _level=_level,
+                                      *args, **kwargs)
+
         if isinstance(func_or_funcs, compat.string_types):
             return getattr(self, func_or_funcs)(*args, **kwargs)
 
@@ -2715,11 +3192,15 @@ class SeriesGroupBy(GroupBy):
             arg = lzip(columns, arg)
 
         results = {}
+        fused = self._aggregate_fused(arg)
         for name, func in arg:
             obj = self
             if name in results:
                 raise SpecificationError('Function names must be unique, '
                                          'found multiple named %s' % name)
+            if name in fused:
+                results[name] = fused[name]
+                continue
 
             # reset the cache so that we
             # only include the named selection
@@ -2738,6 +3219,72 @@ class SeriesGroupBy(GroupBy):
             return list(compat.itervalues(results))[0]
         return DataFrame(results, columns=columns)
 
+    def _aggregate_fused(self, arg):
+        """
+        Compute the aggregations among the (name, func) pairs of arg that
+        group_fused covers in a single pass over the values, rather than a
+        pass for each of them
+
+        Returns
+        -------
+        dict of name -> aggregated Series, empty when fewer than two of
+        the aggregations can be fused
+        """
+        hows = {}
+        for name, func in arg:
+            how = self._is_cython_func(func) if callable(func) else func
+            if isinstance(how, compat.string_types) and \
+                    how in _fused_aggregations:
+                hows[name] = how
+
+        obj = self._selected_obj
+        if (len(hows) < 2 or isinstance(self.grouper, BinGrouper) or
+                not (is_float_dtype(obj) or is_integer_dtype(obj))):
+            return {}
+
+        if is_integer_dtype(obj):
+            values = obj.values.astype('int64', copy=False)
+            func = _algos.group_fused_int64
+        else:
+            values = _ensure_float64(obj.values)
+            func = _algos.group_fused_float64
+
+        labels, _, ngroups = self.grouper.group_info
+        out = np.empty((ngroups, 4), dtype=np.float64)
+        extrema = np.empty((ngroups, 4), dtype=values.dtype)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        func(out, extrema, counts, values, labels)
+
+        # the single aggregations drop the empty groups
+        if self.grouper._filter_empty_groups and not counts.all():
+            return {}
+
+        def cast(result):
+            if is_integer_dtype(result) and (result == tslib.iNaT).any():
+                result = result.astype('float64')
+                result[result == tslib.iNaT] = np.nan
+            return self._try_cast(result, obj)
+
+        count = out[:, 0].astype(np.int64)
+        var = cast(out[:, 3])
+        with np.errstate(all='ignore'):
+            sem = np.sqrt(var) / np.sqrt(count)
+        aggregated = {'count': count,
+                      'sum': cast(out[:, 1]),
+                      'mean': cast(out[:, 2]),
+                      'var': var,
+                      'std': np.sqrt(var),
+                      'sem': sem,
+                      'min': cast(extrema[:, 0]),
+                      'max': cast(extrema[:, 1]),
+                      'first': cast(extrema[:, 2]),
+                      'last': cast(extrema[:, 3])}
+
+        index = self.grouper.result_index
+        return dict((name, Series(aggregated[how], index=index,
+                                  name=self.name))
+                    for name, how in compat.iteritems(hows))
+
     def _wrap_output(self, output, index, names=None):
         """ common agg/transform wrapping logic """
         output = output[self.name]
@@ -3202,6 +3749,11 @@ class NDFrameGroupBy(GroupBy):
     def aggregate(self, arg, *args, **kwargs):
 
         _level = kwargs.pop('_level', None)
+        num_threads = kwargs.pop('num_threads', None)
+        if num_threads is not None:
+            with option_context('compute.num_threads', num_threads):
+                return self.aggregate(arg, _level=_level, *args, **kwargs)
+
         result, how = self._aggregate(arg, _level=_level, *args, **kwargs)
         if how is None:
             return result
@@ -3540,20 +4092,29 @@ class NDFrameGroupBy(GroupBy):
 
         Parameters
         ----------
-        f : function
-            Function to apply to each subframe
+        f : function, string or dict
+            Function to apply to each subframe, the name of a groupby method
+            or a dict of column -> function or name
 
         Notes
         -----
         Each subframe is endowed the attribute 'name' in case you need to know
         which group you are working on.
 
+        The name of a reduction, such as 'sum', 'mean', 'std' or 'count',
+        computes the reduction once for all of the groups and broadcasts it
+        to the rows of each group.
+
         Examples
         --------
         >>> grouped = df.groupby(lambda x: mapping[x])
         >>> grouped.transform(lambda x: (x - x.mean()) / x.std())
+        >>> grouped.transform({'A': 'mean', 'B': 'count'})
         """
 
+        if isinstance(func, dict):
+            return self._transform_dict(func, *args, **kwargs)
+
         # optimized transforms
         func = self._is_cython_func(func) or func
         if isinstance(func, compat.string_types):
@@ -3567,16 +4128,48 @@ class NDFrameGroupBy(GroupBy):
             return self._transform_general(func, *args, **kwargs)
 
         # a reduction transform
+        if (isinstance(result, Series) and
+                result.index.equals(self.grouper.result_index)):
+
+            # a single value per group, such as size
+            ids, _, ngroup = self.grouper.group_info
+            return Series(algos.take_1d(result.values, ids),
+                          index=self._obj_with_exclusions.index)
+
         if not isinstance(result, DataFrame):
             return self._transform_general(func, *args, **kwargs)
 
         obj = self._obj_with_exclusions
-        # nuiscance columns
         if not result.columns.equals(obj.columns):
-            return self._transform_general(func, *args, **kwargs)
+
+            # nuisance columns are dropped from the result, and the
+            # keys are among its columns with as_index=False
+            if not (self.axis == 0 and result.columns.is_unique and
+                    obj.columns.is_unique):
+                return self._transform_general(func, *args, **kwargs)
+            columns = obj.columns[obj.columns.isin(result.columns)]
+            if not len(columns):
+                return self._transform_general(func, *args, **kwargs)
+            result, obj = result[columns], obj[columns]
 
         return self._transform_fast(result, obj)
 
+    def _transform_dict(self, func, *args, **kwargs):
+        """
+        transform each of the columns in func with its own function,
+        the columns in the order of the object
+        """
+        obj = self._obj_with_exclusions
+        for col in func:
+            if col not in obj.columns:
+                raise KeyError("Column not found: {0}".format(col))
+
+        columns = obj.columns[obj.columns.isin(list(func))]
+        output = [self[col].transform(func[col], *args, **kwargs).values
+                  for col in columns]
+        return DataFrame._from_arrays(output, columns=columns,
+                                      index=obj.index)
+
     def _transform_fast(self, result, obj):
         """
         Fast transform path for aggregations
@@ -3881,6 +4474,26 @@ class DataFrameGroupBy(NDFrameGroupBy):
              in self._iterate_column_groupbys()),
             keys=self._selected_obj.columns, axis=1)
 
+    def nunique(self, dropna=True):
+        """
+        Return DataFrame with number of distinct observations per group for
+        each column.
+
+        .. versionadded:: 0.20.0
+
+        Parameters
+        ----------
+        dropna : boolean, default True
+            Don't include NaN in the counts.
+
+        Returns
+        -------
+        nunique: DataFrame
+        """
+        self._set_group_selection()
+        return self._apply_to_column_groupbys(
+            lambda sgb: sgb.nunique(dropna=dropna))
+
     def count(self):
         """ Compute count of group, excluding missing values """
         from functools import partial
@@ -4004,13 +4617,16 @@ class NDArrayGroupBy(GroupBy):
 
 class DataSplitter(object):
 
-    def __init__(self, data, labels, ngroups, axis=0):
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
         self.data = data
         self.labels = _ensure_int64(labels)
         self.ngroups = ngroups
 
         self.axis = axis
 
+        # possibly precomputed by the grouper
+        self._sort_idx = sort_idx
+
     @cache_readonly
     def slabels(self):
         # Sorted labels
@@ -4019,10 +4635,17 @@ class DataSplitter(object):
     @cache_readonly
     def sort_idx(self):
         # Counting sort indexer
+        if self._sort_idx is not None:
+            return self._sort_idx
         return _get_group_index_sorter(self.labels, self.ngroups)
 
+    @cache_readonly
+    def sorted_data(self):
+        # the data sorted by group, shared by fast_apply and iteration
+        return self._get_sorted_data()
+
     def __iter__(self):
-        sdata = self._get_sorted_data()
+        sdata = self.sorted_data
 
         if self.ngroups == 0:
             raise StopIteration
@@ -4060,8 +4683,9 @@ class SeriesSplitter(DataSplitter):
 
 class FrameSplitter(DataSplitter):
 
-    def __init__(self, data, labels, ngroups, axis=0):
-        super(FrameSplitter, self).__init__(data, labels, ngroups, axis=axis)
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
+        super(FrameSplitter, self).__init__(data, labels, ngroups, axis=axis,
+                                            sort_idx=sort_idx)
 
     def fast_apply(self, f, names):
         # must return keys::list, values::list, mutated::bool
@@ -4071,7 +4695,7 @@ class FrameSplitter(DataSplitter):
             # fails when all -1
             return [], True
 
-        sdata = self._get_sorted_data()
+        sdata = self.sorted_data
         results, mutated = lib.apply_frame_axis0(sdata, f, names, starts, ends)
 
         return results, mutated
@@ -4085,8 +4709,9 @@ class FrameSplitter(DataSplitter):
 
 class NDFrameSplitter(DataSplitter):
 
-    def __init__(self, data, labels, ngroups, axis=0):
-        super(NDFrameSplitter, self).__init__(data, labels, ngroups, axis=axis)
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
+        super(NDFrameSplitter, self).__init__(data, labels, ngroups,
+                                              axis=axis, sort_idx=sort_idx)
 
         self.factory = data._constructor
 
@@ -4436,6 +5061,32 @@ def _compress_group_index(group_index, sort=True):
     return comp_ids, obs_group_ids
 
 
+def _hash_group_index(labels, shape):
+    """
+    Unsorted equivalent of ``_compress_group_index(get_group_index(...))``
+    which hashes the observed combinations of labels in a single pass, so
+    that neither its time nor its memory depend on the product of the
+    number of levels in `shape`.
+
+    Groups are numbered in order of first appearance; obs_group_ids are
+    only computed for the observed groups.
+
+    Returns
+    -------
+    (comp_ids, obs_group_ids), or None if the hashed factorization
+    hit a collision and an exact method has to be used instead.
+    """
+    labels = np.vstack([_ensure_int64(lab) for lab in labels])
+    result = _hash.group_labels_hashed(labels)
+    if result is None:
+        return None
+
+    comp_ids, first = result
+    obs_labels = list(labels.take(first, axis=1))
+    obs_group_ids = get_group_index(obs_labels, shape, sort=True, xnull=True)
+    return comp_ids, obs_group_ids
+
+
 def _reorder_by_uniques(uniques, labels):
     # sorter is index where elements ought to go
     sorter = uniques.argsort()
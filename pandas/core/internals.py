@@ -4817,6 +4817,17 @@ def concatenate_block_managers(mgrs_indexers, axes, concat_axis, copy):
     copy : bool
 
     """
+    if _is_uniform_block_layout(mgrs_indexers, concat_axis):
+        # no join planning needed, a single concatenation per block
+        blocks = []
+        for i, blk in enumerate(mgrs_indexers[0][0].blocks):
+            values = np.concatenate([mgr.blocks[i].values
+                                     for mgr, _ in mgrs_indexers],
+                                    axis=concat_axis)
+            blocks.append(blk.make_block_same_class(values,
+                                                    placement=blk.mgr_locs))
+        return BlockManager(blocks, axes)
+
     concat_plan = combine_concat_plans(
         [get_mgr_concatenation_plan(mgr, indexers)
          for mgr, indexers in mgrs_indexers], concat_axis)
@@ -4828,6 +4839,48 @@ def concatenate_block_managers(mgrs_indexers, axes, concat_axis, copy):
     return BlockManager(blocks, axes)
 
 
+def _is_uniform_block_layout(mgrs_indexers, concat_axis):
+    """
+    Check whether the managers can be concatenated block by block: none
+    needs reindexing and all have the same blocks at the same locations, of
+    the same dtype and of a dtype that concatenating never upcasts or
+    refills.
+    """
+    if concat_axis == 0 or len(mgrs_indexers) < 2:
+        return False
+
+    first = mgrs_indexers[0][0]
+    for blk in first.blocks:
+        if not blk._can_consolidate or blk.is_complex:
+            return False
+        if blk.is_float and blk.dtype != np.float64:
+            # null float32 units are upcast to float64 by the join plan
+            return False
+
+    for mgr, indexers in mgrs_indexers:
+        if indexers or not isinstance(mgr, BlockManager):
+            return False
+        for blk in mgr.blocks:
+            if blk.is_object and JoinUnit(blk, blk.shape).is_null:
+                # the join plan refills null object units with a single NA
+                return False
+        if mgr is first:
+            continue
+        if len(mgr.blocks) != len(first.blocks):
+            return False
+        for blk, ref in zip(mgr.blocks, first.blocks):
+            if type(blk) is not type(ref) or blk.dtype != ref.dtype:
+                return False
+            locs, ref_locs = blk.mgr_locs.indexer, ref.mgr_locs.indexer
+            if isinstance(locs, slice) and isinstance(ref_locs, slice):
+                if locs != ref_locs:
+                    return False
+            elif not np.array_equal(blk.mgr_locs.as_array,
+                                    ref.mgr_locs.as_array):
+                return False
+    return True
+
+
 def get_empty_dtype_and_na(join_units):
     """
     Return dtype and N/A values to use when concatenating specified units.
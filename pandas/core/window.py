@@ -9,6 +9,7 @@ from __future__ import division
 
 import warnings
 import numpy as np
+from datetime import timedelta
 from collections import defaultdict
 
 from pandas.types.generic import (ABCSeries,
@@ -30,6 +31,7 @@ from pandas.core.base import (PandasObject, SelectionMixin,
                               GroupByMixin)
 import pandas.core.common as com
 import pandas._window as _window
+import pandas.algos as _algos
 from pandas.tseries.offsets import DateOffset
 from pandas import compat
 from pandas.compat.numpy import function as nv
@@ -54,11 +56,21 @@ pandas.DataFrame.%(name)s
 
 class _Window(PandasObject, SelectionMixin):
     _attributes = ['window', 'min_periods', 'freq', 'center', 'win_type',
-                   'axis', 'on']
+                   'axis', 'on', 'closed']
     exclusions = set()
 
+    # offset at which each group ends when the data is sorted by group and
+    # the windows must not reach across groups, see _GroupByMixin
+    _groups = None
+
+    # number of leading rows of the data that were kept from before an
+    # update and are left out of the results, see Rolling.update
+    _skip = 0
+    _update_attributes = ['_skip']
+
     def __init__(self, obj, window=None, min_periods=None, freq=None,
-                 center=False, win_type=None, axis=0, on=None, **kwargs):
+                 center=False, win_type=None, axis=0, on=None, closed=None,
+                 **kwargs):
 
         if freq is not None:
             warnings.warn("The freq kw is deprecated and will be removed in a "
@@ -69,6 +81,7 @@ class _Window(PandasObject, SelectionMixin):
         self.blocks = []
         self.obj = obj
         self.on = on
+        self.closed = closed
         self.window = window
         self.min_periods = min_periods
         self.freq = freq
@@ -99,6 +112,10 @@ class _Window(PandasObject, SelectionMixin):
         if self.min_periods is not None and not \
            is_integer(self.min_periods):
             raise ValueError("min_periods must be an integer")
+        if self.closed is not None and self.closed not in \
+           ['right', 'both', 'left', 'neither']:
+            raise ValueError("closed must be 'right', 'left', 'both' or "
+                             "'neither'")
 
     def _convert_freq(self, how=None):
         """ resample according to the how, return a new object """
@@ -150,7 +167,9 @@ class _Window(PandasObject, SelectionMixin):
         # create a new object to prevent aliasing
         if subset is None:
             subset = self.obj
-        self = self._shallow_copy(subset)
+        parent, self = self, self._shallow_copy(subset)
+        for attr in parent._update_attributes:
+            setattr(self, attr, getattr(parent, attr))
         self._reset_cache()
         if subset.ndim == 2:
             if isscalar(key) and key in subset or is_list_like(key):
@@ -200,6 +219,19 @@ class _Window(PandasObject, SelectionMixin):
             return index, index.asi8
         return index, index
 
+    def _get_bounds(self, indexi):
+        """
+        Return the start and end offsets of each window of an offset based
+        window, computed in a single sweep of the index, or None for a
+        fixed window
+        """
+        if not self.is_freq_type:
+            return None
+        return _window.variable_window_bounds(indexi, self.window,
+                                              closed=self.closed,
+                                              center=self.center,
+                                              groups=self._groups)
+
     def _prep_values(self, values=None, kill_inf=True, how=None):
 
         if values is None:
@@ -271,7 +303,7 @@ class _Window(PandasObject, SelectionMixin):
 
             result = self._wrap_result(result, block=block, obj=obj)
             if result.ndim == 1:
-                return result
+                return self._skip_kept(result)
             final.append(result)
 
         # if we have an 'on' column
@@ -296,9 +328,15 @@ class _Window(PandasObject, SelectionMixin):
                     columns = columns.take(sorted(indexer))
 
         if not len(final):
-            return obj.astype('float64')
-        return pd.concat(final, axis=1).reindex(columns=columns,
-                                                copy=False)
+            return self._skip_kept(obj.astype('float64'))
+        return self._skip_kept(pd.concat(final, axis=1).reindex(
+            columns=columns, copy=False))
+
+    def _skip_kept(self, result):
+        """ leave out the rows kept from before an update """
+        if self._skip:
+            result = result.iloc[self._skip:]
+        return result
 
     def _center_window(self, result, window):
         """ center the result in the window """
@@ -376,6 +414,12 @@ class Window(_Window):
         .. versionadded:: 0.19.0
 
     axis : int or string, default 0
+    closed : string, default None
+        Make the interval closed on the 'right', 'left', 'both' or
+        'neither' endpoints. Only implemented for windows specified by an
+        offset, for which it defaults to 'right'.
+
+        .. versionadded:: 0.20.0
 
     Returns
     -------
@@ -489,6 +533,10 @@ class Window(_Window):
     def validate(self):
         super(Window, self).validate()
 
+        if self.closed is not None:
+            raise ValueError("closed only implemented for datetimelike and "
+                             "offset based windows")
+
         window = self.window
         if isinstance(window, (list, tuple, np.ndarray)):
             pass
@@ -636,17 +684,91 @@ class _GroupByMixin(GroupByMixin):
         self._groupby.grouper.mutated = True
         super(GroupByMixin, self).__init__(obj, *args, **kwargs)
 
-    count = GroupByMixin._dispatch('count')
     corr = GroupByMixin._dispatch('corr', other=None, pairwise=None)
     cov = GroupByMixin._dispatch('cov', other=None, pairwise=None)
 
+    def count(self, **kwargs):
+        return self._apply(None, 'count', **kwargs)
+
+    def _apply_quantiles(self, quantiles, **kwargs):
+        return self._apply(None, 'quantile', quantile=quantiles, **kwargs)
+
+    def update(self, other):
+        raise NotImplementedError("update is not implemented for a groupby")
+
+    def _get_grouped_window(self):
+        """
+        Sort the data by group for a single pass of the window kernels
+
+        Returns
+        -------
+        tuple of (window object over the sorted data, indexer sorting the
+        data) or None when the result needs a per-group apply
+        """
+        from pandas.core.groupby import BinGrouper
+        from pandas.core.index import MultiIndex
+
+        groupby = self._groupby
+        grouper = groupby.grouper
+        obj = groupby._selected_obj
+
+        if (isinstance(grouper, BinGrouper) or not groupby.group_keys or
+                not groupby.as_index or
+                (self.center and not self.is_freq_type) or
+                self.freq is not None or self.axis != 0 or
+                isinstance(obj.index, MultiIndex)):
+            return None
+
+        comp_ids, _, ngroups = grouper.group_info
+        indexer, counts = _algos.groupsort_indexer(comp_ids, ngroups)
+
+        # rows with a missing group key are sorted first and excluded
+        indexer = indexer[counts[0]:]
+        if not len(indexer):
+            return None
+
+        window = self._shallow_copy(obj.take(indexer))
+        window._groups = counts[1:].cumsum()
+        return window, indexer
+
+    def _wrap_grouped_result(self, result, indexer):
+        """
+        index the result over the sorted data by the group keys and the
+        original index, as the concatenation of the per-group results
+        """
+        from pandas.core.index import MultiIndex
+
+        grouper = self._groupby.grouper
+        index = result.index
+        index_labels, index_level = index.factorize()
+
+        levels = grouper.levels + [index_level]
+        labels = ([ping.labels.take(indexer) for ping in grouper.groupings] +
+                  [index_labels])
+        names = grouper.names + [index.name]
+
+        result.index = MultiIndex(levels=levels, labels=labels, names=names,
+                                  verify_integrity=False)
+        return result
+
     def _apply(self, func, name, window=None, center=None,
                check_minp=None, how=None, **kwargs):
         """
-        dispatch to apply; we are stripping all of the _apply kwargs and
-        performing the original function call on the grouped object
+        compute the windows of all of the groups in one pass over the data
+        sorted by group; otherwise dispatch to apply, stripping all of the
+        _apply kwargs and performing the original function call on the
+        grouped object
         """
 
+        grouped = self._get_grouped_window()
+        if grouped is not None:
+            x, indexer = grouped
+            if isinstance(name, compat.string_types):
+                result = getattr(x, name)(**kwargs)
+            else:
+                result = x.apply(name, **kwargs)
+            return self._wrap_grouped_result(result, indexer)
+
         def f(x, name=name, *args):
             x = self._shallow_copy(x)
 
@@ -694,6 +816,12 @@ class _Rolling(_Window):
 
         blocks, obj, index = self._create_blocks(how=how)
         index, indexi = self._get_index(index=index)
+
+        # the bounds of offset based windows are centered already
+        bounds = self._get_bounds(indexi)
+        if bounds is not None:
+            center = False
+
         results = []
         for b in blocks:
             try:
@@ -713,12 +841,20 @@ class _Rolling(_Window):
                     raise ValueError("we do not support this function "
                                      "in _window.{0}".format(func))
 
+                # roll all of the columns of a block in a single pass
+                cfunc_2d = getattr(_window, func + '_2d', None)
+                if values.ndim > 1 and cfunc_2d is not None:
+                    results.append(self._apply_2d(cfunc_2d, values, window,
+                                                  center, check_minp, indexi,
+                                                  bounds=bounds, **kwargs))
+                    continue
+
                 def func(arg, window, min_periods=None):
                     minp = check_minp(min_periods, window)
                     # ensure we are only rolling on floats
                     arg = _ensure_float64(arg)
-                    return cfunc(arg,
-                                 window, minp, indexi, **kwargs)
+                    return cfunc(arg, window, minp, indexi,
+                                 groups=self._groups, bounds=bounds, **kwargs)
 
             # calculation function
             if center:
@@ -746,6 +882,31 @@ class _Rolling(_Window):
 
         return self._wrap_results(results, blocks, obj)
 
+    def _apply_2d(self, cfunc, values, window, center, check_minp, indexi,
+                  bounds=None, **kwargs):
+        """
+        apply a 2-d window kernel to the values of a block, the kernel
+        rolls along the rows of a C-contiguous array
+        """
+        values = np.ascontiguousarray(values if self.axis == 0 else values.T)
+        minp = check_minp(self.min_periods, window)
+
+        if center:
+            offset = _offset(window, center)
+            additional_nans = np.empty((offset, values.shape[1]))
+            additional_nans.fill(np.NaN)
+            values = np.concatenate((values, additional_nans))
+
+        with np.errstate(all='ignore'):
+            result = cfunc(values, window, minp, indexi, groups=self._groups,
+                           bounds=bounds, **kwargs)
+
+        if self.axis != 0:
+            result = result.T
+        if center:
+            result = self._center_window(result, window)
+        return result
+
 
 class _Rolling_and_Expanding(_Rolling):
 
@@ -774,8 +935,9 @@ class _Rolling_and_Expanding(_Rolling):
                 result[pd.isnull(result)] = 0
 
             result = self._constructor(result, window=window, min_periods=0,
-                                       center=self.center).sum()
-            results.append(result)
+                                       center=self.center)
+            result._groups = self._groups
+            results.append(result.sum())
 
         return self._wrap_results(results, blocks, obj)
 
@@ -786,22 +948,33 @@ class _Rolling_and_Expanding(_Rolling):
     ----------
     func : function
         Must produce a single value from an ndarray input
-        \*args and \*\*kwargs are passed to the function""")
+        \*args and \*\*kwargs are passed to the function
+    batch : boolean, default False
+        Call func with many windows at once, as the rows of a 2-d read-only
+        ndarray, rather than once per window; func must then return a 1-d
+        ndarray of one value per row. Windows of the same length are
+        passed together, as strided views of the data rather than copies.
+
+        .. versionadded:: 0.20.0""")
 
-    def apply(self, func, args=(), kwargs={}):
+    def apply(self, func, args=(), kwargs={}, batch=False):
         # TODO: _level is unused?
         _level = kwargs.pop('_level', None)  # noqa
         window = self._get_window()
-        offset = _offset(window, self.center)
         index, indexi = self._get_index()
+        bounds = self._get_bounds(indexi)
+        offset = _offset(window, self.center) if bounds is None else 0
+
+        roll_generic = (_window.roll_generic_batch if batch
+                        else _window.roll_generic)
 
         def f(arg, window, min_periods):
             minp = _use_window(min_periods, window)
-            return _window.roll_generic(arg, window, minp, indexi,
-                                        offset, func, args,
-                                        kwargs)
+            return roll_generic(arg, window, minp, indexi, offset, func,
+                                args, kwargs, groups=self._groups,
+                                bounds=bounds)
 
-        return self._apply(f, func, args=args, kwargs=kwargs,
+        return self._apply(f, func, args=args, kwargs=kwargs, batch=batch,
                            center=False)
 
     def sum(self, *args, **kwargs):
@@ -866,11 +1039,13 @@ class _Rolling_and_Expanding(_Rolling):
         nv.validate_window_func('std', args, kwargs)
         window = self._get_window()
         index, indexi = self._get_index()
+        bounds = self._get_bounds(indexi)
 
         def f(arg, *args, **kwargs):
             minp = _require_min_periods(1)(self.min_periods, window)
             return _zsqrt(_window.roll_var(arg, window, minp, indexi,
-                                           ddof))
+                                           ddof, groups=self._groups,
+                                           bounds=bounds))
 
         return self._apply(f, 'std', check_minp=_require_min_periods(1),
                            ddof=ddof, **kwargs)
@@ -907,21 +1082,107 @@ class _Rolling_and_Expanding(_Rolling):
 
     Parameters
     ----------
-    quantile : float
-        0 <= quantile <= 1""")
+    quantile : float or array-like
+        0 <= quantile <= 1, an array of quantiles is computed from a
+        single skiplist per column, with a column of the result for each
+        quantile of a Series, or for each column and quantile of a
+        DataFrame
+
+        .. versionadded:: 0.20.0
+           an array of quantiles""")
 
     def quantile(self, quantile, **kwargs):
+        if is_list_like(quantile):
+            return self._apply_quantiles(quantile, **kwargs)
+
         window = self._get_window()
         index, indexi = self._get_index()
+        bounds = self._get_bounds(indexi)
 
         def f(arg, *args, **kwargs):
             minp = _use_window(self.min_periods, window)
             return _window.roll_quantile(arg, window, minp, indexi,
-                                         quantile)
+                                         quantile, groups=self._groups,
+                                         bounds=bounds)
 
         return self._apply(f, 'quantile', quantile=quantile,
                            **kwargs)
 
+    def _apply_quantiles(self, quantiles, **kwargs):
+        """
+        compute several quantiles from a single skiplist per column
+
+        Returns
+        -------
+        DataFrame with a column for each quantile of a Series, or a
+        column for each pair of column and quantile of a DataFrame
+        """
+        from pandas import MultiIndex
+        from pandas.tools.merge import concat
+
+        quantiles = list(quantiles)
+        window = self._get_window()
+        minp = _use_window(self.min_periods, window)
+
+        blocks, obj, index = self._create_blocks(how=None)
+        index, indexi = self._get_index(index=index)
+        bounds = self._get_bounds(indexi)
+
+        offset = _offset(window, self.center) if bounds is None else 0
+        additional_nans = np.array([np.NaN] * offset)
+
+        def calc(x):
+            if offset:
+                x = np.concatenate((x, additional_nans))
+            result = _window.roll_quantiles(
+                _ensure_float64(x), window, minp, indexi,
+                np.asarray(quantiles, dtype=np.float64), groups=self._groups,
+                bounds=bounds)
+            return result[offset:] if offset else result
+
+        results = [[] for q in quantiles]
+        for b in blocks:
+            try:
+                values = self._prep_values(b.values)
+            except TypeError:
+                for r in results:
+                    r.append(b.values.copy())
+                continue
+
+            if values.size == 0:
+                for r in results:
+                    r.append(values.copy())
+                continue
+
+            with np.errstate(all='ignore'):
+                if values.ndim > 1:
+                    x = values if self.axis == 0 else values.T
+                    result = np.empty(x.shape + (len(quantiles),))
+                    for k in range(x.shape[1]):
+                        result[:, k] = calc(x[:, k])
+                    if self.axis != 0:
+                        result = result.transpose(1, 0, 2)
+                else:
+                    result = calc(values)
+
+            for j, r in enumerate(results):
+                r.append(result[..., j])
+
+        results = [self._wrap_results(r, blocks, obj) for r in results]
+        result = concat(results, axis=1, keys=quantiles)
+        if result.columns.nlevels > 1:
+
+            # the quantiles of each column next to each other
+            ncols = len(results[0].columns)
+            indexer = np.arange(len(result.columns)).reshape(
+                len(quantiles), ncols).T.ravel()
+            result = result.iloc[:, indexer]
+            columns = result.columns
+            result.columns = MultiIndex(
+                levels=columns.levels[::-1], labels=columns.labels[::-1],
+                names=columns.names[::-1], verify_integrity=False)
+        return result
+
     _shared_docs['cov'] = dedent("""
     %(name)s sample covariance
 
@@ -952,6 +1213,8 @@ class _Rolling_and_Expanding(_Rolling):
             # to avoid potential overflow, cast the data to float64
             X = X.astype('float64')
             Y = Y.astype('float64')
+            if self.is_freq_type and self.freq is None:
+                return self._pair_moment(X, Y, window, ddof=ddof)
             mean = lambda x: x.rolling(window, self.min_periods,
                                        center=self.center).mean(**kwargs)
             count = (X + Y).rolling(window=window,
@@ -959,8 +1222,12 @@ class _Rolling_and_Expanding(_Rolling):
             bias_adj = count / (count - ddof)
             return (mean(X * Y) - mean(X) * mean(Y)) * bias_adj
 
+        def _get_pairwise_cov(X, Y, symmetric):
+            return self._pairwise_moment(X, Y, window, symmetric, ddof=ddof)
+
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
-                                   _get_cov, pairwise=bool(pairwise))
+                                   _get_cov, pairwise=bool(pairwise),
+                                   pairwise_f=_get_pairwise_cov)
 
     _shared_docs['corr'] = dedent("""
     %(name)s sample correlation
@@ -985,6 +1252,8 @@ class _Rolling_and_Expanding(_Rolling):
         window = self._get_window(other)
 
         def _get_corr(a, b):
+            if self.is_freq_type and self.freq is None:
+                return self._pair_moment(a, b, window, corr=True)
             a = a.rolling(window=window, min_periods=self.min_periods,
                           freq=self.freq, center=self.center)
             b = b.rolling(window=window, min_periods=self.min_periods,
@@ -992,8 +1261,60 @@ class _Rolling_and_Expanding(_Rolling):
 
             return a.cov(b, **kwargs) / (a.std(**kwargs) * b.std(**kwargs))
 
+        def _get_pairwise_corr(X, Y, symmetric):
+            return self._pairwise_moment(X, Y, window, symmetric, corr=True)
+
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
-                                   _get_corr, pairwise=bool(pairwise))
+                                   _get_corr, pairwise=bool(pairwise),
+                                   pairwise_f=_get_pairwise_corr)
+
+    def _pairwise_moment(self, X, Y, window, symmetric, ddof=1, corr=False):
+        """
+        the covariance, or correlation, of each column of X with each column
+        of Y as a 3-d array of shape (rows, columns of X, columns of Y),
+        rolling all of the pairs in a single pass
+
+        Returns None when the pairs must be computed one at a time
+        """
+        if self.freq is not None:
+            return None
+
+        bounds = None
+        if self.is_freq_type:
+            index = X.index if self.on is None else self._on
+            bounds = self._get_bounds(index.asi8)
+
+        offset = _offset(window, self.center) if bounds is None else 0
+
+        def _prep(values):
+            values = self._prep_values(values)
+            if offset:
+                additional_nans = np.empty((offset, values.shape[1]))
+                additional_nans.fill(np.NaN)
+                values = np.concatenate((values, additional_nans))
+            return np.ascontiguousarray(values)
+
+        x = _prep(X.values)
+        y = x if symmetric else _prep(Y.values)
+        minp = _use_window(self.min_periods, window)
+
+        with np.errstate(all='ignore'):
+            result = _window.roll_cov_pairwise(x, y, window, minp, ddof=ddof,
+                                               corr=corr, symmetric=symmetric,
+                                               bounds=bounds)
+
+        return result[offset:]
+
+    def _pair_moment(self, x, y, window, ddof=1, corr=False):
+        """
+        the covariance, or correlation, of the aligned Series x and y over
+        offset based windows
+        """
+        x, y = x.astype('float64'), y.astype('float64')
+        result = self._pairwise_moment(x.to_frame(), y.to_frame(), window,
+                                       False, ddof=ddof, corr=corr)
+        return x._constructor(result[:, 0, 0], index=x.index,
+                              name=com._maybe_match_name(x, y))
 
 
 class Rolling(_Rolling_and_Expanding):
@@ -1039,12 +1360,6 @@ class Rolling(_Rolling_and_Expanding):
                                  "compat with a datetimelike "
                                  "index".format(self.window))
 
-            # we don't allow center
-            if self.center:
-                raise NotImplementedError("center is not implemented "
-                                          "for datetimelike and offset "
-                                          "based windows")
-
             # this will raise ValueError on non-fixed freqs
             self.window = freq.nanos
             self.win_type = 'freq'
@@ -1058,6 +1373,66 @@ class Rolling(_Rolling_and_Expanding):
         elif self.window < 0:
             raise ValueError("window must be non-negative")
 
+        if self.closed is not None and not self.is_freq_type:
+            raise ValueError("closed only implemented for datetimelike and "
+                             "offset based windows")
+
+    def update(self, other):
+        """
+        Append new rows to the data of the window, for the following
+        computations to return the values of the new rows only.
+
+        Only the rows of the current data that can still fall in the window
+        of a new row are kept, so the new values are computed in time
+        proportional to the number of new rows and the window size.
+
+        .. versionadded:: 0.20.0
+
+        Parameters
+        ----------
+        other : Series or DataFrame
+            the rows following the current data
+
+        Returns
+        -------
+        self
+
+        Examples
+        --------
+        >>> r = df.rolling('30min')
+        >>> r.mean()  # the whole history
+        >>> r.update(ticks).mean()  # the new ticks only
+        """
+        if self.center or self.freq is not None or self.axis != 0:
+            raise NotImplementedError("update is only implemented for "
+                                      "windows that are not centered, "
+                                      "without freq, and along the rows")
+
+        obj = self.obj
+        if self.is_freq_type:
+            index, indexi = self._get_index()
+            if not len(obj):
+                kept = obj
+            elif self.closed in ['left', 'both']:
+                kept = obj[indexi >= indexi[-1] - self.window]
+            else:
+                kept = obj[indexi > indexi[-1] - self.window]
+        else:
+            kept = obj.iloc[max(len(obj) - self.window + 1, 0):]
+        obj = pd.concat([kept, other])
+
+        if self.is_freq_type:
+            on = obj.index if self.on is None else pd.Index(obj[self.on])
+            if not on.is_monotonic:
+                formatted = self.on or 'index'
+                raise ValueError("{0} must be "
+                                 "monotonic".format(formatted))
+
+        self.obj = obj
+        self._skip = len(kept)
+        self._reset_cache()
+        return self
+
     @Substitution(name='rolling')
     @Appender(SelectionMixin._see_also_template)
     @Appender(SelectionMixin._agg_doc)
@@ -1080,8 +1455,9 @@ class Rolling(_Rolling_and_Expanding):
     @Substitution(name='rolling')
     @Appender(_doc_template)
     @Appender(_shared_docs['apply'])
-    def apply(self, func, args=(), kwargs={}):
-        return super(Rolling, self).apply(func, args=args, kwargs=kwargs)
+    def apply(self, func, args=(), kwargs={}, batch=False):
+        return super(Rolling, self).apply(func, args=args, kwargs=kwargs,
+                                          batch=batch)
 
     @Substitution(name='rolling')
     @Appender(_doc_template)
@@ -1153,6 +1529,8 @@ class Rolling(_Rolling_and_Expanding):
     @Appender(_doc_template)
     @Appender(_shared_docs['cov'])
     def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
+        if self._skip:
+            raise NotImplementedError("cov is not implemented after update")
         return super(Rolling, self).cov(other=other, pairwise=pairwise,
                                         ddof=ddof, **kwargs)
 
@@ -1160,6 +1538,8 @@ class Rolling(_Rolling_and_Expanding):
     @Appender(_doc_template)
     @Appender(_shared_docs['corr'])
     def corr(self, other=None, pairwise=None, **kwargs):
+        if self._skip:
+            raise NotImplementedError("corr is not implemented after update")
         return super(Rolling, self).corr(other=other, pairwise=pairwise,
                                          **kwargs)
 
@@ -1263,8 +1643,9 @@ class Expanding(_Rolling_and_Expanding):
     @Substitution(name='expanding')
     @Appender(_doc_template)
     @Appender(_shared_docs['apply'])
-    def apply(self, func, args=(), kwargs={}):
-        return super(Expanding, self).apply(func, args=args, kwargs=kwargs)
+    def apply(self, func, args=(), kwargs={}, batch=False):
+        return super(Expanding, self).apply(func, args=args, kwargs=kwargs,
+                                            batch=batch)
 
     @Substitution(name='expanding')
     @Appender(_doc_template)
@@ -1398,9 +1779,12 @@ class EWM(_Rolling):
     span : float, optional
         Specify decay in terms of span,
         :math:`\alpha = 2 / (span + 1),\text{ for } span \geq 1`
-    halflife : float, optional
+    halflife : float, string or timedelta, optional
         Specify decay in terms of half-life,
         :math:`\alpha = 1 - exp(log(0.5) / halflife),\text{ for } halflife > 0`
+
+        With times, the time over which the weight of an observation
+        halves, such as '5min'
     alpha : float, optional
         Specify smoothing factor :math:`\alpha` directly,
         :math:`0 < \alpha \leq 1`
@@ -1418,6 +1802,13 @@ class EWM(_Rolling):
     ignore_na : boolean, default False
         Ignore missing values when calculating weights;
         specify True to reproduce pre-0.15.0 behavior
+    times : array-like of datetime64, optional
+        The times of the observations, monotonically increasing, for
+        irregularly spaced data. The weights then decay by the time elapsed
+        between the observations, rather than by their number, and halflife
+        must be given as a timedelta. Only implemented with adjust=True.
+
+        .. versionadded:: 0.20.0
 
     Returns
     -------
@@ -1470,22 +1861,62 @@ class EWM(_Rolling):
     calculating the final weighted average of [x, None, y] are 1-alpha and 1
     (if adjust is True), and 1-alpha and alpha (if adjust is False).
 
+    When times are given, the weight of an observation is halved over each
+    halflife of time that elapses after it, so the weights of x and y used
+    in calculating the weighted average at the time of y are
+    0.5**((t_y - t_x) / halflife) and 1 (if adjust is True). ignore_na has no
+    effect then, as missing values do not change the elapsed time.
+
     More details can be found at
     http://pandas.pydata.org/pandas-docs/stable/computation.html#exponentially-weighted-windows
     """
     _attributes = ['com', 'min_periods', 'freq', 'adjust', 'ignore_na', 'axis']
 
+    # the kernel states at the end of the data preceding the last update,
+    # and at the end of the current data, by function and column
+    _initial = None
+    _states = None
+
+    # the time elapsed since the previous observation, in halflifes, the
+    # time of the last observation and the halflife, for an ewm over times
+    _deltas = None
+    _last_time = None
+    _halflife = None
+
+    _update_attributes = ['_initial', '_states', '_deltas', '_last_time',
+                          '_halflife']
+
     def __init__(self, obj, com=None, span=None, halflife=None, alpha=None,
                  min_periods=0, freq=None, adjust=True, ignore_na=False,
-                 axis=0):
+                 axis=0, times=None):
         self.obj = obj
-        self.com = _get_center_of_mass(com, span, halflife, alpha)
+        if times is not None:
+            if com is not None or span is not None or alpha is not None:
+                raise ValueError("only halflife can be given with times")
+            if freq is not None or axis != 0 or not adjust:
+                raise NotImplementedError("times is only implemented "
+                                          "without freq, along the rows "
+                                          "and with adjust=True")
+            if len(times) != len(obj):
+                raise ValueError("times must be the same length as the "
+                                 "object")
+
+            # the weights halve over each halflife of elapsed time
+            self._deltas, self._last_time = _get_deltas(times, halflife)
+            self._halflife = halflife
+            self.com = 1.
+        elif isinstance(halflife, (compat.string_types, timedelta,
+                                   np.timedelta64)):
+            raise ValueError("halflife can only be a timedelta with times")
+        else:
+            self.com = _get_center_of_mass(com, span, halflife, alpha)
         self.min_periods = min_periods
         self.freq = freq
         self.adjust = adjust
         self.ignore_na = ignore_na
         self.axis = axis
         self.on = None
+        self._states = {}
 
     @property
     def _constructor(self):
@@ -1499,7 +1930,124 @@ class EWM(_Rolling):
 
     agg = aggregate
 
-    def _apply(self, func, how=None, **kwargs):
+    def update(self, other, times=None):
+        """
+        Continue the exponentially weighted functions with new rows, for
+        the following computations to return the values of the new rows
+        only.
+
+        The functions are resumed from the state of their computation
+        at the end of the current data, such as the weighted average and
+        the weight of the previous observations, so only the functions
+        computed since the object was created can be continued.
+
+        .. versionadded:: 0.20.0
+
+        Parameters
+        ----------
+        other : Series or DataFrame
+            the rows following the current data
+        times : array-like of datetime64, optional
+            the times of the new rows, required when the ewm was given
+            times
+
+        Returns
+        -------
+        self
+
+        Examples
+        --------
+        >>> e = df.ewm(halflife=10)
+        >>> e.mean()  # the whole history
+        >>> e.update(ticks).mean()  # the new ticks only
+        """
+        if self.freq is not None or self.axis != 0:
+            raise NotImplementedError("update is only implemented without "
+                                      "freq and along the rows")
+        if (times is None) != (self._deltas is None):
+            raise ValueError("times must be given to update an ewm over "
+                             "times, and only then")
+        if times is not None:
+            if len(times) != len(other):
+                raise ValueError("times must be the same length as the "
+                                 "object")
+            deltas, last_time = _get_deltas(times, self._halflife,
+                                            last=self._last_time)
+
+        # carry the functions that were not computed since the previous
+        # update over the current data
+        if self._initial:
+            for key in set(self._initial) - set(self._states):
+                state_key, column = key
+                values = self.obj if column is None else self.obj[column]
+                state = self._initial[key].copy()
+                self._get_kernel(*state_key)[0](self._prep_values(values),
+                                                state=state)
+                self._states[key] = state
+
+        self.obj = other
+        if times is not None:
+            self._deltas, self._last_time = deltas, last_time
+        self._initial = self._states
+        self._states = {}
+        self._reset_cache()
+        return self
+
+    def _get_kernel(self, name, bias=False):
+        """
+        Return the kernel of a function and the constructor of its initial
+        state, the kernel takes a column and the state to resume from
+        """
+        if name == 'mean':
+            def f(arg, state=None):
+                return _window.ewma(arg, self.com, int(self.adjust),
+                                    int(self.ignore_na),
+                                    int(self.min_periods), state=state,
+                                    deltas=self._deltas)
+            return f, _window.ewma_state
+
+        def f(arg, state=None):
+            return _window.ewmcov(arg, arg, self.com, int(self.adjust),
+                                  int(self.ignore_na), int(self.min_periods),
+                                  int(bias), state=state, deltas=self._deltas)
+        return f, _window.ewmcov_state
+
+    def _apply_resumable(self, state_key, block, values):
+        """
+        apply the kernel of a function to each column, resuming from the
+        state at the end of the data preceding the last update and keeping
+        the state at the end of the current data
+        """
+        func, get_state = self._get_kernel(*state_key)
+
+        if values.ndim > 1:
+            columns = block.columns
+            result = np.empty_like(values)
+        else:
+            # a column selected from a DataFrame shares the states of the
+            # DataFrame's own computations
+            columns = [self._selection]
+
+        for k, column in enumerate(columns):
+            key = (state_key, column)
+            if self._initial is None:
+                state = get_state()
+            elif key in self._initial:
+                state = self._initial[key].copy()
+            else:
+                raise ValueError("cannot continue the ewm {0} after update, "
+                                 "as it was not computed before the "
+                                 "update".format(state_key[0]))
+
+            if values.ndim > 1:
+                result[:, k] = func(values[:, k], state=state)
+            else:
+                result = func(values, state=state)
+            self._states[key] = state
+
+        return result
+
+    def _apply(self, func, how=None, state_key=None, **kwargs):
         """Rolling statistical measure using supplied function. Designed to be
         used with passed-in Cython array-based functions.
 
@@ -1508,6 +2056,9 @@ class EWM(_Rolling):
         func : string/callable to apply
         how : string, default to None (DEPRECATED)
             how to resample
+        state_key : tuple, optional
+            name and arguments of a function that can be resumed after
+            update, its kernel is used instead of func along the rows
 
         Returns
         -------
@@ -1538,7 +2089,10 @@ class EWM(_Rolling):
                     return cfunc(arg, self.com, int(self.adjust),
                                  int(self.ignore_na), int(self.min_periods))
 
-            results.append(np.apply_along_axis(func, self.axis, values))
+            if state_key is not None and self.axis == 0:
+                results.append(self._apply_resumable(state_key, b, values))
+            else:
+                results.append(np.apply_along_axis(func, self.axis, values))
 
         return self._wrap_results(results, blocks, obj)
 
@@ -1547,7 +2101,7 @@ class EWM(_Rolling):
     def mean(self, *args, **kwargs):
         """exponential weighted moving average"""
         nv.validate_window_func('mean', args, kwargs)
-        return self._apply('ewma', **kwargs)
+        return self._apply('ewma', state_key=('mean',), **kwargs)
 
     @Substitution(name='ewm')
     @Appender(_doc_template)
@@ -1571,13 +2125,15 @@ class EWM(_Rolling):
                                   int(self.ignore_na), int(self.min_periods),
                                   int(bias))
 
-        return self._apply(f, **kwargs)
+        return self._apply(f, state_key=('var', bias), **kwargs)
 
     @Substitution(name='ewm')
     @Appender(_doc_template)
     @Appender(_pairwise_template)
     def cov(self, other=None, pairwise=None, bias=False, **kwargs):
         """exponential weighted sample covariance"""
+        if self._initial is not None:
+            raise NotImplementedError("cov is not implemented after update")
         if other is None:
             other = self._selected_obj
             # only default unset
@@ -1589,7 +2145,8 @@ class EWM(_Rolling):
             Y = self._shallow_copy(Y)
             cov = _window.ewmcov(X._prep_values(), Y._prep_values(), self.com,
                                  int(self.adjust), int(self.ignore_na),
-                                 int(self.min_periods), int(bias))
+                                 int(self.min_periods), int(bias),
+                                 deltas=self._deltas)
             return X._wrap_result(cov)
 
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
@@ -1600,6 +2157,8 @@ class EWM(_Rolling):
     @Appender(_pairwise_template)
     def corr(self, other=None, pairwise=None, **kwargs):
         """exponential weighted sample correlation"""
+        if self._initial is not None:
+            raise NotImplementedError("corr is not implemented after update")
         if other is None:
             other = self._selected_obj
             # only default unset
@@ -1614,7 +2173,7 @@ class EWM(_Rolling):
                 return _window.ewmcov(x, y, self.com, int(self.adjust),
                                       int(self.ignore_na),
                                       int(self.min_periods),
-                                      1)
+                                      1, deltas=self._deltas)
 
             x_values = X._prep_values()
             y_values = Y._prep_values()
@@ -1631,7 +2190,15 @@ class EWM(_Rolling):
 # Helper Funcs
 
 
-def _flex_binary_moment(arg1, arg2, f, pairwise=False):
+def _flex_binary_moment(arg1, arg2, f, pairwise=False, pairwise_f=None):
+    """
+    Apply a binary moment function f to Series and DataFrames
+
+    pairwise_f, if given, computes all of the pairs of columns of two
+    DataFrames with the same index for pairwise=True, as a 3-d array, and
+    is passed whether the DataFrames are one and the same; it can return
+    None to compute the pairs with f
+    """
     from pandas import Series, DataFrame, Panel
     if not (isinstance(arg1, (np.ndarray, Series, DataFrame)) and
             isinstance(arg2, (np.ndarray, Series, DataFrame))):
@@ -1674,6 +2241,16 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
                     return DataFrame(results, index=X.index,
                                      columns=res_columns)
             elif pairwise is True:
+                if pairwise_f is not None:
+                    X, Y = arg1, arg2
+                    if not X.index.equals(Y.index):
+                        X, Y = X.align(Y, join='outer', axis=0)
+                    result = pairwise_f(X, Y, arg1 is arg2)
+                    if result is not None:
+                        return Panel(result, items=X.index,
+                                     major_axis=arg1.columns,
+                                     minor_axis=arg2.columns)
+
                 results = defaultdict(dict)
                 for i, k1 in enumerate(arg1.columns):
                     for j, k2 in enumerate(arg2.columns):
@@ -1731,6 +2308,45 @@ def _get_center_of_mass(com, span, halflife, alpha):
     return float(com)
 
 
+def _get_deltas(times, halflife, last=None):
+    """
+    Return the time elapsed since the previous observation at each of the
+    times, in units of the halflife, and the last of the times
+
+    Parameters
+    ----------
+    times : array-like of datetime64
+    halflife : string or timedelta
+    last : int, optional
+        the time of the observation preceding the times, in nanoseconds
+    """
+    from pandas.core.index import _ensure_index
+
+    if not isinstance(halflife, (compat.string_types, timedelta,
+                                 np.timedelta64)):
+        raise ValueError("halflife must be a timedelta with times")
+    halflife = pd.Timedelta(halflife).value
+    if halflife <= 0:
+        raise ValueError("halflife must satisfy: halflife > 0")
+
+    times = _ensure_index(times)
+    if not isinstance(times, ABCDatetimeIndex):
+        raise ValueError("times must be datetime64")
+    if times.hasnans:
+        raise ValueError("times must not contain NaT")
+
+    times = times.asi8
+    if not len(times):
+        return np.array([], dtype=np.float64), last
+
+    previous = times[0] if last is None else last
+    times = np.concatenate([[previous], times])
+    deltas = np.diff(times)
+    if (deltas < 0).any():
+        raise ValueError("times must be monotonic")
+    return deltas / float(halflife), times[-1]
+
+
 def _offset(window, center):
     if not is_integer(window):
         window = len(window)
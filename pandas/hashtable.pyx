@@ -309,3 +309,89 @@ def unique_label_indices(ndarray[int64_t, ndim=1] labels):
     arr = arr[labels[arr].argsort()]
 
     return arr[1:] if arr.size != 0 and labels[arr[0]] == -1 else arr
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_labels_hashed(ndarray[int64_t, ndim=2] labels):
+    """
+    Factorize the observed combinations of the label arrays (one per row of
+    `labels`) in a single hashing pass, numbering groups in order of first
+    appearance. Unlike `get_group_index` followed by compression, this does
+    not depend on the size of the cartesian product of the levels.
+
+    Rows with any label of -1 get a group id of -1.
+
+    Returns
+    -------
+    (comp_ids, first) : the group id of each position, and the position of
+    the first occurrence of each group; or None if two distinct
+    combinations hashed to the same value (in which case the caller should
+    fall back to an exact method).
+    """
+    cdef:
+        int ret = 0
+        Py_ssize_t i, j, nkeys, n
+        int64_t lab, grp, count = 0
+        uint64_t h
+        bint isnull, collision = 0
+        khiter_t k
+        kh_int64_t * table = kh_init_int64()
+        Int64Vector first = Int64Vector()
+        Int64VectorData *ud = first.data
+        ndarray[int64_t, ndim=1] comp_ids
+
+    nkeys, n = (<object> labels).shape
+    comp_ids = np.empty(n, dtype=np.int64)
+
+    kh_resize_int64(table, min(n, _SIZE_HINT_LIMIT))
+
+    with nogil:
+        for i in range(n):
+            isnull = 0
+            h = 0
+            for j in range(nkeys):
+                lab = labels[j, i]
+                if lab < 0:
+                    isnull = 1
+                    break
+                # boost::hash_combine
+                h ^= (<uint64_t> lab + <uint64_t> 0x9e3779b97f4a7c15 +
+                      (h << 6) + (h >> 2))
+
+            if isnull:
+                comp_ids[i] = -1
+                continue
+
+            k = kh_get_int64(table, <int64_t> h)
+            if k != table.n_buckets:
+                grp = table.vals[k]
+
+                # verify against the first row of the group
+                for j in range(nkeys):
+                    if labels[j, i] != labels[j, ud.data[grp]]:
+                        collision = 1
+                        break
+
+                if collision:
+                    break
+
+                comp_ids[i] = grp
+            else:
+                k = kh_put_int64(table, <int64_t> h, &ret)
+                table.vals[k] = count
+
+                if needs_resize(ud):
+                    with gil:
+                        first.resize()
+                append_data_int64(ud, i)
+
+                comp_ids[i] = count
+                count += 1
+
+    kh_destroy_int64(table)
+
+    if collision:
+        return None
+
+    return comp_ids, first.to_array()
@@ -2,7 +2,7 @@
 
 from numpy cimport ndarray
 
-from numpy cimport (float64_t, int32_t, int64_t, uint8_t,
+from numpy cimport (float64_t, int32_t, int64_t, uint8_t, uint64_t,
                     NPY_DATETIME, NPY_TIMEDELTA)
 cimport cython
 
@@ -18,7 +18,7 @@ import numpy as np
 cimport tslib
 from hashtable cimport *
 from pandas import algos, tslib, hashtable as _hash
-from pandas.tslib import Timestamp, Timedelta
+from pandas.tslib import Timestamp, Timedelta, NaT
 
 from datetime cimport (get_datetime64_value, _pydatetime_to_dts,
                        pandas_datetimestruct)
@@ -269,7 +269,7 @@ cdef class IndexEngine:
     cdef inline _ensure_mapping_populated(self):
         # need to reset if we have previously
         # set the initialized from monotonic checks
-        if self.unique_check:
+        if self.unique_check and self.mapping is None:
             self.initialized = 0
         if not self.initialized:
             self.initialize()
@@ -529,6 +529,177 @@ cdef class ObjectEngine(IndexEngine):
                                         limit=limit)
 
 
+cdef class MultiIndexEngine(ObjectEngine):
+    """
+    Engine of a MultiIndex with unique levels, which maps the rows by their
+    labels rather than by their tuples.
+
+    The labels of each row, shifted by one so that missing values are 0,
+    are packed into the bits of a uint64 key with the first level in the
+    highest bits. When the levels need more than 64 bits, the key of the
+    levels packed so far is factorized before packing the next ones. The
+    tuples are only built for the monotonic checks and for pad / backfill.
+    """
+
+    cdef readonly:
+        list levels, labels
+        ndarray keys
+
+    cdef:
+        list bits, compressors
+
+    def __init__(self, vgetter, levels, labels):
+        IndexEngine.__init__(self, vgetter, len(labels[0]))
+        self.levels = list(levels)
+        self.labels = list(labels)
+        self.keys = None
+
+        # enough bits for the labels of each level and the missing value
+        self.bits = [max(int(len(lev)).bit_length(), 1) for lev in levels]
+        self.compressors = [None] * len(levels)
+
+    cdef _make_hash_table(self, n):
+        return _hash.Int64HashTable(n)
+
+    cdef _check_type(self, object val):
+        hash(val)
+
+    cdef initialize(self):
+        cdef:
+            Py_ssize_t i, nbits
+            ndarray keys, codes
+
+        keys = np.asarray(self.labels[0], dtype=np.int64) + 1
+        keys = keys.view(np.uint64)
+        nbits = self.bits[0]
+        for i in range(1, len(self.levels)):
+            if nbits + self.bits[i] > 64:
+                table = _hash.Int64HashTable(len(keys))
+                keys = table.get_labels(keys.view(np.int64),
+                                        _hash.Int64Vector(), 0, -1, False)
+                keys = keys.view(np.uint64)
+                self.compressors[i] = table
+                nbits = max(int(len(table) - 1).bit_length(), 1)
+
+            codes = np.asarray(self.labels[i], dtype=np.int64) + 1
+            keys <<= np.uint64(self.bits[i])
+            keys |= codes.view(np.uint64)
+            nbits += self.bits[i]
+
+        self.keys = keys.view(np.int64)
+        self.mapping = self._make_hash_table(len(self.keys))
+        self.mapping.map_locations(self.keys)
+
+        if len(self.mapping) == len(self.keys):
+            self.unique = 1
+
+        self.initialized = 1
+
+    def clear_mapping(self):
+        IndexEngine.clear_mapping(self)
+        self.keys = None
+        self.compressors = [None] * len(self.levels)
+
+    cdef _get_level_code(self, object lev, object val):
+        try:
+            loc = lev._engine.get_loc(val)
+        except (KeyError, TypeError):
+            # the casts of the level, such as of floats to integers
+            try:
+                loc = lev.get_loc(val)
+            except (KeyError, TypeError):
+                loc = None
+        if util.is_integer_object(loc):
+            return loc + 1
+        elif util._checknull(val) or val is NaT:
+            return 0
+        raise KeyError(val)
+
+    cdef int64_t _get_key(self, object val) except? -1:
+        cdef:
+            Py_ssize_t i
+            uint64_t key = 0
+
+        if not PyTuple_Check(val) or len(val) != len(self.levels):
+            raise KeyError(val)
+
+        for i in range(len(self.levels)):
+            if self.compressors[i] is not None:
+                try:
+                    key = self.compressors[i].get_item(<int64_t> key)
+                except KeyError:
+                    raise KeyError(val)
+            key = ((key << self.bits[i]) |
+                   <uint64_t> self._get_level_code(self.levels[i], val[i]))
+        return <int64_t> key
+
+    def __contains__(self, object val):
+        hash(val)
+        try:
+            self.get_loc(val)
+        except KeyError:
+            return False
+        return True
+
+    cpdef get_loc(self, object val):
+        cdef:
+            int64_t key
+            ndarray[uint8_t, cast=True] found
+
+        if is_definitely_invalid_key(val):
+            raise TypeError("'{val}' is an invalid key".format(val=val))
+
+        self._ensure_mapping_populated()
+        key = self._get_key(val)
+        if self.unique:
+            try:
+                return self.mapping.get_item(key)
+            except KeyError:
+                raise KeyError(val)
+
+        found = self.keys == key
+        locs = found.nonzero()[0]
+        if len(locs) == 0:
+            raise KeyError(val)
+        elif len(locs) == 1:
+            return int(locs[0])
+        return found
+
+    def get_indexer(self, target):
+        """
+        Locations of the rows of the MultiIndex target, -1 for those
+        missing, matching the levels instead of the tuples
+        """
+        cdef:
+            Py_ssize_t i
+            ndarray keys, codes, found, missing, indexer
+
+        self._ensure_mapping_populated()
+
+        keys = np.zeros(len(target), dtype=np.uint64)
+        missing = np.zeros(len(target), dtype=bool)
+        for i in range(len(self.levels)):
+            if self.compressors[i] is not None:
+                keys = self.compressors[i].lookup(keys.view(np.int64))
+                missing |= keys == -1
+                keys = keys.view(np.uint64)
+
+            # the codes of the target level values, -1 for those not in
+            # the level and 0 for missing values
+            found = self.levels[i].get_indexer(target.levels[i])
+            found = np.where(found == -1, -1, found + 1)
+            found = np.append(found, 0).astype(np.int64)
+            codes = found.take(np.asarray(target.labels[i], dtype=np.int64))
+            missing |= codes == -1
+
+            keys <<= np.uint64(self.bits[i])
+            keys |= codes.clip(0, None).view(np.uint64)
+
+        indexer = self.mapping.lookup(keys.view(np.int64))
+        indexer[missing] = -1
+        return indexer
+
+
 cdef class DatetimeEngine(Int64Engine):
 
     cdef _get_box_dtype(self):
@@ -645,6 +645,15 @@ class MultiIndex(Index):
         # to disable groupby tricks
         return True
 
+    @cache_readonly
+    def _engine(self):
+        # map the rows by their labels when the levels are unique, so that
+        # the labels of a level identify its values
+        if all(lev.is_unique for lev in self.levels):
+            return _index.MultiIndexEngine(lambda: self._values,
+                                           self.levels, self.labels)
+        return self._engine_type(lambda: self._values, len(self))
+
     @cache_readonly
     def is_unique(self):
         return not self.duplicated().any()
@@ -1444,29 +1453,31 @@ class MultiIndex(Index):
         method = missing.clean_reindex_fill_method(method)
         target = _ensure_index(target)
 
-        target_index = target
-        if isinstance(target, MultiIndex):
-            target_index = target._tuple_index
-
-        if not is_object_dtype(target_index.dtype):
-            return np.ones(len(target_index)) * -1
+        if (not isinstance(target, MultiIndex) and
+                not is_object_dtype(target.dtype)):
+            return np.ones(len(target)) * -1
 
         if not self.is_unique:
             raise Exception('Reindexing only valid with uniquely valued Index '
                             'objects')
 
-        self_index = self._tuple_index
-
         if method == 'pad' or method == 'backfill':
             if tolerance is not None:
                 raise NotImplementedError("tolerance not implemented yet "
                                           'for MultiIndex')
-            indexer = self_index._get_fill_indexer(target, method, limit)
+            indexer = self._tuple_index._get_fill_indexer(target, method,
+                                                          limit)
         elif method == 'nearest':
             raise NotImplementedError("method='nearest' not implemented yet "
                                       'for MultiIndex; see GitHub issue 9365')
+        elif (isinstance(target, MultiIndex) and
+              isinstance(self._engine, _index.MultiIndexEngine)):
+            if target.nlevels == self.nlevels:
+                indexer = self._engine.get_indexer(target)
+            else:
+                indexer = np.repeat(-1, len(target))
         else:
-            indexer = self_index._engine.get_indexer(target._values)
+            indexer = self._tuple_index._engine.get_indexer(target._values)
 
         return _ensure_platform_int(indexer)
 
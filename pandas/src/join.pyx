@@ -31,6 +31,7 @@ float64 = np.dtype(np.float64)
 
 cdef double NaN = <double> np.NaN
 cdef double nan = NaN
+cdef int64_t iNaT = util.get_nat()
 
 from pandas.algos import groupsort_indexer, ensure_platform_int
 from pandas.core.algorithms import take_nd
@@ -52,12 +53,13 @@ def inner_join(ndarray[int64_t] left, ndarray[int64_t] right,
     right_sorter, right_count = groupsort_indexer(right, max_groups)
 
     # First pass, determine size of result set, do not use the NA group
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
 
-        if rc > 0 and lc > 0:
-            count += lc * rc
+            if rc > 0 and lc > 0:
+                count += lc * rc
 
     # group 0 is the NA group
     cdef:
@@ -71,19 +73,20 @@ def inner_join(ndarray[int64_t] left, ndarray[int64_t] right,
     left_indexer = np.empty(count, dtype=np.int64)
     right_indexer = np.empty(count, dtype=np.int64)
 
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
-
-        if rc > 0 and lc > 0:
-            for j in range(lc):
-                offset = position + j * rc
-                for k in range(rc):
-                    left_indexer[offset + k] = left_pos + j
-                    right_indexer[offset + k] = right_pos + k
-            position += lc * rc
-        left_pos += lc
-        right_pos += rc
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
+
+            if rc > 0 and lc > 0:
+                for j in range(lc):
+                    offset = position + j * rc
+                    for k in range(rc):
+                        left_indexer[offset + k] = left_pos + j
+                        right_indexer[offset + k] = right_pos + k
+                position += lc * rc
+            left_pos += lc
+            right_pos += rc
 
     return (_get_result_indexer(left_sorter, left_indexer),
             _get_result_indexer(right_sorter, right_indexer))
@@ -104,11 +107,12 @@ def left_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
     right_sorter, right_count = groupsort_indexer(right, max_groups)
 
     # First pass, determine size of result set, do not use the NA group
-    for i in range(1, max_groups + 1):
-        if right_count[i] > 0:
-            count += left_count[i] * right_count[i]
-        else:
-            count += left_count[i]
+    with nogil:
+        for i in range(1, max_groups + 1):
+            if right_count[i] > 0:
+                count += left_count[i] * right_count[i]
+            else:
+                count += left_count[i]
 
     # group 0 is the NA group
     cdef:
@@ -122,24 +126,25 @@ def left_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
     left_indexer = np.empty(count, dtype=np.int64)
     right_indexer = np.empty(count, dtype=np.int64)
 
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
-
-        if rc == 0:
-            for j in range(lc):
-                left_indexer[position + j] = left_pos + j
-                right_indexer[position + j] = -1
-            position += lc
-        else:
-            for j in range(lc):
-                offset = position + j * rc
-                for k in range(rc):
-                    left_indexer[offset + k] = left_pos + j
-                    right_indexer[offset + k] = right_pos + k
-            position += lc * rc
-        left_pos += lc
-        right_pos += rc
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
+
+            if rc == 0:
+                for j in range(lc):
+                    left_indexer[position + j] = left_pos + j
+                    right_indexer[position + j] = -1
+                position += lc
+            else:
+                for j in range(lc):
+                    offset = position + j * rc
+                    for k in range(rc):
+                        left_indexer[offset + k] = left_pos + j
+                        right_indexer[offset + k] = right_pos + k
+                position += lc * rc
+            left_pos += lc
+            right_pos += rc
 
     left_indexer = _get_result_indexer(left_sorter, left_indexer)
     right_indexer = _get_result_indexer(right_sorter, right_indexer)
@@ -177,14 +182,15 @@ def full_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
     right_sorter, right_count = groupsort_indexer(right, max_groups)
 
     # First pass, determine size of result set, do not use the NA group
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
 
-        if rc > 0 and lc > 0:
-            count += lc * rc
-        else:
-            count += lc + rc
+            if rc > 0 and lc > 0:
+                count += lc * rc
+            else:
+                count += lc + rc
 
     # group 0 is the NA group
     cdef:
@@ -198,34 +204,65 @@ def full_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
     left_indexer = np.empty(count, dtype=np.int64)
     right_indexer = np.empty(count, dtype=np.int64)
 
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
-
-        if rc == 0:
-            for j in range(lc):
-                left_indexer[position + j] = left_pos + j
-                right_indexer[position + j] = -1
-            position += lc
-        elif lc == 0:
-            for j in range(rc):
-                left_indexer[position + j] = -1
-                right_indexer[position + j] = right_pos + j
-            position += rc
-        else:
-            for j in range(lc):
-                offset = position + j * rc
-                for k in range(rc):
-                    left_indexer[offset + k] = left_pos + j
-                    right_indexer[offset + k] = right_pos + k
-            position += lc * rc
-        left_pos += lc
-        right_pos += rc
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
+
+            if rc == 0:
+                for j in range(lc):
+                    left_indexer[position + j] = left_pos + j
+                    right_indexer[position + j] = -1
+                position += lc
+            elif lc == 0:
+                for j in range(rc):
+                    left_indexer[position + j] = -1
+                    right_indexer[position + j] = right_pos + j
+                position += rc
+            else:
+                for j in range(lc):
+                    offset = position + j * rc
+                    for k in range(rc):
+                        left_indexer[offset + k] = left_pos + j
+                        right_indexer[offset + k] = right_pos + k
+                position += lc * rc
+            left_pos += lc
+            right_pos += rc
 
     return (_get_result_indexer(left_sorter, left_indexer),
             _get_result_indexer(right_sorter, right_indexer))
 
 
+def hash_partition(ndarray[int64_t] values, Py_ssize_t npartitions):
+    """
+    split the positions of int64 values into npartitions by a
+    multiplicative hash of the values, equal values always falling in the
+    same partition
+
+    Parameters
+    ----------
+    values: int64 ndarray
+    npartitions: number of partitions
+
+    return a tuple of (1-d indexer ordered by partition, keeping the order
+    of the positions within each, partition sizes)
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        ndarray[int64_t] partitions
+        uint64_t h
+
+    partitions = np.empty(n, dtype=np.int64)
+
+    with nogil:
+        for i in range(n):
+            h = <uint64_t> values[i] * 0x9E3779B97F4A7C15ULL
+            partitions[i] = (h >> 32) % npartitions
+
+    sorter, counts = groupsort_indexer(partitions, npartitions)
+    return sorter, counts[1:]
+
+
 def _get_result_indexer(sorter, indexer):
     if len(sorter) > 0:
         res = take_nd(sorter, indexer, fill_value=-1)
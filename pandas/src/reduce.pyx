@@ -482,41 +482,67 @@ class InvalidApply(Exception):
 
 def apply_frame_axis0(object frame, object f, object names,
                       ndarray[int64_t] starts, ndarray[int64_t] ends):
+    """
+    Apply f to the rows starts[i]:ends[i] of frame for every i, sliding a
+    single dummy frame over the data instead of creating one per group.
+
+    Returns the results and whether any of them is not indexed like its
+    group. Every group is evaluated at most once; the results stop short of
+    len(starts) when the remaining groups must be evaluated on frames of
+    their own by the caller, e.g. because f returned its input or raised on
+    the dummy frame.
+    """
     cdef:
         BlockSlider slider
         Py_ssize_t i, n = len(starts)
         list results
-        object piece
+        object piece, chunk
         dict item_cache
 
     if frame.index._has_complex_internals:
         raise InvalidApply('Cannot modify frame index internals')
 
     results = []
+    mutated = False
 
-    # Need to infer if our low-level mucking is going to cause a segfault
-    if n > 0:
-        chunk = frame.iloc[starts[0]:ends[0]]
-        shape_before = chunk.shape
-        try:
-            result = f(chunk)
-            if result is chunk:
-                raise InvalidApply('Function unsafe for fast apply')
-        except:
-            raise InvalidApply('Let this error raise above us')
+    if n == 0:
+        return results, mutated
 
-    slider = BlockSlider(frame)
+    # Need to infer if our low-level mucking is going to cause a segfault,
+    # so the first group gets a frame of its own
+    chunk = frame.iloc[starts[0]:ends[0]]
+    object.__setattr__(chunk, 'name', names[0])
+    piece = f(chunk)
+    results.append(piece)
+
+    if piece is chunk:
+        # function unsafe for fast apply
+        return results, mutated
+
+    try:
+        if piece.index is not chunk.index:
+            mutated = True
+    except AttributeError:
+        pass
+
+    try:
+        slider = BlockSlider(frame)
+    except Exception:
+        return results, mutated
 
-    mutated = False
     item_cache = slider.dummy._item_cache
     try:
-        for i in range(n):
+        for i in range(1, n):
             slider.move(starts[i], ends[i])
 
             item_cache.clear() # ugh
 
             object.__setattr__(slider.dummy, 'name', names[i])
-            piece = f(slider.dummy)
+            try:
+                piece = f(slider.dummy)
+            except Exception:
+                # let the caller try this group on a frame of its own
+                break
 
             # I'm paying the price for index-sharing, ugh
             try:
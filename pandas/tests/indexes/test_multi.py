@@ -1088,6 +1088,32 @@ class TestMultiIndex(Base, tm.TestCase):
         self.assertRaises(KeyError, index.get_loc, (1, 1))
         self.assertEqual(index.get_loc((2, 0)), slice(3, 5))
 
+    def test_get_loc_missing_values(self):
+        index = MultiIndex.from_arrays([['a', np.nan, 'b'], [1., 2., np.nan]])
+        self.assertEqual(index.get_loc(('a', 1.)), 0)
+        self.assertEqual(index.get_loc((np.nan, 2.)), 1)
+        self.assertEqual(index.get_loc(('b', np.nan)), 2)
+        self.assertRaises(KeyError, index.get_loc, ('b', 1.))
+        self.assertNotIn((np.nan, 1.), index)
+
+    def test_get_loc_wide_levels(self):
+        # the labels of all of the levels take more than 64 bits
+        levels = [Index(np.arange(2 ** 14) * 10 + i) for i in range(5)]
+        labels = [np.arange(100) * (i + 1) for i in range(5)]
+        index = MultiIndex(levels=levels, labels=labels)
+
+        for i, key in enumerate(index.values):
+            self.assertEqual(index.get_loc(key), i)
+        self.assertNotIn((0, 11, 22, 33, 44), index)
+        self.assertNotIn((10, 1, 2, 3, 4), index)
+
+        target = index[::-1].append(MultiIndex(levels=levels,
+                                               labels=[[1], [1], [1], [1],
+                                                       [2]]))
+        expected = np.append(np.arange(100)[::-1], -1)
+        tm.assert_numpy_array_equal(index.get_indexer(target),
+                                    expected.astype(np.intp))
+
     def test_get_loc_duplicates(self):
         index = Index([2, 2, 2, 2])
         result = index.get_loc(2)
@@ -1307,6 +1333,13 @@ class TestMultiIndex(Base, tm.TestCase):
         with assertRaisesRegexp(InvalidIndexError, msg):
             idx1.get_indexer(idx2)
 
+    def test_get_indexer_missing_values(self):
+        index = MultiIndex.from_arrays([['a', np.nan, 'b'], [1., 2., np.nan]])
+        target = MultiIndex.from_arrays([['b', np.nan, 'c', 'a'],
+                                         [np.nan, 2., 1., 1.]])
+        tm.assert_numpy_array_equal(index.get_indexer(target),
+                                    np.array([2, 1, -1, 0], dtype=np.intp))
+
     def test_get_indexer_nearest(self):
         midx = MultiIndex.from_tuples([('a', 1), ('b', 2)])
         with tm.assertRaises(NotImplementedError):
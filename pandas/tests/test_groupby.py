@@ -704,6 +704,68 @@ class TestGroupBy(tm.TestCase):
         expected = grouped.mean()
         assert_frame_equal(result, expected)
 
+    def test_grouper_prepare(self):
+        from pandas.core.groupby import BaseGrouper
+
+        df = self.df
+        prepared = pd.Grouper.prepare(df, ['A', 'B'])
+        self.assertIsInstance(prepared, BaseGrouper)
+
+        grouped = df.groupby(['A', 'B'])
+        for how in ['sum', 'mean', 'max', 'first', 'cumsum']:
+            result = getattr(df.groupby(prepared), how)()
+            expected = getattr(grouped, how)()
+            assert_frame_equal(result, expected)
+        assert_series_equal(df.groupby(prepared).size(), grouped.size())
+
+        result = df.groupby(prepared).agg({'C': ['sum', 'std'], 'D': 'min'})
+        expected = grouped.agg({'C': ['sum', 'std'], 'D': 'min'})
+        assert_frame_equal(result, expected)
+
+        result = df.groupby(prepared)['C'].apply(lambda x: x.max())
+        expected = grouped['C'].apply(lambda x: x.max())
+        assert_series_equal(result, expected)
+
+        # the grouping is computed once and shared
+        self.assertIs(df.groupby(prepared).grouper, prepared)
+        self.assertIs(df.groupby(prepared).grouper.group_info,
+                      prepared.group_info)
+
+        # an object aligned to the one the grouper was prepared from
+        other = DataFrame({'E': np.random.randn(len(df))}, index=df.index)
+        result = other.groupby(prepared).sum()
+        expected = other.groupby([df['A'], df['B']]).sum()
+        assert_frame_equal(result, expected)
+
+        result = other['E'].groupby(prepared).mean()
+        expected = other['E'].groupby([df['A'], df['B']]).mean()
+        assert_series_equal(result, expected)
+
+        # nth with dropna regroups the rows it keeps
+        df = DataFrame({'A': [1, 1, 2, 2, 3],
+                        'B': [np.nan, 1., 2., 3., np.nan]})
+        prepared = pd.Grouper.prepare(df, 'A')
+        index = Index([1, 2, 3], name='A')
+        for dropna, n, values in [('any', 0, [1., 2., np.nan]),
+                                  ('any', 1, [np.nan, 3., np.nan]),
+                                  ('any', -1, [1., 3., np.nan]),
+                                  ('all', 0, [np.nan, 2., np.nan]),
+                                  ('all', 1, [1., 3., np.nan])]:
+            result = df.groupby(prepared).nth(n, dropna=dropna)
+            expected = DataFrame({'B': values}, index=index)
+            assert_frame_equal(result, expected)
+
+            result = df.B.groupby(prepared).nth(n, dropna=dropna)
+            expected = df.groupby(prepared).nth(n, dropna='any')['B']
+            assert_series_equal(result, expected)
+
+        df = self.df
+        prepared = pd.Grouper.prepare(df, ['A', 'B'])
+
+        # not aligned
+        self.assertRaises(ValueError, df.iloc[:5].groupby, prepared)
+        self.assertRaises(ValueError, df.iloc[::-1].groupby, prepared)
+
     def test_groupby_duplicated_column_errormsg(self):
         # GH7511
         df = DataFrame(columns=['A', 'B', 'A', 'C'],
@@ -1493,6 +1555,45 @@ class TestGroupBy(tm.TestCase):
         expected = self.df.groupby('A')['C'].transform(np.mean)
         assert_series_equal(result, expected)
 
+    def test_transform_reduction_broadcast(self):
+        # reductions are computed once and broadcast to the groups
+        df = self.df.copy()
+        df['E'] = np.arange(len(df))
+        grouped = df.groupby('A')
+
+        for f in ['sum', 'mean', 'median', 'std', 'var', 'sem', 'min', 'max',
+                  'first', 'last', 'count', 'prod']:
+            result = grouped.transform(f)
+            expected = getattr(grouped, f)().loc[df['A'], result.columns]
+            expected.index = df.index
+            assert_frame_equal(result, expected, check_dtype=False)
+
+            result = grouped['C'].transform(f)
+            expected = getattr(grouped['C'], f)().loc[df['A']]
+            expected.index = df.index
+            assert_series_equal(result, expected, check_dtype=False)
+
+        # the keys are not broadcast with as_index=False
+        result = df.groupby('A', as_index=False).transform('mean')
+        expected = grouped.transform('mean')
+        assert_frame_equal(result, expected)
+
+        result = grouped.transform('size')
+        expected = Series(grouped['C'].transform(len).values,
+                          index=df.index)
+        assert_series_equal(result, expected, check_dtype=False)
+
+    def test_transform_dict(self):
+        grouped = self.df.groupby('A')
+        result = grouped.transform({'D': 'sum', 'C': np.mean, 'B': 'count'})
+        expected = DataFrame({'B': grouped['B'].transform('count'),
+                              'C': grouped['C'].transform('mean'),
+                              'D': grouped['D'].transform('sum')},
+                             columns=['B', 'C', 'D'])
+        assert_frame_equal(result, expected)
+
+        self.assertRaises(KeyError, grouped.transform, {'Z': 'sum'})
+
     def test_series_fast_transform_date(self):
         # GH 13191
         df = pd.DataFrame({'grouping': [np.nan, 1, 1, 3],
@@ -2203,6 +2304,22 @@ class TestGroupBy(tm.TestCase):
             check_nunique(frame, ['jim'])
             check_nunique(frame, ['jim', 'joe'])
 
+    def test_frame_groupby_nunique(self):
+        df = DataFrame({'A': list('abbacc'),
+                        'B': list('abxacc'),
+                        'C': [1, 2, np.nan, 1, 2, 2]})
+        g = df.groupby('A')
+
+        for dropna in [True, False]:
+            result = g.nunique(dropna=dropna)
+            expected = DataFrame({'B': g.B.nunique(dropna=dropna),
+                                  'C': g.C.nunique(dropna=dropna)})
+            assert_frame_equal(result, expected)
+
+        expected = DataFrame({'B': [1, 2, 1], 'C': [1, 1, 1]},
+                             index=Index(list('abc'), name='A'))
+        assert_frame_equal(g.nunique(), expected)
+
     def test_series_groupby_value_counts(self):
         from itertools import product
 
@@ -2982,6 +3099,50 @@ class TestGroupBy(tm.TestCase):
         expected = df.take([0, 1, 3, 4, 6, 7])
         assert_frame_equal(result, expected)
 
+    def test_apply_evaluates_groups_once(self):
+        df = DataFrame({'key': [1, 1, 2, 2, 2, 3],
+                        'value': lrange(6)})
+        for func in [lambda x: x.value.sum(), lambda x: x, lambda x: x * 2,
+                     lambda x: x[:1]]:
+            names = []
+
+            def f(x):
+                names.append(x.name)
+                return func(x)
+
+            result = df.groupby('key').apply(f)
+            expected = df.groupby('key').apply(func)
+            self.assertEqual(names, [1, 2, 3])
+            self.assertTrue(result.equals(expected))
+
+        # an error is raised from the group it comes from
+        names = []
+
+        def f(x):
+            names.append(x.name)
+            if x.name == 2:
+                raise KeyError(x.name)
+            return x.value.sum()
+
+        self.assertRaises(KeyError, df.groupby('key').apply, f)
+        self.assertEqual(names, [1, 2, 2])
+
+    def test_apply_engine_processes(self):
+        df = DataFrame({'key': [1, 1, 2, 2, 2, 3],
+                        'value': lrange(6)})
+        grouped = df.groupby('key')
+
+        result = grouped.apply(_top_rows, n=2, engine='processes')
+        expected = grouped.apply(_top_rows, n=2)
+        assert_frame_equal(result, expected)
+
+        result = grouped.value.apply(np.sum, engine='processes')
+        expected = grouped.value.apply(np.sum)
+        assert_series_equal(result, expected)
+
+        self.assertRaises(ValueError, grouped.apply, _top_rows,
+                          engine='threads')
+
     def test_apply_no_name_column_conflict(self):
         df = DataFrame({'name': [1, 1, 1, 1, 1, 1, 2, 2, 2, 2],
                         'name2': [0, 0, 0, 1, 1, 1, 0, 0, 1, 1],
@@ -3228,6 +3389,69 @@ class TestGroupBy(tm.TestCase):
         result = g.idxmax()
         assert_frame_equal(result, expected)
 
+    def test_cummin_cummax(self):
+        df = DataFrame({'A': [1, 1, 1, 1, 2, 2, 2, 2],
+                        'B': [3, 4, 3, 2, 2, 3, 2, 1],
+                        'C': [np.nan, 2., 1., 3., 1., np.nan, 0., 2.]})
+        g = df.groupby('A')
+
+        for method in ['cummin', 'cummax']:
+            result = getattr(g, method)()
+            expected = g[['B', 'C']].apply(lambda x: getattr(x, method)())
+            assert_frame_equal(result, expected, check_dtype=False)
+
+            result = getattr(g.B, method)()
+            expected = g.B.apply(lambda x: getattr(x, method)())
+            assert_series_equal(result, expected)
+
+        expected = DataFrame({'B': [3, 3, 3, 2, 2, 2, 2, 1],
+                              'C': [np.nan, 2., 1., 1., 1., np.nan, 0., 0.]})
+        assert_frame_equal(g.cummin(), expected)
+
+        # nan keys
+        result = df.groupby(Series([1, 1, np.nan, 1, 2, 2, 2, np.nan]))
+        result = result.B.cummax()
+        expected = Series([3, 4, np.nan, 4, 2, 3, 3, np.nan], name='B')
+        assert_series_equal(result, expected)
+
+    def test_any_all_idxmin_idxmax(self):
+        df = DataFrame({'A': [1, 1, 1, 2, 2, 3, 3],
+                        'B': [0, 0, 2, np.nan, np.nan, 1, np.nan],
+                        'C': [False, False, True, True, False, False, True],
+                        'D': ['', 'a', '', '', '', 'b', 'c']},
+                       index=list('abcdefg'))
+        g = df.groupby('A')
+
+        for method in ['any', 'all']:
+            for skipna in [True, False]:
+                result = getattr(g, method)(skipna=skipna)
+                expected = g[['B', 'C', 'D']].apply(
+                    lambda x: getattr(x, method)(skipna=skipna))
+                assert_frame_equal(result, expected.astype(bool))
+
+        expected = DataFrame({'B': [True, False, True],
+                              'C': [True, True, True],
+                              'D': [True, False, True]},
+                             index=Index([1, 2, 3], name='A'),
+                             columns=['B', 'C', 'D'])
+        assert_frame_equal(g.any(), expected)
+
+        for method in ['idxmin', 'idxmax']:
+            for skipna in [True, False]:
+                result = getattr(g[['B']], method)(skipna=skipna)
+                expected = g[['B']].apply(
+                    lambda x: getattr(x, method)(skipna=skipna))
+                assert_frame_equal(result, expected)
+
+                result = getattr(g.B, method)(skipna=skipna)
+                expected = g.B.apply(
+                    lambda x: getattr(x, method)(skipna=skipna))
+                assert_series_equal(result, expected)
+
+        expected = Series(['c', np.nan, 'f'], index=Index([1, 2, 3], name='A'),
+                          name='B')
+        assert_series_equal(g.B.idxmax(), expected)
+
     def test_cython_api2(self):
 
         # this takes the fast apply path
@@ -3906,6 +4130,54 @@ class TestGroupBy(tm.TestCase):
         assert_frame_equal(gr.mean(), aggr(np.mean))
         assert_frame_equal(gr.median(), aggr(np.median))
 
+    def test_groupby_unsorted_multi_key_hashed(self):
+        # sort=False hashes the observed key combinations directly instead of
+        # building (and compressing) the cartesian product of the levels
+        from pandas.core.groupby import (_hash_group_index, get_group_index,
+                                         _compress_group_index,
+                                         _int64_overflow_possible)
+
+        np.random.seed(1234)
+        arr = np.random.randint(-1 << 12, 1 << 12, (1 << 12, 6))
+        arr = np.vstack((arr, arr[np.random.choice(len(arr), 3000)]))
+        arr = arr[np.random.permutation(len(arr))]
+
+        df = DataFrame(arr, columns=list('abcdef'))
+        df.loc[::13, 'c'] = np.nan
+        df['jim'] = np.random.randn(len(df))
+
+        gr = df.groupby(list('abcdef'), sort=False)
+        self.assertTrue(_int64_overflow_possible(gr.grouper.shape))
+
+        result = gr.sum()
+        expected = df.groupby(list('abcdef')).sum()
+        assert_frame_equal(result.sort_index(), expected)
+
+        # groups come out in order of first appearance
+        keys = df[list('abcdef')].dropna().drop_duplicates()
+        exp_index = MultiIndex.from_arrays(
+            [keys[c].values for c in 'abcdef'], names=list('abcdef'))
+        self.assert_index_equal(result.index, exp_index)
+
+        # same ids as the exact (cartesian) method
+        labels = gr.grouper.labels
+        shape = gr.grouper.shape
+        comp_ids, obs_ids = _hash_group_index(labels, shape)
+        group_index = get_group_index(labels, shape, sort=True, xnull=True)
+        exp_ids, exp_obs = _compress_group_index(group_index, sort=False)
+        self.assert_numpy_array_equal(comp_ids, exp_ids)
+        self.assert_numpy_array_equal(obs_ids, exp_obs)
+
+        # no overflow possible
+        df = DataFrame({'a': [1, 2, 1, 2, np.nan, 1],
+                        'b': ['x', 'x', 'y', 'x', 'y', 'x'],
+                        'c': np.arange(6)})
+        result = df.groupby(['b', 'a'], sort=False)['c'].sum()
+        exp_index = MultiIndex.from_tuples([('x', 1.0), ('x', 2.0),
+                                            ('y', 1.0)], names=['b', 'a'])
+        expected = Series([5, 4, 2], index=exp_index, name='c')
+        assert_series_equal(result, expected)
+
     def test_groupby_sort_multi(self):
         df = DataFrame({'a': ['foo', 'bar', 'baz'],
                         'b': [3, 2, 1],
@@ -3982,6 +4254,82 @@ class TestGroupBy(tm.TestCase):
         expected = expected.reindex(result.index)
         assert_series_equal(result, expected)
 
+    def test_rank_cython(self):
+        df = DataFrame({'key': np.random.randint(0, 10, 200),
+                        'a': np.random.randint(0, 8, 200).astype(float),
+                        'b': np.random.randn(200)})
+        df.loc[::7, 'a'] = np.nan
+        g = df.groupby('key')
+
+        for method in ['average', 'min', 'max', 'first', 'dense']:
+            for ascending in [True, False]:
+                for na_option in ['keep', 'top', 'bottom']:
+                    for pct in [True, False]:
+                        kwargs = dict(method=method, ascending=ascending,
+                                      na_option=na_option, pct=pct)
+                        result = g.rank(**kwargs)
+                        expected = g[['a', 'b']].apply(
+                            lambda x: x.rank(**kwargs))
+                        assert_frame_equal(result, expected)
+
+                        result = g['a'].rank(**kwargs)
+                        expected = g['a'].apply(lambda x: x.rank(**kwargs))
+                        assert_series_equal(result, expected)
+
+    def test_rank_cython_inf_and_nan(self):
+        df = DataFrame({'key': [1, 1, 1, 2, 2, 2, 2, 3, 3],
+                        'a': [np.inf, np.nan, np.inf,
+                              -np.inf, np.nan, 1., -np.inf,
+                              np.nan, np.nan]})
+        g = df.groupby('key')
+
+        result = g['a'].rank()
+        expected = Series([1.5, np.nan, 1.5, 1.5, np.nan, 3., 1.5,
+                           np.nan, np.nan], name='a')
+        assert_series_equal(result, expected)
+
+        # a group of NaN alone
+        result = g['a'].rank(pct=True)
+        assert_series_equal(result, expected / [2, 1, 2, 3, 1, 3, 3, 1, 1])
+
+        result = g['a'].rank(ascending=False)
+        expected = Series([1.5, np.nan, 1.5, 2.5, np.nan, 1., 2.5,
+                           np.nan, np.nan], name='a')
+        assert_series_equal(result, expected)
+
+        result = g['a'].rank(na_option='top')
+        expected = Series([2.5, 1., 2.5, 2.5, 1., 4., 2.5, 1.5, 1.5],
+                          name='a')
+        assert_series_equal(result, expected)
+
+        result = g['a'].rank(na_option='bottom')
+        expected = Series([1.5, 3., 1.5, 1.5, 4., 3., 1.5, 1.5, 1.5],
+                          name='a')
+        assert_series_equal(result, expected)
+
+    def test_quantile_cython(self):
+        df = DataFrame({'key': np.random.randint(0, 10, 200),
+                        'a': np.random.randint(0, 8, 200),
+                        'b': np.random.randn(200)})
+        df.loc[::7, 'b'] = np.nan
+        df.loc[df.key == 3, 'b'] = np.nan
+        g = df.groupby('key')
+
+        for interpolation in ['linear', 'lower', 'higher', 'midpoint',
+                              'nearest']:
+            for q in [0, .1, .5, .75, 1]:
+                result = g.quantile(q, interpolation=interpolation)
+                expected = g[['a', 'b']].apply(
+                    lambda x: x.quantile(q, interpolation=interpolation))
+                assert_frame_equal(result, expected, check_dtype=False)
+
+                result = g['a'].quantile(q, interpolation=interpolation)
+                expected = g['a'].apply(
+                    lambda x: x.quantile(q, interpolation=interpolation))
+                assert_series_equal(result, expected)
+
+        self.assertRaises(ValueError, g.quantile, 1.5)
+
     def test_dont_clobber_name_column(self):
         df = DataFrame({'key': ['a', 'a', 'a', 'b', 'b', 'b'],
                         'name': ['foo', 'bar', 'baz'] * 2})
@@ -4101,6 +4449,45 @@ class TestGroupBy(tm.TestCase):
 
         self.assert_index_equal(result.columns, exp_cols)
 
+    def test_agg_multiple_functions_fused(self):
+        # aggregations computed together in one pass match the single ones
+        df = DataFrame({'A': np.random.randint(0, 10, 200),
+                        'B': np.random.randn(200),
+                        'C': np.random.randint(-5, 5, 200),
+                        'D': np.random.randn(200).astype('float32')})
+        df.loc[::3, 'B'] = np.nan
+        df.loc[df.A == 4, 'B'] = np.nan
+        df.loc[df.A == 5, 'B'] = [1.5] + [np.nan] * ((df.A == 5).sum() - 1)
+
+        funcs = ['count', 'sum', 'mean', 'var', 'std', 'sem', 'min', 'max',
+                 'first', 'last']
+        grouped = df.groupby('A')
+        for col in ['B', 'C', 'D']:
+            result = grouped[col].agg(funcs)
+            for f in funcs:
+                assert_series_equal(result[f], getattr(grouped[col], f)(),
+                                    check_names=False)
+
+        result = grouped.agg({'B': ['sum', np.mean, 'max'],
+                              'C': [('lo', 'min'), ('hi', 'max'),
+                                    ('sd', np.std)]})
+        expected = grouped.agg({'B': ['sum', 'mean', 'max'],
+                                'C': [('lo', 'min'), ('hi', 'max'),
+                                      ('sd', 'std')]})
+        assert_frame_equal(result, expected)
+        self.assert_index_equal(result['C'].columns,
+                                Index(['lo', 'hi', 'sd']))
+
+        # unobserved categories
+        cats = Categorical(['a', 'b', 'a'], categories=['a', 'b', 'c'])
+        s = Series([1, 2, 4])
+        result = s.groupby(cats).agg(['sum', 'max', 'count'])
+        expected = DataFrame({'sum': [5, 2, np.nan], 'max': [4, 2, np.nan],
+                              'count': [2, 1, 0]},
+                             index=CategoricalIndex(['a', 'b', 'c']),
+                             columns=['sum', 'max', 'count'])
+        assert_frame_equal(result, expected)
+
     def test_multiple_functions_tuples_and_non_tuples(self):
         # #1359
 
@@ -6260,7 +6647,7 @@ class TestGroupBy(tm.TestCase):
              'cumprod', 'tail', 'resample', 'cummin', 'fillna', 'cumsum',
              'cumcount', 'all', 'shift', 'skew', 'bfill', 'ffill', 'take',
              'tshift', 'pct_change', 'any', 'mad', 'corr', 'corrwith', 'cov',
-             'dtypes', 'ndim', 'diff', 'idxmax', 'idxmin',
+             'dtypes', 'ndim', 'diff', 'idxmax', 'idxmin', 'nunique',
              'ffill', 'bfill', 'pad', 'backfill', 'rolling', 'expanding'])
         self.assertEqual(results, expected)
 
@@ -7008,6 +7395,51 @@ class TestGroupBy(tm.TestCase):
 
         assert_frame_equal(result, expected)
 
+    def test_agg_num_threads(self):
+        np.random.seed(1234)
+        n = 1000
+        df = DataFrame({'key': np.random.randint(0, 50, size=n),
+                        'a': np.random.randn(n),
+                        'b': np.random.randn(n),
+                        'c': np.random.randint(0, 100, size=n)})
+        df.loc[::7, 'a'] = np.nan
+        df.loc[df['key'] == 3, 'a'] = np.nan
+        grouped = df.groupby('key')
+
+        for how in ['sum', 'prod', 'min', 'max', 'mean', 'var',
+                    'first', 'last']:
+            # split by column ranges
+            expected = grouped.agg(how)
+            result = grouped.agg(how, num_threads=3)
+            assert_frame_equal(result, expected)
+
+            # split by row partitions
+            expected = grouped['a'].agg(how)
+            result = grouped['a'].agg(how, num_threads=3)
+            assert_series_equal(result, expected)
+
+            with option_context('compute.num_threads', 4):
+                result = getattr(grouped['a'], how)()
+            assert_series_equal(result, expected)
+
+        expected = grouped.cumsum()
+        with option_context('compute.num_threads', 2):
+            result = grouped.cumsum()
+        assert_frame_equal(result, expected)
+
+        # more threads than rows
+        small = df.head(3).groupby('key')
+        assert_frame_equal(small.agg('sum', num_threads=8),
+                           small.agg('sum'))
+
+        self.assertRaises(ValueError, grouped.agg, 'sum', num_threads='a')
+
+
+def _top_rows(df, n=1):
+    # module level, so that worker processes can unpickle it
+    return df.sort_values('value', ascending=False).head(n).assign(
+        group=df.name)
+
 
 def assert_fp_equal(a, b):
     assert (np.abs(a - b) < 1e-12).all()
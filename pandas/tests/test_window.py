@@ -11,7 +11,7 @@ from distutils.version import LooseVersion
 
 import pandas as pd
 from pandas import (Series, DataFrame, Panel, bdate_range, isnull,
-                    notnull, concat, Timestamp)
+                    notnull, concat, Timestamp, MultiIndex)
 import pandas.stats.moments as mom
 import pandas.core.window as rwindow
 import pandas.tseries.offsets as offsets
@@ -1025,6 +1025,30 @@ class TestMoments(Base):
 
             self._check_moment_func(f, alt, name='quantile', quantile=q)
 
+    def test_rolling_quantile_list(self):
+        qs = [.05, .25, .5, .75, .95]
+
+        for kwargs in [dict(window=20), dict(window=20, min_periods=5),
+                       dict(window=20, center=True)]:
+            result = self.series.rolling(**kwargs).quantile(qs)
+            expected = DataFrame(
+                dict((q, self.series.rolling(**kwargs).quantile(q))
+                     for q in qs), columns=qs)
+            tm.assert_frame_equal(result, expected)
+
+            frame = self.frame.iloc[:, :3]
+            result = frame.rolling(**kwargs).quantile(qs)
+            expected = concat(
+                [frame.rolling(**kwargs).quantile(q) for q in qs], axis=1,
+                keys=qs).swaplevel(0, 1, axis=1)
+            expected = expected[MultiIndex.from_product([frame.columns, qs])]
+            tm.assert_frame_equal(result, expected)
+
+        result = self.frame.expanding().quantile([.5])
+        expected = self.frame.expanding().quantile(.5)
+        expected.columns = MultiIndex.from_product([expected.columns, [.5]])
+        tm.assert_frame_equal(result, expected)
+
     def test_rolling_apply(self):
         # suppress warnings about empty slices, as we are deliberately testing
         # with a 0-length Series
@@ -1056,6 +1080,35 @@ class TestMoments(Base):
         result = s.rolling(2, min_periods=0).apply(len)
         tm.assert_series_equal(result, expected)
 
+    def test_rolling_apply_batch(self):
+        f = lambda x: x[np.isfinite(x)].mean()
+
+        def batch_f(x):
+            self.assertEqual(x.ndim, 2)
+            self.assertFalse(x.flags.writeable)
+            return np.nanmean(x, axis=1)
+
+        for window, min_periods, center in product([3, 10, 500], [None, 3],
+                                                   [False, True]):
+            r = self.frame.rolling(window, min_periods=min_periods,
+                                   center=center)
+            with np.errstate(all='ignore'):
+                tm.assert_frame_equal(r.apply(batch_f, batch=True),
+                                      r.apply(f))
+
+        ser = self.series.copy()
+        ser.index = pd.date_range('20130101', periods=len(ser), freq='s')
+        ser = ser[np.random.rand(len(ser)) > 0.3]
+        for r in [ser.rolling('20s'), ser.rolling('20s', center=True),
+                  ser.expanding(5)]:
+            with np.errstate(all='ignore'):
+                tm.assert_series_equal(r.apply(batch_f, batch=True),
+                                       r.apply(f))
+
+        # one value per window
+        self.assertRaises(ValueError, self.series.rolling(5).apply,
+                          lambda x: x.sum(), batch=True)
+
     def test_rolling_apply_out_of_bounds(self):
         # #1850
         arr = np.arange(4)
@@ -1131,6 +1184,66 @@ class TestMoments(Base):
         self._check_moment_func(mom.rolling_kurt,
                                 lambda x: kurtosis(x, bias=False), name='kurt')
 
+    def test_rolling_frame_2d(self):
+        # the columns of a block are rolled together, matching the
+        # result of rolling each column on its own
+        frame = self.frame.copy()
+        frame.iloc[::7, 1] = np.nan
+        frame.iloc[3, 2] = np.inf
+
+        for name in ['sum', 'mean', 'var', 'std', 'skew', 'kurt', 'count']:
+            for kwargs in [dict(window=10), dict(window=10, min_periods=3),
+                           dict(window=10, center=True),
+                           dict(window=len(frame) + 5, min_periods=1)]:
+                result = getattr(frame.rolling(**kwargs), name)()
+                expected = DataFrame(
+                    dict((c, getattr(frame[c].rolling(**kwargs), name)())
+                         for c in frame), columns=frame.columns)
+                tm.assert_frame_equal(result, expected)
+
+            result = getattr(frame.rolling('20D'), name)()
+            expected = DataFrame(
+                dict((c, getattr(frame[c].rolling('20D'), name)())
+                     for c in frame), columns=frame.columns)
+            tm.assert_frame_equal(result, expected)
+
+            if name == 'count':
+                continue
+            result = getattr(frame.rolling(3, axis=1), name)()
+            expected = DataFrame(
+                dict((i, getattr(frame.loc[i].rolling(3), name)())
+                     for i in frame.index), columns=frame.index).T
+            tm.assert_frame_equal(result, expected)
+
+    def test_rolling_update(self):
+        frame = self.frame.copy()
+        frame.iloc[::9, 0] = np.nan
+        parts = [frame.iloc[:20], frame.iloc[20:21], frame.iloc[21:60],
+                 frame.iloc[60:]]
+
+        for kwargs in [dict(window=10), dict(window=10, min_periods=3),
+                       dict(window=1), dict(window='15D')]:
+            for name in ['sum', 'mean', 'std', 'count', 'max', 'median']:
+                rolling = parts[0].rolling(**kwargs)
+                results = [getattr(rolling, name)()]
+                for part in parts[1:]:
+                    results.append(getattr(rolling.update(part), name)())
+                expected = getattr(frame.rolling(**kwargs), name)()
+                tm.assert_frame_equal(concat(results), expected)
+
+                rolling = parts[0][0].rolling(**kwargs)
+                results = [getattr(rolling, name)()]
+                for part in parts[1:]:
+                    results.append(getattr(rolling.update(part[0]), name)())
+                expected = getattr(frame[0].rolling(**kwargs), name)()
+                tm.assert_series_equal(concat(results), expected)
+
+        rolling = parts[0].rolling('15D').update(parts[2])
+        self.assertRaises(ValueError, rolling.update, parts[1])
+        self.assertRaises(NotImplementedError, rolling.cov)
+        self.assertRaises(NotImplementedError,
+                          parts[0].rolling(3, center=True).update, parts[1])
+
     def test_fperr_robustness(self):
         # TODO: remove this once python 2.5 out of picture
         if PY3:
@@ -1403,6 +1516,92 @@ class TestMoments(Base):
             result = f(s)
             tm.assert_series_equal(result, expected)
 
+    def test_ewm_update(self):
+        frame = self.frame.copy()
+        frame.iloc[::9, 0] = np.nan
+        parts = [frame.iloc[:20], frame.iloc[20:21], frame.iloc[21:60],
+                 frame.iloc[60:]]
+
+        for kwargs in [dict(halflife=5), dict(span=10, adjust=False),
+                       dict(com=3, ignore_na=True, min_periods=4)]:
+            ewm = parts[0].ewm(**kwargs)
+            means, stds = [ewm.mean()], [ewm.std()]
+            for part in parts[1:]:
+                ewm.update(part)
+                means.append(ewm.mean())
+                stds.append(ewm.std())
+            tm.assert_frame_equal(concat(means), frame.ewm(**kwargs).mean())
+            tm.assert_frame_equal(concat(stds), frame.ewm(**kwargs).std())
+
+            # a function not computed after an update is carried over
+            ewm = parts[0].ewm(**kwargs)
+            ewm.mean()
+            result = ewm.update(parts[1]).update(parts[2]).mean()
+            tm.assert_frame_equal(result,
+                                  frame.ewm(**kwargs).mean().iloc[21:60])
+            self.assertRaises(ValueError, ewm.var)
+
+        # a column selected after an update resumes the frame's state
+        ewm = parts[0].ewm(halflife=5)
+        ewm.mean()
+        ewm.update(parts[1])
+        tm.assert_series_equal(ewm[0].mean(),
+                               frame[0].ewm(halflife=5).mean().iloc[20:21])
+        tm.assert_frame_equal(ewm.mean(),
+                              frame.ewm(halflife=5).mean().iloc[20:21])
+
+        ewm = self.series.iloc[:50].ewm(com=2)
+        ewm.mean()
+        result = ewm.update(self.series.iloc[50:]).mean()
+        expected = self.series.ewm(com=2).mean().iloc[50:]
+        tm.assert_series_equal(result, expected)
+        self.assertRaises(NotImplementedError, ewm.cov)
+
+    def test_ewm_times(self):
+        # regularly spaced times give the weights of the number of rows
+        frame = self.frame.copy()
+        frame.iloc[::7, 0] = np.nan
+        times = pd.date_range('2000', periods=len(frame), freq='D')
+        result = frame.ewm(halflife='5D', times=times)
+        expected = frame.ewm(halflife=5)
+        for how in ['mean', 'var', 'std']:
+            tm.assert_frame_equal(getattr(result, how)(),
+                                  getattr(expected, how)())
+        for how in ['cov', 'corr']:
+            tm.assert_panel_equal(getattr(result, how)(),
+                                  getattr(expected, how)())
+        tm.assert_series_equal(
+            frame[0].ewm(halflife='5D', times=times).cov(frame[1]),
+            frame[0].ewm(halflife=5).cov(frame[1]))
+
+        # irregularly spaced times
+        times = pd.to_datetime(np.cumsum(np.random.randint(0, 100, 50)),
+                               unit='s')
+        s = self.series.iloc[:50]
+        result = s.ewm(halflife='30s', times=times).mean()
+        elapsed = (times.asi8 / 1e9)[:, None] - times.asi8[None, :] / 1e9
+        weights = np.tril(0.5 ** (elapsed / 30.))
+        weights[:, np.isnan(s.values)] = 0
+        values = np.nan_to_num(s.values)
+        expected = Series(weights.dot(values) / weights.sum(axis=1),
+                          index=s.index).where(s.notnull().cumsum() > 0)
+        tm.assert_series_equal(result, expected)
+
+        # resumed over the following times
+        ewm = s.iloc[:20].ewm(halflife='30s', times=times[:20])
+        ewm.mean()
+        result = ewm.update(s.iloc[20:], times=times[20:]).mean()
+        tm.assert_series_equal(result, expected.iloc[20:])
+        self.assertRaises(ValueError, ewm.update, s)
+
+        self.assertRaises(ValueError, s.ewm, halflife=5, times=times)
+        self.assertRaises(ValueError, s.ewm, com=5, times=times)
+        self.assertRaises(ValueError, s.ewm, halflife='5s')
+        self.assertRaises(ValueError, s.ewm, halflife='5s', times=times[::-1])
+        self.assertRaises(ValueError, s.ewm, halflife='5s', times=times[:5])
+        self.assertRaises(NotImplementedError, s.ewm, halflife='5s',
+                          times=times, adjust=False)
+
     def test_ewma_nan_handling(self):
         s = Series([1.] + [np.nan] * 5 + [1.])
         result = s.ewm(com=5).mean()
@@ -2185,6 +2384,34 @@ class TestMomentsConsistency(Base):
         self._check_pairwise_moment('rolling', 'corr', window=10,
                                     min_periods=5)
 
+    def test_rolling_pairwise_all_pairs(self):
+        # all of the pairs, rolled together, equal the moments of each pair
+        frame = self.frame.iloc[:, :4].copy()
+        frame.iloc[::7, 0] = np.nan
+        frame.iloc[20:40, 1] = np.nan
+        frame[2] = 1.
+        other = DataFrame(randn(len(frame), 3), index=frame.index)
+        other.iloc[::3, 2] = np.nan
+
+        for kwargs in [dict(window=10), dict(window=10, min_periods=3),
+                       dict(window=7, center=True), dict(window=1)]:
+            for name in ['cov', 'corr']:
+                for obj2 in [None, other, other.iloc[10:]]:
+                    r = frame.rolling(**kwargs)
+                    result = getattr(r, name)(obj2, pairwise=True)
+                    obj2 = frame if obj2 is None else obj2
+                    for i, j in product(range(frame.shape[1]),
+                                        range(obj2.shape[1])):
+                        expected = getattr(frame.iloc[:, i].rolling(**kwargs),
+                                           name)(obj2.iloc[:, j])
+                        tm.assert_series_equal(result.iloc[:, i, j],
+                                               expected, check_names=False)
+
+        result = frame.expanding(min_periods=5).cov(other, pairwise=True)
+        expected = frame[3].expanding(min_periods=5).cov(other[1])
+        tm.assert_series_equal(result.iloc[:, 3, 1], expected,
+                               check_names=False)
+
     def _check_pairwise_moment(self, dispatch, name, **kwargs):
         def get_result(obj, obj2=None):
             return getattr(getattr(obj, dispatch)(**kwargs), name)(obj2)
@@ -3073,6 +3300,56 @@ class TestGrouperGrouping(tm.TestCase):
         expected = g.apply(lambda x: x.expanding().apply(lambda y: y.sum()))
         tm.assert_frame_equal(result, expected)
 
+    def test_unsorted_groups(self):
+        # the windows of interleaved groups are computed in one pass over
+        # the data sorted by group
+        np.random.seed(1234)
+        df = DataFrame({'A': np.random.choice(['a', 'b', 'c', np.nan], 200),
+                        'B': np.random.randint(0, 3, 200),
+                        'C': np.random.randn(200) * 1e6})
+        df.loc[::5, 'C'] = np.nan
+
+        for keys in ['A', ['A', 'B']]:
+            for sort in [True, False]:
+                g = df.groupby(keys, sort=sort)
+                for f in ['sum', 'mean', 'min', 'max', 'count', 'median',
+                          'var', 'std', 'skew', 'kurt']:
+                    result = getattr(g.C.rolling(4, min_periods=2), f)()
+                    expected = g.C.apply(
+                        lambda x: getattr(x.rolling(4, min_periods=2), f)())
+                    tm.assert_series_equal(result, expected)
+
+                    result = getattr(g.C.expanding(), f)()
+                    expected = g.C.apply(
+                        lambda x: getattr(x.expanding(), f)())
+                    tm.assert_series_equal(result, expected)
+
+                result = g.C.rolling(3).quantile(0.25)
+                expected = g.C.apply(lambda x: x.rolling(3).quantile(0.25))
+                tm.assert_series_equal(result, expected)
+
+                result = g.C.rolling(3).apply(np.nanmax)
+                expected = g.C.apply(lambda x: x.rolling(3).apply(np.nanmax))
+                tm.assert_series_equal(result, expected)
+
+    def test_rolling_offset_window(self):
+        df = DataFrame({'A': list('abbabaab'),
+                        'B': [1., 2., np.nan, 4., 5., 6., 7., 8.]},
+                       index=pd.to_datetime(['20130101 09:00:00',
+                                             '20130101 09:00:01',
+                                             '20130101 09:00:03',
+                                             '20130101 09:00:04',
+                                             '20130101 09:00:05',
+                                             '20130101 09:00:08',
+                                             '20130101 09:00:09',
+                                             '20130101 09:00:10']))
+        g = df.groupby('A')
+
+        for f in ['sum', 'mean', 'max', 'count', 'median']:
+            result = getattr(g.B.rolling('3s'), f)()
+            expected = g.B.apply(lambda x: getattr(x.rolling('3s'), f)())
+            tm.assert_series_equal(result, expected)
+
 
 class TestRollingTS(tm.TestCase):
 
@@ -3129,9 +3406,14 @@ class TestRollingTS(tm.TestCase):
             with self.assertRaises(ValueError):
                 df.rolling(window='1D', min_periods=minp)
 
-        # center is not implemented
-        with self.assertRaises(NotImplementedError):
-            df.rolling(window='1D', center=True)
+        # closed is only implemented for offset based windows
+        for closed in ['left', 'foo']:
+            with self.assertRaises(ValueError):
+                df.rolling(window=2, closed=closed)
+        with self.assertRaises(ValueError):
+            df.rolling(window='1D', closed='foo')
+        for closed in ['right', 'left', 'both', 'neither']:
+            df.rolling(window='1D', closed=closed)
 
     def test_on(self):
 
@@ -3616,3 +3898,74 @@ class TestRollingTS(tm.TestCase):
                 agg_by_day).reset_index(level=0, drop=True)
 
             tm.assert_frame_equal(result, expected)
+
+    def test_closed(self):
+
+        df = self.ragged
+        for closed, values in [('right', [0.0, 1, 3, 3, 7]),
+                               ('left', [np.nan, 0, 1, 2, 3]),
+                               ('both', [0.0, 1, 3, 5, 7]),
+                               ('neither', [np.nan, np.nan, 1, np.nan, 3])]:
+            result = df.rolling('2s', closed=closed).sum()
+            expected = df.copy()
+            expected['B'] = values
+            tm.assert_frame_equal(result, expected)
+
+            result = df.rolling('2s', closed=closed).apply(np.sum)
+            tm.assert_frame_equal(result, expected)
+
+        # the rows still falling in the window are kept by an update
+        r = df.iloc[:3].rolling('2s', closed='both')
+        result = r.update(df.iloc[3:]).sum()
+        tm.assert_frame_equal(result, df.rolling('2s', closed='both').sum(
+        ).iloc[3:])
+
+    def test_center(self):
+
+        df = self.ragged
+        result = df.rolling('2s', center=True).sum()
+        expected = df.copy()
+        expected['B'] = [0.0, 3, 2, 7, 4]
+        tm.assert_frame_equal(result, expected)
+
+        # a centered window of 5 seconds over 1 second data holds the same
+        # rows as a centered window of 5 observations
+        df = DataFrame({'B': randn(20)},
+                       index=pd.date_range('20130101', periods=20, freq='s'))
+        df.iloc[[3, 8, 9]] = np.nan
+        r = df.rolling('5s', center=True)
+        er = df.rolling(5, center=True, min_periods=1)
+
+        for f in ['sum', 'mean', 'count', 'median', 'std',
+                  'var', 'kurt', 'skew', 'min', 'max']:
+
+            result = getattr(r, f)()
+            expected = getattr(er, f)()
+            tm.assert_frame_equal(result, expected)
+
+        tm.assert_frame_equal(r.quantile(0.5), er.quantile(0.5))
+        tm.assert_frame_equal(r.quantile([0.5]), er.quantile([0.5]))
+        tm.assert_frame_equal(r.apply(np.nansum), er.apply(np.nansum))
+
+        s = df['B']
+        other = Series(randn(20), index=s.index)
+        tm.assert_series_equal(
+            s.rolling('5s', center=True).cov(other),
+            s.rolling(5, center=True, min_periods=1).cov(other))
+        tm.assert_series_equal(
+            s.rolling('5s', center=True).corr(other),
+            s.rolling(5, center=True, min_periods=1).corr(other))
+
+    def test_cov_corr(self):
+
+        # the windows of cov and corr span the offset, rather than as many
+        # observations as there are nanoseconds in it
+        df = DataFrame({'B': randn(50), 'C': randn(50)},
+                       index=pd.date_range('20130101', periods=50, freq='s'))
+        r = df.rolling('5s')
+        er = df.rolling(5, min_periods=1)
+
+        tm.assert_series_equal(r.B.cov(df.C), er.B.cov(df.C))
+        tm.assert_series_equal(r.B.corr(df.C), er.B.corr(df.C))
+        tm.assert_panel_equal(r.cov(), er.cov())
+        tm.assert_panel_equal(r.corr(), er.corr())
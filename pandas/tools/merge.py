@@ -21,15 +21,18 @@ from pandas.types.common import (is_datetime64tz_dtype,
                                  is_int64_dtype,
                                  is_integer_dtype,
                                  is_float_dtype,
+                                 is_numeric_dtype,
+                                 is_bool_dtype,
                                  is_integer,
                                  is_int_or_datetime_dtype,
                                  is_dtype_equal,
                                  is_bool,
                                  is_list_like,
                                  _ensure_int64,
+                                 _ensure_platform_int,
                                  _ensure_float64,
                                  _ensure_object)
-from pandas.types.missing import na_value_for_dtype
+from pandas.types.missing import na_value_for_dtype, isnull
 
 from pandas.core.generic import NDFrame
 from pandas.core.index import (_get_combined_index,
@@ -37,25 +40,29 @@ from pandas.core.index import (_get_combined_index,
                                _all_indexes_same)
 from pandas.core.internals import (items_overlap_with_suffix,
                                    concatenate_block_managers)
-from pandas.util.decorators import Appender, Substitution
+from pandas.util.decorators import Appender, Substitution, cache_readonly
 
 import pandas.core.algorithms as algos
 import pandas.core.common as com
 import pandas.types.concat as _concat
 
 import pandas._join as _join
+import pandas.algos as _algos
 import pandas.hashtable as _hash
+import pandas.tslib as tslib
 
 
 @Substitution('\nleft : DataFrame')
 @Appender(_merge_doc, indents=0)
 def merge(left, right, how='inner', on=None, left_on=None, right_on=None,
           left_index=False, right_index=False, sort=False,
-          suffixes=('_x', '_y'), copy=True, indicator=False):
+          suffixes=('_x', '_y'), copy=True, indicator=False,
+          num_threads=None):
     op = _MergeOperation(left, right, how=how, on=on, left_on=left_on,
                          right_on=right_on, left_index=left_index,
                          right_index=right_index, sort=sort, suffixes=suffixes,
-                         copy=copy, indicator=indicator)
+                         copy=copy, indicator=indicator,
+                         num_threads=num_threads)
     return op.get_result()
 if __debug__:
     merge.__doc__ = _merge_doc % '\nleft : DataFrame'
@@ -263,13 +270,16 @@ def merge_asof(left, right, on=None,
                by=None, left_by=None, right_by=None,
                suffixes=('_x', '_y'),
                tolerance=None,
-               allow_exact_matches=True):
+               allow_exact_matches=True,
+               direction='backward'):
     """Perform an asof merge. This is similar to a left-join except that we
     match on nearest key rather than equal keys.
 
     For each row in the left DataFrame, we select the last row in the right
-    DataFrame whose 'on' key is less than or equal to the left's key. Both
-    DataFrames must be sorted by the key.
+    DataFrame whose 'on' key is less than or equal to the left's key, or
+    with 'direction' the first row whose key is greater than or equal to
+    it, or the nearest of the two. Both DataFrames must be sorted by the
+    key.
 
     Optionally perform group-wise merge. This searches for the nearest match
     on the 'on' key within the same group according to 'by'.
@@ -299,16 +309,20 @@ def merge_asof(left, right, on=None,
 
         .. versionadded:: 0.19.2
 
-    by : column name
-        Group both the left and right DataFrames by the group column; perform
-        the merge operation on these pieces and recombine.
-    left_by : column name
-        Field name to group by in the left DataFrame.
+    by : column name or list of column names
+        Group both the left and right DataFrames by the group columns;
+        perform the merge operation on these pieces and recombine.
+
+        .. versionchanged:: 0.20.0
+           Several columns, of any dtype, can be grouped by
+
+    left_by : column name or list of column names
+        Field names to group by in the left DataFrame.
 
         .. versionadded:: 0.19.2
 
-    right_by : column name
-        Field name to group by in the right DataFrame.
+    right_by : column name or list of column names
+        Field names to group by in the right DataFrame.
 
         .. versionadded:: 0.19.2
 
@@ -325,6 +339,17 @@ def merge_asof(left, right, on=None,
         - If False, don't match the same 'on' value
           (i.e., stricly less-than)
 
+    direction : {'backward', 'forward', 'nearest'}, default 'backward'
+
+        - backward: match the last row whose 'on' key is less than or
+          equal to the left's key
+        - forward: match the first row whose 'on' key is greater than or
+          equal to the left's key
+        - nearest: match the closer of those two rows, the backward one
+          when they are as close
+
+        .. versionadded:: 0.20.0
+
     Returns
     -------
     merged : DataFrame
@@ -357,6 +382,18 @@ def merge_asof(left, right, on=None,
     1   5        b        3.0
     2  10        c        7.0
 
+    >>> pd.merge_asof(left, right, on='a', direction='forward')
+        a left_val  right_val
+    0   1        a        1.0
+    1   5        b        6.0
+    2  10        c        NaN
+
+    >>> pd.merge_asof(left, right, on='a', direction='nearest')
+        a left_val  right_val
+    0   1        a          1
+    1   5        b          6
+    2  10        c          7
+
     For this example, we can achieve a similar result thru
     ``pd.merge_ordered()``, though its not nearly as performant.
 
@@ -465,10 +502,253 @@ def merge_asof(left, right, on=None,
                     by=by, left_by=left_by, right_by=right_by,
                     suffixes=suffixes,
                     how='asof', tolerance=tolerance,
-                    allow_exact_matches=allow_exact_matches)
+                    allow_exact_matches=allow_exact_matches,
+                    direction=direction)
+    return op.get_result()
+
+
+def merge_intervals(left, right, left_on=None, right_start=None,
+                    right_end=None, left_start=None, left_end=None,
+                    by=None, left_by=None, right_by=None,
+                    how='inner', closed='left', suffixes=('_x', '_y')):
+    """Perform an interval merge. This is similar to a merge except that we
+    match the rows of right whose interval contains the key of a left row,
+    or overlaps its interval, rather than equal keys.
+
+    Each left row is matched with every right row whose interval, from
+    'right_start' to 'right_end', contains its 'left_on' key. Given
+    'left_start' and 'left_end' instead, left rows are matched with every
+    right row whose interval overlaps theirs.
+
+    Optionally perform group-wise merge. This only matches rows within the
+    same group according to 'by'.
+
+    .. versionadded:: 0.20.0
+
+    Parameters
+    ----------
+    left : DataFrame
+    right : DataFrame
+    left_on : label
+        Field name of the keys in the left DataFrame. Must be a numeric
+        column, such as datetimelike, integer, or float. left_on or
+        left_start/left_end must be given.
+    right_start : label
+        Field name of the start of the intervals in the right DataFrame
+    right_end : label
+        Field name of the end of the intervals in the right DataFrame
+    left_start : label
+        Field name of the start of the intervals in the left DataFrame
+    left_end : label
+        Field name of the end of the intervals in the left DataFrame
+    by : column name or list of column names
+        Only match rows with equal values of these columns
+    left_by : column name or list of column names
+        Field names to match on in the left DataFrame
+    right_by : column name or list of column names
+        Field names to match on in the right DataFrame
+    how : {'inner', 'left'}, default 'inner'
+
+        - inner: only keep the left rows matching an interval
+        - left: keep every left row, with missing values for the right
+          columns of those matching no interval
+
+    closed : {'left', 'right', 'both', 'neither'}, default 'left'
+        Whether the intervals contain their start, their end, both or
+        neither. With left_start and left_end, the overlap of intervals
+        closed on one side at most must be longer than a point.
+    suffixes : 2-length sequence (tuple, list, ...)
+        Suffix to apply to overlapping column names in the left and right
+        side, respectively
+
+    Returns
+    -------
+    merged : DataFrame
+        The rows of left, in order, each followed by its matches in the
+        order of right
+
+    Notes
+    -----
+    Keys and intervals with a missing value never match, nor do intervals
+    ending before their start. The intervals of each side are sorted then
+    matched in a single sweep, which takes O(n log n + m log m) plus the
+    size of the result for n left and m right rows.
+
+    Examples
+    --------
+    >>> left
+       t   a
+    0  1  a1
+    1  5  a2
+    2  9  a3
+
+    >>> right
+       start  end   b
+    0      0    5  b1
+    1      4    8  b2
+    2      8   10  b3
+
+    >>> pd.merge_intervals(left, right, left_on='t',
+    ...                    right_start='start', right_end='end')
+       t   a  start  end   b
+    0  1  a1      0    5  b1
+    1  5  a2      4    8  b2
+    2  9  a3      8   10  b3
+
+    >>> pd.merge_intervals(left, right, left_on='t',
+    ...                    right_start='start', right_end='end',
+    ...                    closed='both')
+       t   a  start  end   b
+    0  1  a1      0    5  b1
+    1  5  a2      0    5  b1
+    2  5  a2      4    8  b2
+    3  9  a3      8   10  b3
+
+    Overlapping intervals
+
+    >>> spans
+       first  last  c
+    0      3     4  c1
+    1      6    12  c2
+
+    >>> pd.merge_intervals(spans, right, left_start='first',
+    ...                    left_end='last', right_start='start',
+    ...                    right_end='end')
+       first  last   c  start  end   b
+    0      3     4  c1      0    5  b1
+    1      6    12  c2      4    8  b2
+    2      6    12  c2      8   10  b3
+
+    See also
+    --------
+    merge
+    merge_asof
+
+    """
+    op = _IntervalMerge(left, right, left_on=left_on,
+                        left_start=left_start, left_end=left_end,
+                        right_start=right_start, right_end=right_end,
+                        by=by, left_by=left_by, right_by=right_by,
+                        how=how, closed=closed, suffixes=suffixes)
     return op.get_result()
 
 
+def merge_iter(left_chunks, right, how='inner', on=None, left_on=None,
+               right_on=None, sort=False, suffixes=('_x', '_y'), copy=True,
+               indicator=False):
+    """
+    Merge each DataFrame of a sequence, such as the chunks of a
+    ``read_csv(chunksize=...)`` reader, ``HDFStore.select(iterator=True)``
+    or ``read_sql(chunksize=...)``, with the same right DataFrame, yielding
+    the merged chunks.
+
+    The keys of right are hashed once, as by a ``PreparedJoin``, and only
+    one chunk is held in memory at a time, so that data larger than memory
+    can be joined with a table that fits in it.
+
+    .. versionadded:: 0.20.0
+
+    Parameters
+    ----------
+    left_chunks : iterable of DataFrames
+    right : DataFrame
+    how : {'inner', 'left'}, default 'inner'
+        The merges a chunk at a time give the same rows as a single merge
+    on : label or list
+        Field names to join on. Must be found in both DataFrames. If on,
+        left_on and right_on are all None, the columns in common with the
+        first chunk are joined on.
+    left_on : label or list
+        Field names to join on in the left chunks
+    right_on : label or list
+        Field names to join on in the right DataFrame
+    sort : boolean, default False
+        Sort the join keys of each chunk lexicographically
+    suffixes : 2-length sequence (tuple, list, ...)
+        Suffix to apply to overlapping column names in the left and right
+        side, respectively
+    copy : boolean, default True
+    indicator : boolean or string, default False
+        Add a column of the source of each row, as in ``merge``
+
+    Returns
+    -------
+    merged : generator of DataFrames
+        The merge of each chunk with right
+
+    Notes
+    -----
+    With ``how='left'``, the integer and boolean columns of right are cast
+    to float and object in every merged chunk, as if the chunk had rows
+    without a match, so that all of them have the same dtypes.
+
+    See also
+    --------
+    merge
+    PreparedJoin
+
+    Examples
+    --------
+    >>> reader = pd.read_csv('sales.csv', chunksize=100000)
+    >>> for chunk in pd.merge_iter(reader, products, on='product_id',
+    ...                            how='left'):
+    ...     chunk.to_csv('enriched.csv', mode='a', header=False)
+    """
+    if how not in ('inner', 'left'):
+        raise MergeError("how must be 'inner' or 'left', "
+                         "passed {0!r}".format(how))
+    if not isinstance(right, DataFrame):
+        raise ValueError(
+            'can not merge DataFrame with instance of '
+            'type {0}'.format(type(right)))
+
+    if on is not None:
+        if left_on is not None or right_on is not None:
+            raise MergeError('Can only pass argument "on" OR "left_on" '
+                             'and "right_on", not a combination of both.')
+        left_on = right_on = on
+    elif (left_on is None) != (right_on is None):
+        raise MergeError('Must pass both left_on and right_on')
+
+    prepared = PreparedJoin(right, right_on) if right_on is not None else None
+    return _merge_chunks(left_chunks, prepared, right, how=how,
+                         left_on=left_on, sort=sort, suffixes=suffixes,
+                         copy=copy, indicator=indicator)
+
+
+def _merge_chunks(left_chunks, prepared, right, how='inner', left_on=None,
+                  **kwargs):
+    # the merges of merge_iter, preparing right on the columns in common
+    # with the first chunk if it wasn't given any
+    for chunk in left_chunks:
+        if prepared is None:
+            common_cols = chunk.columns.intersection(right.columns)
+            if len(common_cols) == 0:
+                raise MergeError('No common columns to perform merge on')
+            left_on = list(common_cols)
+            prepared = PreparedJoin(right, left_on)
+
+        op = _PreparedMergeOperation(prepared, chunk, how=how,
+                                     left_on=left_on, **kwargs)
+        result = op.get_result()
+
+        if how == 'left':
+            # the right columns as they are with missing values
+            lsuf, rsuf = op.suffixes
+            _, rlabels = items_overlap_with_suffix(op.left.columns, lsuf,
+                                                   op.right.columns, rsuf)
+            for name, dtype in zip(rlabels, op.right.dtypes):
+                if name not in result:
+                    continue
+                if is_integer_dtype(dtype):
+                    result[name] = result[name].astype(np.float64,
+                                                       copy=False)
+                elif is_bool_dtype(dtype):
+                    result[name] = result[name].astype(object, copy=False)
+
+        yield result
+
+
 # TODO: transformations??
 # TODO: only copy DataFrames when modification necessary
 class _MergeOperation(object):
@@ -481,7 +761,8 @@ class _MergeOperation(object):
     def __init__(self, left, right, how='inner', on=None,
                  left_on=None, right_on=None, axis=1,
                  left_index=False, right_index=False, sort=True,
-                 suffixes=('_x', '_y'), copy=True, indicator=False):
+                 suffixes=('_x', '_y'), copy=True, indicator=False,
+                 num_threads=None):
         self.left = self.orig_left = left
         self.right = self.orig_right = right
         self.how = how
@@ -499,6 +780,7 @@ class _MergeOperation(object):
         self.right_index = right_index
 
         self.indicator = indicator
+        self.num_threads = com._get_num_threads(num_threads)
 
         if isinstance(self.indicator, compat.string_types):
             self.indicator_name = self.indicator
@@ -684,12 +966,22 @@ class _MergeOperation(object):
                 else:
                     result.insert(i, name or 'key_%d' % i, key_col)
 
+    @cache_readonly
+    def _sorted_join_keys(self):
+        return _get_sorted_join_keys(self.left_join_keys,
+                                     self.right_join_keys)
+
     def _get_join_indexers(self):
         """ return the join indexers """
+        if self._sorted_join_keys is not None:
+            lkeys, rkeys = self._sorted_join_keys
+            return _get_merge_join_indexers(lkeys, rkeys, sort=self.sort,
+                                            how=self.how)
         return _get_join_indexers(self.left_join_keys,
                                   self.right_join_keys,
                                   sort=self.sort,
-                                  how=self.how)
+                                  how=self.how,
+                                  num_threads=self.num_threads)
 
     def _get_join_info(self):
         left_ax = self.left._data.axes[self.axis]
@@ -907,11 +1199,14 @@ class _MergeOperation(object):
 
 
 def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
-                       **kwargs):
+                       num_threads=1, **kwargs):
     """
 
     Parameters
     ----------
+    num_threads : int, default 1
+        number of hash partitions of the keys factorized and joined on
+        their own thread
 
     Returns
     -------
@@ -922,8 +1217,8 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
     assert len(left_keys) == len(right_keys), \
         'left_key and right_keys must be the same length'
 
-    # bind `sort` arg. of _factorize_keys
-    fkeys = partial(_factorize_keys, sort=sort)
+    # bind `sort` and `num_threads` args. of _factorize_keys
+    fkeys = partial(_factorize_keys, sort=sort, num_threads=num_threads)
 
     # get left & right join labels and num. of levels at each location
     llab, rlab, shape = map(list, zip(* map(fkeys, left_keys, right_keys)))
@@ -942,9 +1237,461 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
         kwargs['sort'] = sort
     join_func = _join_functions[how]
 
+    if num_threads > 1:
+        return _join_threaded(join_func, lkey, rkey, count, num_threads,
+                              **kwargs)
     return join_func(lkey, rkey, count, **kwargs)
 
 
+def _sorted_join_values(key):
+    """
+    The values of a join key as int64 or float64 for the merge join
+    kernels, or None for keys of other dtypes
+    """
+    if isinstance(key, Index) and not key.is_monotonic_increasing:
+        # cached on the index
+        return None
+    if is_datetime64tz_dtype(key):
+        key = key.values
+
+    key = np.asarray(key)
+    if needs_i8_conversion(key):
+        return key.view('i8')
+    elif is_integer_dtype(key) and key.dtype != np.uint64:
+        return _ensure_int64(key)
+    elif is_float_dtype(key):
+        return _ensure_float64(key)
+    return None
+
+
+def _get_sorted_join_keys(left_keys, right_keys):
+    """
+    The join keys of each side as 2-dimensional arrays of rows when both
+    sides are sorted on them, without missing keys, or None
+
+    Such keys are joined by _get_merge_join_indexers without hashing.
+    """
+    left_values, right_values = [], []
+    for lk, rk in zip(left_keys, right_keys):
+        lvalues, rvalues = _sorted_join_values(lk), _sorted_join_values(rk)
+        if lvalues is None or rvalues is None:
+            return None
+        left_values.append(lvalues)
+        right_values.append(rvalues)
+
+    dtypes = set(values.dtype for values in left_values + right_values)
+    if len(dtypes) != 1:
+        return None
+    is_monotonic = getattr(_join, 'is_monotonic_keys_%s' % dtypes.pop().name)
+
+    def _stack(values):
+        if len(values) == 1:
+            return np.ascontiguousarray(values[0]).reshape(-1, 1)
+        return np.column_stack(values)
+
+    # an unsorted first key rules out a side before stacking the others
+    if len(left_values) > 1 and not all(
+            is_monotonic(_stack(values[:1]))
+            for values in (left_values, right_values)):
+        return None
+
+    lkeys, rkeys = _stack(left_values), _stack(right_values)
+    if is_monotonic(lkeys) and is_monotonic(rkeys):
+        return lkeys, rkeys
+    return None
+
+
+def _get_merge_join_indexers(lkeys, rkeys, sort=False, how='inner'):
+    """
+    The join indexers of keys from _get_sorted_join_keys, merged in a
+    single pass, in the order of _get_join_indexers
+    """
+    join_func = getattr(_join, 'merge_join_indexer_%s' % lkeys.dtype.name)
+    left_indexer, right_indexer = join_func(lkeys, rkeys, how=how)
+
+    if not sort and how in ('right', 'outer'):
+        # keys only found on the right are numbered after those of the
+        # left when not sorted, so come last
+        mask = left_indexer == -1
+        if mask.any():
+            order = np.r_[(~mask).nonzero()[0], mask.nonzero()[0]]
+            left_indexer = left_indexer.take(order)
+            right_indexer = right_indexer.take(order)
+
+    return left_indexer, right_indexer
+
+
+def _join_threaded(join_func, lkey, rkey, count, num_threads, sort=True):
+    """
+    join_func(lkey, rkey, count) on num_threads threads, each joining the
+    rows of a contiguous range of the keys
+
+    The results of join_func are ordered by key, so the concatenation of
+    the results of the ranges is the result of the whole; a left join not
+    asked to sort is then reverted to the order of the left rows.
+    """
+    # ranges of about as many rows each
+    sizes = (np.bincount(lkey, minlength=count) +
+             np.bincount(rkey, minlength=count)).cumsum()
+    total = sizes[-1] if count else 0
+    edges = sizes.searchsorted(np.linspace(0, total, num_threads + 1)[1:-1])
+
+    starts = np.r_[0, edges]
+    stops = np.r_[edges, count]
+
+    def _partition(key):
+        # the rows of each range, in their order
+        partitions = _ensure_int64(edges.searchsorted(key, side='right'))
+        sorter, counts = _algos.groupsort_indexer(partitions, num_threads)
+        ends = counts[1:].cumsum()
+        return [sorter[end - n:end] for n, end in zip(counts[1:], ends)]
+
+    lrows, rrows = _partition(lkey), _partition(rkey)
+
+    def _join_range(i):
+        start = starts[i]
+        lidx, ridx = join_func(lkey.take(lrows[i]) - start,
+                               rkey.take(rrows[i]) - start,
+                               stops[i] - start)
+        return (algos.take_nd(lrows[i], lidx, fill_value=-1),
+                algos.take_nd(rrows[i], ridx, fill_value=-1))
+
+    results = com._run_threaded(_join_range,
+                                [(i, ) for i in range(num_threads)])
+    left_indexer = np.concatenate([r[0] for r in results])
+    right_indexer = np.concatenate([r[1] for r in results])
+
+    if not sort:
+        rev, _ = _algos.groupsort_indexer(left_indexer, len(lkey))
+        rev = _ensure_platform_int(rev)
+        left_indexer = left_indexer.take(rev)
+        right_indexer = right_indexer.take(rev)
+
+    return left_indexer, right_indexer
+
+
+class _JoinKeyTable(object):
+    """
+    The hashtables of the join keys of one side, to look up those of the
+    other side in
+
+    Parameters
+    ----------
+    keys : list of array-like
+        The join keys of the hashed side
+    other_keys : list of array-like, optional
+        The join keys of the other side, to hash the keys as
+        _factorize_keys does for the pair; otherwise as for keys alone
+
+    Attributes
+    ----------
+    group : ndarray of int64
+        The group of each row of the keys, numbered by first appearance but
+        for missing keys, which come last among those of each key
+    ngroups : int
+    """
+
+    def __init__(self, keys, other_keys=None):
+        if other_keys is None:
+            other_keys = keys
+
+        # the hashtable of each key and the labels of its values, with
+        # missing values taking a label of their own as in _factorize_keys
+        self._factorizers = []
+        labels, shape = [], []
+        for key, other in zip(keys, other_keys):
+            # the keys looked up are converted against the hashed ones
+            # before their conversion, as they are here
+            hashed = key[:0]
+            klass, _, key = _get_factorizer(other[:0], key)
+            rizer = klass(len(key))
+            lab = rizer.factorize(key)
+            count = rizer.get_count()
+
+            mask = lab == -1
+            na_label = -1
+            if mask.any():
+                na_label = count
+                lab[mask] = count
+                count += 1
+
+            self._factorizers.append((klass, rizer, na_label, hashed))
+            labels.append(lab)
+            shape.append(count)
+
+        # the combinations of the labels, numbered by first appearance
+        group, ngroups = labels[0], shape[0]
+        self._combined = []
+        for lab, count in zip(labels[1:], shape[1:]):
+            table = _hash.Int64HashTable(len(group))
+            group = table.get_labels(group * count + lab,
+                                     _hash.Int64Vector(), 0, -1, False)
+            ngroups = len(table)
+            self._combined.append((table, count))
+
+        self.group = _ensure_int64(group)
+        self.ngroups = ngroups
+
+    def lookup(self, keys):
+        """
+        The group of the hashed rows matching each row of keys, -1 where
+        there are none, or None if a key is not hashed as the hashed one
+        """
+        labels = []
+        for key, (klass, rizer, na_label, hashed) in zip(keys,
+                                                         self._factorizers):
+            kklass, key, _ = _get_factorizer(key, hashed)
+            if kklass is not klass:
+                return None
+            if klass is _hash.Int64Factorizer:
+                mask = key == tslib.iNaT
+            else:
+                mask = isnull(key)
+
+            lab = rizer.table.lookup(key)
+            lab[mask] = na_label
+            labels.append(lab)
+
+        group = labels[0]
+        for lab, (table, count) in zip(labels[1:], self._combined):
+            combined = np.where((group == -1) | (lab == -1), -1,
+                                group * count + lab)
+            group = table.lookup(combined)
+        return _ensure_int64(group)
+
+
+class PreparedJoin(object):
+    """
+    A DataFrame prepared as the right side of repeated merges on the same
+    key columns, such as a dimension table joined to every chunk of a
+    ``read_csv(chunksize=...)`` reader.
+
+    The keys of the DataFrame are hashed and its rows grouped by key once;
+    each merge then only hashes the keys of its left side. An inner or
+    left merge takes time proportional to the size of the left side and
+    of the result rather than to that of the prepared DataFrame.
+
+    .. versionadded:: 0.20.0
+
+    Parameters
+    ----------
+    right : DataFrame
+    on : label or list
+        Column(s) of right to join on
+
+    See also
+    --------
+    merge
+
+    Notes
+    -----
+    The prepared DataFrame must not be modified while it is being merged.
+
+    Examples
+    --------
+    >>> products = pd.PreparedJoin(dim, on='product_id')
+    >>> for chunk in pd.read_csv('sales.csv', chunksize=100000):
+    ...     enriched = products.merge(chunk, how='left')
+    """
+
+    def __init__(self, right, on):
+        if not isinstance(right, DataFrame):
+            raise ValueError(
+                'can not merge DataFrame with instance of '
+                'type {0}'.format(type(right)))
+
+        self.right = right
+        self.on = com._maybe_make_list(on)
+
+        self._table = _JoinKeyTable([right[k]._values for k in self.on])
+        self._group = self._table.group
+        self._ngroups = self._table.ngroups
+
+        # the rows of each group
+        self._sorter, counts = _algos.groupsort_indexer(self._group,
+                                                        self._ngroups)
+        self._counts = counts[1:]
+        self._starts = self._counts.cumsum() - self._counts
+
+        # the groups by first appearance, missing keys being labeled last
+        first = self._sorter.take(self._starts)
+        self._appearance = first.argsort(kind='mergesort')
+
+    def merge(self, left, how='inner', left_on=None, sort=False,
+              suffixes=('_x', '_y'), copy=True, indicator=False):
+        """
+        Merge left with the prepared DataFrame, as
+        ``pd.merge(left, right, left_on=left_on, right_on=on, ...)``
+
+        Parameters
+        ----------
+        left : DataFrame
+        how : {'left', 'right', 'outer', 'inner'}, default 'inner'
+        left_on : label or list, default None
+            Column(s) of left to join on, the same as ``on`` if None
+        sort : boolean, default False
+        suffixes : 2-length sequence (tuple, list, ...)
+        copy : boolean, default True
+        indicator : boolean or string, default False
+
+        Returns
+        -------
+        merged : DataFrame
+        """
+        if left_on is None:
+            left_on = self.on
+        op = _PreparedMergeOperation(self, left, how=how, left_on=left_on,
+                                     sort=sort, suffixes=suffixes, copy=copy,
+                                     indicator=indicator)
+        return op.get_result()
+
+    def _get_join_indexers(self, left_keys, how='inner', sort=False):
+        """
+        The join indexers of _get_join_indexers, hashing only the left
+        keys, or None if they cannot be looked up in the prepared ones
+        """
+        group = self._table.lookup(left_keys)
+        if group is None:
+            return None
+
+        matched = group != -1
+        if how in ('inner', 'left'):
+            return self._probe_join_indexers(left_keys, group, matched,
+                                             how=how, sort=sort)
+        elif sort:
+            return None
+
+        # number the keys as _factorize_keys does: those of the left by
+        # first appearance, then those of the right alone
+        unmatched = (~matched).nonzero()[0]
+        left_only, nleft_only = _factorize_side_keys(
+            [k.take(unmatched) for k in left_keys], sort=False)
+        group[unmatched] = self._ngroups + left_only
+        count = self._ngroups + nleft_only
+
+        table = _hash.Int64HashTable(len(group))
+        uniques = _hash.Int64Vector()
+        table.get_labels(group, uniques, 0, -1, False)
+        uniques = uniques.to_array()
+
+        order = np.empty(count, dtype=np.int64)
+        order[uniques] = np.arange(len(uniques))
+        right_only = np.ones(self._ngroups, dtype=bool)
+        right_only[uniques[uniques < self._ngroups]] = False
+        right_only = self._appearance[right_only.take(self._appearance)]
+        order[right_only] = len(uniques) + np.arange(len(right_only))
+
+        join_func = _join_functions[how]
+        return join_func(order.take(group), order.take(self._group), count)
+
+    def _probe_join_indexers(self, left_keys, group, matched, how='inner',
+                             sort=False):
+        # the left rows in the order of the result
+        if sort:
+            keys, count = _factorize_side_keys(left_keys, sort=True)
+            rows, _ = _algos.groupsort_indexer(keys, count)
+            if how == 'inner':
+                rows = rows[matched.take(rows)]
+        elif how == 'inner':
+            rows = matched.nonzero()[0]
+            table = _hash.Int64HashTable(len(rows))
+            labels = table.get_labels(group.take(rows), _hash.Int64Vector(),
+                                      0, -1, False)
+            sorter, _ = _algos.groupsort_indexer(labels, len(table))
+            rows = rows.take(sorter)
+        else:
+            rows = np.arange(len(group), dtype=np.int64)
+
+        # each with the rows of its group, or -1 for a left join
+        group = group.take(rows)
+        counts = algos.take_nd(self._counts, group, fill_value=0)
+        starts = algos.take_nd(self._starts, group, fill_value=0)
+        if how == 'left':
+            counts[counts == 0] = 1
+
+        left_indexer = np.repeat(rows, counts)
+        ends = counts.cumsum()
+        positions = (np.arange(len(left_indexer), dtype=np.int64) +
+                     np.repeat(starts - ends + counts, counts))
+        positions[np.repeat(group == -1, counts)] = -1
+        right_indexer = algos.take_nd(self._sorter, positions, fill_value=-1)
+
+        return _ensure_int64(left_indexer), _ensure_int64(right_indexer)
+
+
+class _PreparedMergeOperation(_MergeOperation):
+    """
+    Merge with a PreparedJoin as the right side
+    """
+
+    def __init__(self, prepared, left, **kwargs):
+        self.prepared = prepared
+        _MergeOperation.__init__(self, left, prepared.right,
+                                 right_on=prepared.on, **kwargs)
+
+    def _get_join_indexers(self):
+        """ return the join indexers """
+        result = self.prepared._get_join_indexers(self.left_join_keys,
+                                                  how=self.how,
+                                                  sort=self.sort)
+        if result is None:
+            return _MergeOperation._get_join_indexers(self)
+        return result
+
+
+class _SemiJoinOperation(_MergeOperation):
+    """
+    Match the rows of left with those of right on the keys a merge would
+    join them on, without joining them
+    """
+
+    def __init__(self, left, right, on=None, left_on=None, right_on=None,
+                 left_index=False, right_index=False):
+        for obj in (left, right):
+            if not isinstance(obj, DataFrame):
+                raise ValueError(
+                    'can not merge DataFrame with instance of '
+                    'type {0}'.format(type(obj)))
+
+        self.left = left
+        self.right = right
+        self.on = com._maybe_make_list(on)
+        self.left_on = com._maybe_make_list(left_on)
+        self.right_on = com._maybe_make_list(right_on)
+        self.left_index = left_index
+        self.right_index = right_index
+
+        self._validate_specification()
+
+    def _get_keys(self, obj, on):
+        if not _any(on):
+            index = obj.index
+            return [index.get_level_values(i)._values
+                    for i in range(index.nlevels)]
+
+        keys = []
+        for k in on:
+            if isinstance(k, (np.ndarray, ABCSeries)) and len(k) == len(obj):
+                keys.append(getattr(k, '_values', k))
+            else:
+                keys.append(obj[k]._values)
+        return keys
+
+    def get_mask(self):
+        """
+        Whether each row of left has a match in right; missing keys match
+        missing keys as in a merge
+        """
+        left_keys = self._get_keys(self.left, self.left_on)
+        right_keys = self._get_keys(self.right, self.right_on)
+        if len(left_keys) != len(right_keys):
+            raise ValueError("len(right_on) must equal len(left_on)")
+
+        # only the right keys are hashed, the left ones looked up
+        table = _JoinKeyTable(right_keys, left_keys)
+        return table.lookup(left_keys) != -1
+
+
 class _OrderedMerge(_MergeOperation):
     _merge_type = 'ordered_merge'
 
@@ -1002,13 +1749,6 @@ _asof_functions = {
     'double': _join.asof_join_double,
 }
 
-_asof_by_functions = {
-    ('int64_t', 'int64_t'): _join.asof_join_int64_t_by_int64_t,
-    ('double', 'int64_t'): _join.asof_join_double_by_int64_t,
-    ('int64_t', 'object'): _join.asof_join_int64_t_by_object,
-    ('double', 'object'): _join.asof_join_double_by_object,
-}
-
 _type_casters = {
     'int64_t': _ensure_int64,
     'double': _ensure_float64,
@@ -1035,13 +1775,15 @@ class _AsOfMerge(_OrderedMerge):
                  axis=1, suffixes=('_x', '_y'), copy=True,
                  fill_method=None,
                  how='asof', tolerance=None,
-                 allow_exact_matches=True):
+                 allow_exact_matches=True,
+                 direction='backward'):
 
         self.by = by
         self.left_by = left_by
         self.right_by = right_by
         self.tolerance = tolerance
         self.allow_exact_matches = allow_exact_matches
+        self.direction = direction
 
         _OrderedMerge.__init__(self, left, right, on=on, left_on=left_on,
                                right_on=right_on, left_index=left_index,
@@ -1084,10 +1826,8 @@ class _AsOfMerge(_OrderedMerge):
             if not is_list_like(self.right_by):
                 self.right_by = [self.right_by]
 
-            if len(self.left_by) != 1:
-                raise MergeError("can only asof by a single key")
-            if len(self.right_by) != 1:
-                raise MergeError("can only asof by a single key")
+            if len(self.left_by) != len(self.right_by):
+                raise MergeError('left_by and right_by must be same length')
 
             self.left_on = self.left_by + list(self.left_on)
             self.right_on = self.right_by + list(self.right_on)
@@ -1137,6 +1877,11 @@ class _AsOfMerge(_OrderedMerge):
             raise MergeError("allow_exact_matches must be boolean, "
                              "passed {0}".format(self.allow_exact_matches))
 
+        # validate direction
+        if self.direction not in ('backward', 'forward', 'nearest'):
+            raise MergeError("direction must be 'backward', 'forward' or "
+                             "'nearest', passed {0!r}".format(self.direction))
+
         return left_join_keys, right_join_keys, join_names
 
     def _get_join_indexers(self):
@@ -1163,43 +1908,209 @@ class _AsOfMerge(_OrderedMerge):
             if tolerance is not None:
                 tolerance = tolerance.value
 
-        # a "by" parameter requires special handling
+        # the "by" keys, of any number and dtype, as the int64 ids of their
+        # groups
         if self.left_by is not None:
-            left_by_values = self.left_join_keys[0]
-            right_by_values = self.right_join_keys[0]
-
-            # choose appropriate function by type
-            on_type = _get_cython_type(left_values.dtype)
-            by_type = _get_cython_type(left_by_values.dtype)
-
-            on_type_caster = _type_casters[on_type]
-            by_type_caster = _type_casters[by_type]
-            func = _asof_by_functions[(on_type, by_type)]
-
-            left_values = on_type_caster(left_values)
-            right_values = on_type_caster(right_values)
-            left_by_values = by_type_caster(left_by_values)
-            right_by_values = by_type_caster(right_by_values)
-
-            return func(left_values,
-                        right_values,
-                        left_by_values,
-                        right_by_values,
-                        self.allow_exact_matches,
-                        tolerance)
+            nby = len(self.left_by)
+            (left_by_values,
+             right_by_values,
+             ngroups) = _get_asof_groups(self.left_join_keys[:nby],
+                                         self.right_join_keys[:nby])
+        else:
+            left_by_values = np.zeros(len(left_values), dtype=np.int64)
+            right_by_values = np.zeros(len(right_values), dtype=np.int64)
+            ngroups = 1
+
+        # choose appropriate function by type
+        on_type = _get_cython_type(left_values.dtype)
+        type_caster = _type_casters[on_type]
+        func = _asof_functions[on_type]
+
+        left_values = np.ascontiguousarray(type_caster(left_values))
+        right_values = np.ascontiguousarray(type_caster(right_values))
+
+        return func(left_values,
+                    right_values,
+                    left_by_values,
+                    right_by_values,
+                    ngroups,
+                    self.allow_exact_matches,
+                    tolerance,
+                    self.direction)
+
+
+def _get_interval_bounds(bounds):
+    """
+    The bounds of the intervals of an interval merge as int64 or float64
+    arrays, datetimelike bounds as int64
+    """
+    dtypes = [bound.dtype for bound in bounds]
+    if any(needs_i8_conversion(dtype) for dtype in dtypes):
+        if not all(is_dtype_equal(dtype, dtypes[0]) for dtype in dtypes):
+            raise MergeError("incompatible merge keys, "
+                             "must be the same type")
+        return [np.asarray(getattr(bound, 'asi8', bound)).view('i8')
+                for bound in bounds]
+    elif all(is_integer_dtype(dtype) for dtype in dtypes):
+        return [_ensure_int64(bound) for bound in bounds]
+    elif all(is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+             for dtype in dtypes):
+        return [_ensure_float64(bound) for bound in bounds]
+    raise MergeError("interval bounds must be numeric or datetimelike")
+
+
+class _IntervalMerge(_MergeOperation):
+    _merge_type = 'interval_merge'
+
+    def __init__(self, left, right, left_on=None, left_start=None,
+                 left_end=None, right_start=None, right_end=None,
+                 by=None, left_by=None, right_by=None, how='inner',
+                 closed='left', suffixes=('_x', '_y'), copy=True):
+
+        if how not in ('inner', 'left'):
+            raise MergeError("how must be 'inner' or 'left', "
+                             "passed {0!r}".format(how))
+        if closed not in ('left', 'right', 'both', 'neither'):
+            raise ValueError("closed must be 'left', 'right', 'both' or "
+                             "'neither', passed {0!r}".format(closed))
+
+        if right_start is None or right_end is None:
+            raise MergeError('Must pass right_start and right_end')
+        if left_on is not None:
+            if left_start is not None or left_end is not None:
+                raise MergeError('Can only pass argument "left_on" OR '
+                                 '"left_start" and "left_end", not a '
+                                 'combination of both.')
+            self.left_bounds = [left_on]
+        elif left_start is None or left_end is None:
+            raise MergeError('Must pass left_on or left_start and left_end')
         else:
-            # choose appropriate function by type
-            on_type = _get_cython_type(left_values.dtype)
-            type_caster = _type_casters[on_type]
-            func = _asof_functions[on_type]
+            self.left_bounds = [left_start, left_end]
+        self.right_bounds = [right_start, right_end]
+        self.overlap = left_on is None
+
+        self.by = by
+        self.left_by = left_by
+        self.right_by = right_by
+        self.closed = closed
+
+        _MergeOperation.__init__(self, left, right, how=how,
+                                 suffixes=suffixes, copy=copy, sort=False)
+
+    def _validate_specification(self):
+        # the 'by' columns are the keys of the merge, matched as in a merge
+        if self.by is not None:
+            if self.left_by is not None or self.right_by is not None:
+                raise MergeError('Can only pass by OR left_by '
+                                 'and right_by')
+            self.left_by = self.right_by = self.by
+        if self.left_by is None and self.right_by is not None:
+            raise MergeError('missing left_by')
+        if self.left_by is not None and self.right_by is None:
+            raise MergeError('missing right_by')
 
-            left_values = type_caster(left_values)
-            right_values = type_caster(right_values)
+        self.left_on = com._maybe_make_list(self.left_by) or []
+        self.right_on = com._maybe_make_list(self.right_by) or []
+        if len(self.right_on) != len(self.left_on):
+            raise ValueError("len(right_by) must equal len(left_by)")
 
-            return func(left_values,
-                        right_values,
-                        self.allow_exact_matches,
-                        tolerance)
+    def _get_groups(self):
+        """ the groups of the 'by' keys, as dense labels """
+        nleft, nright = len(self.left), len(self.right)
+        if not self.left_join_keys:
+            return (np.zeros(nleft, dtype=np.int64),
+                    np.zeros(nright, dtype=np.int64))
+
+        lgroup, rgroup, _ = _factorize_join_keys(self.left_join_keys,
+                                                 self.right_join_keys)
+        return lgroup, rgroup
+
+    def _get_join_indexers(self):
+        """ return the join indexers """
+
+        # the right frame may have dropped a 'by' column of the same name
+        left, right = self.orig_left, self.orig_right
+        bounds = ([left[k]._values for k in self.left_bounds] +
+                  [right[k]._values for k in self.right_bounds])
+        values = _get_interval_bounds(bounds)
+        valid = [~isnull(bound) for bound in bounds]
+
+        nbounds = len(self.left_bounds)
+        if self.overlap:
+            lstart, lend = values[:nbounds]
+            lvalid = valid[0] & valid[1] & (lend >= lstart)
+        else:
+            lstart = lend = values[0]
+            lvalid = valid[0]
+        rstart, rend = values[nbounds:]
+        rvalid = valid[-2] & valid[-1] & (rend >= rstart)
+
+        lgroup, rgroup = self._get_groups()
+
+        def _sort(group, start, end, valid):
+            # the rows with a valid interval, by group then start
+            rows = valid.nonzero()[0]
+            rows = rows.take(np.lexsort((start.take(rows),
+                                         group.take(rows))))
+            return [rows] + [np.ascontiguousarray(values.take(rows))
+                             for values in (group, start, end)]
+
+        lrows, lgroup, lstart, lend = _sort(lgroup, lstart, lend, lvalid)
+        rrows, rgroup, rstart, rend = _sort(rgroup, rstart, rend, rvalid)
+
+        if self.overlap:
+            include_start = True
+            include_end = self.closed == 'both'
+        else:
+            include_start = self.closed in ('left', 'both')
+            include_end = self.closed in ('right', 'both')
+
+        func = getattr(_join, 'interval_join_indexer_%s' % lstart.dtype.name)
+        left_indexer, right_indexer = func(lgroup, lstart, lend,
+                                           rgroup, rstart, rend,
+                                           include_start, include_end,
+                                           self.overlap)
+        left_indexer = lrows.take(left_indexer)
+        right_indexer = rrows.take(right_indexer)
+
+        if self.how == 'left':
+            matched = np.zeros(len(left), dtype=bool)
+            matched[left_indexer] = True
+            unmatched = (~matched).nonzero()[0]
+            left_indexer = np.concatenate([left_indexer, unmatched])
+            right_indexer = np.concatenate(
+                [right_indexer, np.repeat(-1, len(unmatched))])
+
+        # stable counting sorts by right then left row, in linear time
+        left_indexer = _ensure_int64(left_indexer)
+        right_indexer = _ensure_int64(right_indexer)
+
+        sorter, _ = _algos.groupsort_indexer(right_indexer, len(right))
+        left_indexer = left_indexer.take(sorter)
+        right_indexer = right_indexer.take(sorter)
+
+        sorter, _ = _algos.groupsort_indexer(left_indexer, len(left))
+        return left_indexer.take(sorter), right_indexer.take(sorter)
+
+
+def _get_asof_groups(left_keys, right_keys):
+    """
+    The "by" keys of an asof merge as the int64 ids of their groups, and
+    the number of ids
+    """
+    if len(left_keys) == 1:
+        lk, rk = left_keys[0], right_keys[0]
+        if (is_integer_dtype(lk) and is_integer_dtype(rk) and
+                len(lk) and len(rk)):
+            lk, rk = _ensure_int64(lk), _ensure_int64(rk)
+            low = min(lk.min(), rk.min())
+            high = max(lk.max(), rk.max())
+
+            # a small range of integers are their own ids, without hashing
+            if int(high) - int(low) < len(lk) + len(rk):
+                return lk - low, rk - low, int(high - low) + 1
+
+    return _factorize_join_keys(left_keys, right_keys)
 
 
 def _get_multiindex_indexer(join_keys, index, sort):
@@ -1286,7 +2197,11 @@ _join_functions = {
 }
 
 
-def _factorize_keys(lk, rk, sort=True):
+def _get_factorizer(lk, rk):
+    """
+    The factorizer class for a pair of join keys, and the keys converted
+    to the values it takes
+    """
     if is_datetime64tz_dtype(lk) and is_datetime64tz_dtype(rk):
         lk = lk.values
         rk = rk.values
@@ -1298,16 +2213,25 @@ def _factorize_keys(lk, rk, sort=True):
         klass = _hash.Factorizer
         lk = _ensure_object(lk)
         rk = _ensure_object(rk)
+    return klass, lk, rk
 
-    rizer = klass(max(len(lk), len(rk)))
 
-    llab = rizer.factorize(lk)
-    rlab = rizer.factorize(rk)
+def _factorize_keys(lk, rk, sort=True, num_threads=1):
+    klass, lk, rk = _get_factorizer(lk, rk)
 
-    count = rizer.get_count()
+    if num_threads > 1 and klass is _hash.Int64Factorizer:
+        llab, rlab, uniques = _factorize_int64_threaded(lk, rk, num_threads)
+        count = len(uniques)
+    else:
+        rizer = klass(max(len(lk), len(rk)))
+
+        llab = rizer.factorize(lk)
+        rlab = rizer.factorize(rk)
+
+        count = rizer.get_count()
+        uniques = rizer.uniques.to_array() if sort else None
 
     if sort:
-        uniques = rizer.uniques.to_array()
         llab, rlab = _sort_labels(uniques, llab, rlab)
 
     # NA group
@@ -1326,6 +2250,85 @@ def _factorize_keys(lk, rk, sort=True):
     return llab, rlab, count
 
 
+def _factorize_int64_threaded(lk, rk, num_threads):
+    """
+    The labels of an Int64Factorizer over lk then rk, with the hashing
+    spread over num_threads threads, each factorizing a hash partition of
+    the keys
+
+    The labels of a partition are numbered by first appearance, as are
+    those of the whole, so they are renumbered by the position of their
+    first appearance among all of the keys.
+
+    Returns
+    -------
+    tuple of (left labels, right labels, uniques)
+    """
+    values = np.concatenate([lk, rk])
+    sorter, counts = _join.hash_partition(values, num_threads)
+    ends = counts.cumsum()
+    rows = [sorter[end - n:end] for n, end in zip(counts, ends)]
+
+    def _factorize(rows):
+        table = _hash.Int64HashTable(len(rows))
+        uniques = _hash.Int64Vector()
+        labels = table.get_labels(values.take(rows), uniques, 0, -1)
+
+        # the rows where each label first appears, in the label order
+        seen = np.maximum.accumulate(np.r_[-1, labels[:-1]])
+        return labels, rows[labels > seen], uniques.to_array()
+
+    results = com._run_threaded(_factorize, [(r, ) for r in rows])
+
+    first = np.zeros(len(values), dtype=bool)
+    for _, firsts, _ in results:
+        first[firsts] = True
+    order = first.cumsum() - 1
+
+    labels = np.empty(len(values), dtype=np.int64)
+    uniques = np.empty(first.sum(), dtype=np.int64)
+    for r, (part_labels, firsts, part_uniques) in zip(rows, results):
+        ids = order[firsts]
+
+        # a partition of NA keys alone has no labels to take from
+        mask = part_labels != -1
+        labels[r] = -1
+        labels[r[mask]] = ids.take(part_labels[mask])
+        uniques[ids] = part_uniques
+
+    return labels[:len(lk)], labels[len(lk):], uniques
+
+
+def _factorize_side_keys(keys, sort=False):
+    """
+    The join keys of one side as dense labels, ordered as _factorize_keys
+    orders them, and their count
+    """
+    labels, shape = [], []
+    for key in keys:
+        lab, _, count = _factorize_keys(key, key[:0], sort=sort)
+        labels.append(lab)
+        shape.append(count)
+
+    key, _ = _get_join_keys(labels, [lab[:0] for lab in labels], shape, sort)
+    key, _, count = _factorize_keys(key, key[:0], sort=sort)
+    return key, count
+
+
+def _factorize_join_keys(left_keys, right_keys):
+    """
+    The join keys of both sides as dense labels, equal for equal keys
+    and numbered by first appearance, and their count
+    """
+    fkeys = lambda lk, rk: _factorize_keys(lk, rk, sort=False)
+    if len(left_keys) == 1:
+        return fkeys(left_keys[0], right_keys[0])
+
+    llab, rlab, shape = map(list, zip(*map(fkeys, left_keys, right_keys)))
+    lkey, rkey = _get_join_keys(llab, rlab, shape, False)
+    return fkeys(lkey, rkey)
+
+
 def _sort_labels(uniques, left, right):
     if not isinstance(uniques, np.ndarray):
         # tuplesafe
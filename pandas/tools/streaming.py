@@ -0,0 +1,327 @@
+"""
+Groupby aggregation over a stream of DataFrame chunks
+"""
+
+import warnings
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import range
+from pandas.types.common import is_list_like, is_numeric_dtype
+from pandas.core.common import PerformanceWarning
+from pandas.core.frame import DataFrame
+from pandas.core.index import MultiIndex
+from pandas.tools.merge import concat
+
+
+# aggregations whose partial results combine with the same kind of reduction
+_combined_by = {
+    'count': 'sum',
+    'sum': 'sum',
+    'prod': 'prod',
+    'min': 'min',
+    'max': 'max',
+    'first': 'first',
+    'last': 'last',
+}
+
+# aggregations computed from the count, mean and sum of squared deviations
+_moment_aggregations = frozenset(['mean', 'var', 'std'])
+
+# aggregations computed from the distinct values of each group
+_distinct_aggregations = frozenset(['nunique', 'median', 'quantile'])
+
+# aggregations that skip non-numeric columns when not given a column
+_numeric_aggregations = frozenset(['sum', 'prod', 'mean', 'var', 'std',
+                                   'median', 'quantile'])
+
+
+def streaming_groupby(chunks, by, agg, sort=True, q=0.5):
+    """
+    Group and aggregate data that arrives as a sequence of DataFrames, such
+    as the iterators returned by ``read_csv(chunksize=...)``,
+    ``HDFStore.select(iterator=True)`` or ``read_sql(chunksize=...)``.
+
+    Only a partial aggregate per group is kept from one chunk to the next,
+    so the data itself never has to fit in memory, except for the
+    'nunique', 'median' and 'quantile' aggregations (see Notes).
+
+    .. versionadded:: 0.20.0
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrames
+    by : label or list of labels
+        Column(s) to group by
+    agg : string, list of strings or dict of column -> string(s)
+        Aggregations to compute, any of 'count', 'sum', 'prod', 'min',
+        'max', 'first', 'last', 'mean', 'var', 'std', 'nunique', 'median'
+        and 'quantile'. A string or list is applied to every column not
+        grouped by.
+    sort : boolean, default True
+        Sort the result by the group keys
+    q : float, default 0.5
+        The quantile computed by the 'quantile' aggregation
+
+    Returns
+    -------
+    aggregated : DataFrame
+        The same as ``concat(chunks).groupby(by).agg(agg)``
+
+    Notes
+    -----
+    The partial aggregates of count, sum, prod, min, max, first and last
+    are combined with the same reduction; mean, var and std keep the count,
+    mean and sum of squared deviations of each group and combine them
+    exactly. These need memory proportional to the number of groups.
+
+    nunique, median and quantile are exact as well, which means keeping
+    every distinct value of each group along with its number of
+    occurrences. Their state grows with the number of distinct values, up
+    to one entry per row on continuous data, and a PerformanceWarning is
+    issued when they are requested.
+
+    Examples
+    --------
+    >>> reader = pd.read_csv('big.csv', chunksize=100000)
+    >>> pd.streaming_groupby(reader, by='key',
+    ...                      agg={'value': ['sum', 'mean'], 'id': 'nunique'})
+    """
+    if not 0 <= q <= 1:
+        raise ValueError("percentiles should all be in the interval [0, 1]")
+
+    grouped = _StreamingGroupBy(by, agg, q=q)
+    for chunk in chunks:
+        grouped.update(chunk)
+    return grouped.result(sort=sort)
+
+
+def _sort_by_values(obj):
+    """
+    Sort by the index values, sort_index orders a MultiIndex by its labels
+    which only follow the values when the levels are sorted
+    """
+    index = obj.index
+    if isinstance(index, MultiIndex):
+        obj = obj.copy()
+        obj.index = MultiIndex.from_arrays(
+            [index.get_level_values(i) for i in range(index.nlevels)],
+            names=index.names)
+    return obj.sort_index()
+
+
+class _StreamingGroupBy(object):
+    """
+    Holds the partial aggregates of a streaming groupby
+
+    Parameters
+    ----------
+    by : label or list of labels
+    agg : string, list of strings or dict of column -> string(s)
+    q : float, default 0.5
+    """
+
+    def __init__(self, by, agg, q=0.5):
+        self.keys = list(by) if is_list_like(by) else [by]
+        self.agg = agg
+        self.q = q
+
+        self.levels = list(range(len(self.keys)))
+        self.spec = None
+
+        # partial aggregates, the reductions indexed by the group keys and
+        # the distinct values indexed by the group keys and the value
+        self.sizes = None
+        self.reduced = {}
+        self.moments = {}
+        self.distinct = {}
+
+    def _parse_spec(self, chunk):
+        agg = self.agg
+        if not isinstance(agg, dict):
+            hows = [agg] if isinstance(agg, compat.string_types) else agg
+            columns = [col for col in chunk.columns if col not in self.keys]
+            if any(how in _numeric_aggregations for how in hows):
+                columns = [col for col in columns
+                           if is_numeric_dtype(chunk[col])]
+            agg = dict((col, hows) for col in columns)
+            self.multi = not isinstance(self.agg, compat.string_types)
+        else:
+            self.multi = any(is_list_like(how) for how in agg.values())
+            columns = list(agg)
+
+        spec = []
+        for col in columns:
+            hows = agg[col]
+            if not is_list_like(hows):
+                hows = [hows]
+            for how in hows:
+                if not isinstance(how, compat.string_types) or not (
+                        how in _combined_by or how in _moment_aggregations or
+                        how in _distinct_aggregations):
+                    raise ValueError("cannot aggregate with {0!r} in a "
+                                     "streaming groupby".format(how))
+                if col in self.keys:
+                    raise ValueError("cannot aggregate the grouping column "
+                                     "{0!r}".format(col))
+                spec.append((col, how))
+
+        distinct = sorted(set(how for _, how in spec
+                              if how in _distinct_aggregations))
+        if distinct:
+            msg = ("the state of {0} in a streaming groupby keeps every "
+                   "distinct value of each group, and can grow with the "
+                   "number of rows".format(", ".join(distinct)))
+            warnings.warn(msg, PerformanceWarning, stacklevel=4)
+        return spec
+
+    def _combine(self, state, partial, how, levels):
+        if state is None:
+            return partial
+        combined = concat([state, partial])
+        return getattr(combined.groupby(level=levels, sort=False), how)()
+
+    def update(self, chunk):
+        """ Fold the next chunk into the partial aggregates """
+        if self.spec is None:
+            self.spec = self._parse_spec(chunk)
+
+        if not len(chunk):
+            return
+
+        grouped = chunk.groupby(self.keys, sort=False)
+        self.sizes = self._combine(self.sizes, grouped.size(), 'sum',
+                                   self.levels)
+
+        moment_columns, distinct_columns = [], []
+        for col, how in self.spec:
+            if how in _combined_by:
+                partial = getattr(grouped[col], how)()
+                self.reduced[col, how] = self._combine(
+                    self.reduced.get((col, how)), partial, _combined_by[how],
+                    self.levels)
+            elif how in _moment_aggregations:
+                if col not in moment_columns:
+                    moment_columns.append(col)
+            elif col not in distinct_columns:
+                distinct_columns.append(col)
+
+        for col in moment_columns:
+            self.moments[col] = self._combine_moments(
+                self.moments.get(col), self._get_moments(grouped[col]))
+
+        for col in distinct_columns:
+            partial = chunk.groupby(self.keys + [col], sort=False).size()
+            if len(partial):
+                self.distinct[col] = self._combine(
+                    self.distinct.get(col), partial, 'sum',
+                    self.levels + [len(self.keys)])
+
+    def _get_moments(self, grouped):
+        # the sum of squared deviations of each group, from the Welford
+        # updates of group_var
+        nobs = grouped.count()
+        mean = grouped.mean()
+        ssd = (grouped.var() * (nobs - 1)).fillna(0)
+        return DataFrame({'nobs': nobs, 'mean': mean, 'ssd': ssd},
+                         columns=['nobs', 'mean', 'ssd'])
+
+    def _combine_moments(self, state, partial):
+        if state is None:
+            return partial
+
+        moments = concat([state, partial])
+        grouped = moments.groupby(level=self.levels, sort=False)
+        nobs = grouped['nobs'].sum()
+
+        weighted = (moments['mean'] * moments['nobs']).fillna(0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = weighted.groupby(level=self.levels, sort=False).sum() / nobs
+
+        # pairwise update of Chan et al.: the squared deviations within each
+        # part plus those of the part means from the combined mean
+        delta = moments['mean'] - mean.reindex(moments.index)
+        spread = (delta ** 2 * moments['nobs']).fillna(0)
+        ssd = (grouped['ssd'].sum() +
+               spread.groupby(level=self.levels, sort=False).sum())
+        return DataFrame({'nobs': nobs, 'mean': mean, 'ssd': ssd},
+                         columns=['nobs', 'mean', 'ssd'])
+
+    def _finalize_moments(self, moments, how):
+        if how == 'mean':
+            return moments['mean']
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = moments['ssd'] / (moments['nobs'] - 1)
+        var[moments['nobs'] < 2] = np.nan
+        if how == 'var':
+            return var
+        return np.sqrt(var)
+
+    def _finalize_distinct(self, counts, how):
+        if how == 'nunique':
+            return counts.groupby(level=self.levels, sort=False).size()
+
+        counts = _sort_by_values(counts)
+        q = 0.5 if how == 'median' else self.q
+
+        index = counts.index
+        keys = index.droplevel(index.nlevels - 1)
+        values = np.asarray(index.get_level_values(index.nlevels - 1),
+                            dtype=np.float64)
+        occurrences = counts.values
+
+        # the groups are consecutive and their values sorted
+        changed = np.zeros(len(counts) - 1, dtype=bool)
+        for labels in index.labels[:-1]:
+            changed |= labels[1:] != labels[:-1]
+        starts = np.r_[0, changed.nonzero()[0] + 1]
+
+        cumulative = np.cumsum(occurrences)
+        nobs = np.add.reduceat(occurrences, starts)
+        offset = cumulative[starts] - occurrences[starts]
+
+        position = (nobs - 1) * q
+        lower, upper = np.floor(position), np.ceil(position)
+        lower_value = values[cumulative.searchsorted(offset + lower,
+                                                     side='right')]
+        upper_value = values[cumulative.searchsorted(offset + upper,
+                                                     side='right')]
+        result = lower_value + (upper_value - lower_value) * (position - lower)
+        return counts._constructor(result, index=keys[starts])
+
+    def result(self, sort=True):
+        """ The aggregated DataFrame """
+        if self.sizes is None:
+            raise ValueError("No chunks to aggregate")
+
+        sizes = _sort_by_values(self.sizes) if sort else self.sizes
+        groups = sizes.index
+
+        output, columns = [], []
+        for col, how in self.spec:
+            if how in _combined_by:
+                result = self.reduced[col, how]
+            elif how in _moment_aggregations:
+                result = self._finalize_moments(self.moments[col], how)
+            elif col in self.distinct:
+                result = self._finalize_distinct(self.distinct[col], how)
+            else:
+                # no group has any valid value
+                result = self.sizes.iloc[:0]
+
+            result = result.reindex(groups)
+            if how in ('count', 'nunique'):
+                result = result.fillna(0).astype(np.int64)
+
+            output.append(result)
+            columns.append((col, how) if self.multi else col)
+
+        result = concat(output, axis=1) if output else DataFrame(index=groups)
+        result.index = groups
+        if self.multi:
+            result.columns = MultiIndex.from_tuples(columns)
+        else:
+            result.columns = columns
+        return result
@@ -10,6 +10,7 @@ from pandas import (DataFrame, concat,
                     read_csv, isnull, Series, date_range,
                     Index, Panel, MultiIndex, Timestamp,
                     DatetimeIndex, Categorical, CategoricalIndex)
+from pandas.core.internals import _is_uniform_block_layout
 from pandas.types.concat import union_categoricals
 from pandas.util import testing as tm
 from pandas.util.testing import (assert_frame_equal,
@@ -891,6 +892,51 @@ class TestConcatenate(ConcatenateBase):
             elif b.is_object:
                 self.assertIsNotNone(b.values.base)
 
+    def test_concat_same_schema(self):
+        # frames with the same columns and dtypes are concatenated a block
+        # at a time
+        df = DataFrame({'a': np.arange(12),
+                        'b': np.random.randn(12),
+                        'c': ['foo', None, 'bar'] * 4,
+                        'd': pd.date_range('20160101', periods=12),
+                        'e': [True, False] * 6},
+                       columns=['a', 'b', 'c', 'd', 'e'])
+        df.loc[4:8, 'b'] = np.nan
+        df.loc[4:8, 'd'] = pd.NaT
+        pieces = [df.iloc[i:i + 4] for i in range(0, 12, 4)]
+
+        def is_uniform(pieces):
+            return _is_uniform_block_layout(
+                [(piece._data, {}) for piece in pieces], 1)
+
+        self.assertTrue(is_uniform(pieces))
+        result = concat(pieces)
+        tm.assert_frame_equal(result, df)
+        self.assertEqual(len(result._data.blocks), 5)
+
+        result = concat(pieces, keys=['x', 'y', 'z'])
+        tm.assert_frame_equal(result.reset_index(level=0, drop=True), df)
+
+        # a different column order or dtype is still aligned and upcast
+        pieces[1] = pieces[1][['e', 'd', 'c', 'b', 'a']]
+        self.assertFalse(is_uniform(pieces))
+        tm.assert_frame_equal(concat(pieces), df)
+        pieces[1] = pieces[1][df.columns]
+        pieces[2] = pieces[2].astype({'a': np.float32})
+        self.assertFalse(is_uniform(pieces))
+        expected = df.astype({'a': np.float64})
+        tm.assert_frame_equal(concat(pieces), expected)
+
+        # an object column holding nothing but missing values in a piece is
+        # refilled with the first of them
+        first = df.iloc[:2].copy()
+        first['c'] = np.array([None, np.nan], dtype=object)
+        pieces = [DataFrame(dict(first.iteritems()), columns=df.columns),
+                  df.iloc[2:4]]
+        self.assertFalse(is_uniform(pieces))
+        result = concat(pieces)
+        self.assertEqual(result['c'].tolist(), [None, None, 'bar', 'foo'])
+
     def test_concat_with_group_keys(self):
         df = DataFrame(np.random.randn(4, 3))
         df2 = DataFrame(np.random.randn(4, 4))
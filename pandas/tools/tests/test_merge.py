@@ -9,8 +9,9 @@ import numpy as np
 import random
 
 import pandas as pd
-from pandas.compat import lrange, lzip
-from pandas.tools.merge import merge, concat, MergeError
+from pandas.compat import lrange, lzip, StringIO
+from pandas.tools.merge import (merge, concat, MergeError,
+                                _MergeOperation, _get_join_indexers)
 from pandas.util.testing import (assert_frame_equal,
                                  assert_series_equal,
                                  slow)
@@ -611,6 +612,252 @@ class TestMerge(tm.TestCase):
         self.assertEqual(result['value_x'].dtype, 'object')
         self.assertEqual(result['value_y'].dtype, 'object')
 
+    def test_merge_num_threads(self):
+        np.random.seed(1234)
+        n = 1000
+        left = DataFrame({'key': np.random.randint(0, 300, n),
+                          'key2': np.random.randint(0, 3, n),
+                          'value': np.arange(n)})
+        right = DataFrame({'key': np.random.randint(100, 500, n // 2),
+                           'key2': np.random.randint(0, 3, n // 2),
+                           'other': np.arange(n // 2)})
+        left_dt, right_dt = left.copy(), right.copy()
+        left_dt['key'] = pd.to_datetime(left.key, unit='s')
+        right_dt['key'] = pd.to_datetime(right.key, unit='s')
+        left_dt.loc[::5, 'key'] = pd.NaT
+        right_dt.loc[::7, 'key'] = pd.NaT
+
+        left_obj, right_obj = left.copy(), right.copy()
+        left_obj['key'] = left.key.astype(str)
+        right_obj['key'] = right.key.astype(str)
+
+        for l, r, on in [(left, right, 'key'),
+                         (left, right, ['key', 'key2']),
+                         (left_dt, right_dt, 'key'),
+                         (left_obj, right_obj, 'key'),
+                         (left.iloc[:0], right, 'key')]:
+            for how in ['left', 'right', 'inner', 'outer']:
+                for sort in [True, False]:
+                    expected = merge(l, r, on=on, how=how, sort=sort)
+                    for num_threads in [2, 3, 8]:
+                        result = merge(l, r, on=on, how=how, sort=sort,
+                                       num_threads=num_threads)
+                        assert_frame_equal(result, expected)
+
+        # a hash partition holding NaT alone
+        left_nat = DataFrame({'key': pd.to_datetime(['20160101', None,
+                                                     '20160102', None]),
+                              'value': np.arange(4)})
+        right_nat = DataFrame({'key': pd.to_datetime([None, '20160102']),
+                               'other': np.arange(2)})
+        for how in ['left', 'right', 'inner', 'outer']:
+            expected = merge(left_nat, right_nat, on='key', how=how)
+            result = merge(left_nat, right_nat, on='key', how=how,
+                           num_threads=8)
+            assert_frame_equal(result, expected)
+
+        with pd.option_context('compute.num_threads', 4):
+            result = left.merge(right, on='key')
+        assert_frame_equal(result, merge(left, right, on='key'))
+
+        self.assertRaises(TypeError, merge, left, right, num_threads=1.5)
+
+    def test_merge_sorted_keys(self):
+        # many-to-many
+        left = DataFrame({'key': [1, 1, 2, 4], 'lvalue': [1, 2, 3, 4]})
+        right = DataFrame({'key': [0, 1, 1, 4, 4],
+                           'rvalue': [5, 6, 7, 8, 9]})
+        result = merge(left, right, on='key', how='outer')
+        expected = DataFrame({'key': [1, 1, 1, 1, 2, 4, 4, 0],
+                              'lvalue': [1, 1, 2, 2, 3, 4, 4, nan],
+                              'rvalue': [6, 7, 6, 7, nan, 8, 9, 5]},
+                             columns=['key', 'lvalue', 'rvalue'])
+        assert_frame_equal(result, expected)
+
+        result = merge(left, right, on='key', how='right', sort=True)
+        expected = DataFrame({'key': [0, 1, 1, 1, 1, 4, 4],
+                              'lvalue': [nan, 1, 2, 1, 2, 4, 4],
+                              'rvalue': [5, 6, 6, 7, 7, 8, 9]},
+                             columns=['key', 'lvalue', 'rvalue'])
+        assert_frame_equal(result, expected)
+
+        # the same indexers as hashing the keys
+        np.random.seed(1234)
+        n = 200
+        left = DataFrame({'key': np.random.randint(0, 40, n),
+                          'key2': np.random.randint(0, 3, n),
+                          'lvalue': np.arange(n)})
+        right = DataFrame({'key': np.random.randint(20, 60, n // 2),
+                           'key2': np.random.randint(0, 3, n // 2),
+                           'rvalue': np.arange(n // 2)})
+        left = left.sort_values(['key', 'key2'])
+        right = right.sort_values(['key', 'key2'])
+        left_dt, right_dt = left.copy(), right.copy()
+        left_dt['key'] = pd.to_datetime(left.key, unit='D')
+        right_dt['key'] = pd.to_datetime(right.key, unit='D')
+
+        for l, r, on in [(left, right, ['key']),
+                         (left, right, ['key', 'key2']),
+                         (left_dt, right_dt, ['key']),
+                         (left * 0.5, right * 0.5, ['key'])]:
+            for how in ['left', 'right', 'inner', 'outer']:
+                for sort in [True, False]:
+                    op = _MergeOperation(l, r, on=on, how=how, sort=sort)
+                    self.assertIsNotNone(op._sorted_join_keys)
+                    result = op._get_join_indexers()
+                    expected = _get_join_indexers(op.left_join_keys,
+                                                  op.right_join_keys,
+                                                  sort=sort, how=how)
+                    tm.assert_numpy_array_equal(result[0], expected[0])
+                    tm.assert_numpy_array_equal(result[1], expected[1])
+
+        # unsorted or missing keys are hashed
+        for l, r in [(left, right.iloc[::-1]),
+                     (left.assign(key=left.key.where(left.key > 0)), right)]:
+            op = _MergeOperation(l, r, on='key')
+            self.assertIsNone(op._sorted_join_keys)
+
+    def test_prepared_join(self):
+        np.random.seed(1234)
+        n = 200
+        right = DataFrame({'key': np.random.randint(0, 30, n // 2),
+                           'key2': np.random.choice(['a', 'b', None], n // 2),
+                           'rvalue': np.arange(n // 2)})
+        left = DataFrame({'key': np.random.randint(15, 50, n),
+                          'key2': np.random.choice(['a', 'b', 'c', None], n),
+                          'lvalue': np.arange(n)})
+        right_nan = right.assign(key=right.key.astype(float))
+        right_nan.loc[::7, 'key'] = nan
+        left_nan = left.assign(key=left.key.astype(float))
+        left_nan.loc[::9, 'key'] = nan
+        left_dt = left.assign(key=pd.to_datetime(left.key, unit='D'))
+        left_dt.loc[::9, 'key'] = pd.NaT
+        right_dt = right.assign(key=pd.to_datetime(right.key, unit='D'))
+        right_dt.loc[::7, 'key'] = pd.NaT
+
+        for l, r, on in [(left, right, 'key'),
+                         (left, right, ['key', 'key2']),
+                         (left_nan, right_nan, 'key'),
+                         (left_nan, right_nan, ['key2', 'key']),
+                         (left_dt, right_dt, 'key'),
+                         (left, right_nan, 'key'),
+                         (left.iloc[:0], right, 'key'),
+                         (left, right.iloc[:0], 'key')]:
+            prepared = pd.PreparedJoin(r, on=on)
+            for how in ['left', 'right', 'inner', 'outer']:
+                for sort in [False, True]:
+                    result = prepared.merge(l, how=how, sort=sort)
+                    expected = merge(l, r, on=on, how=how, sort=sort)
+                    assert_frame_equal(result, expected)
+
+        prepared = pd.PreparedJoin(right, on='key')
+        result = prepared.merge(left.rename(columns={'key': 'lkey'}),
+                                left_on='lkey', indicator=True)
+        expected = merge(left.rename(columns={'key': 'lkey'}), right,
+                         left_on='lkey', right_on='key', indicator=True)
+        assert_frame_equal(result, expected)
+
+        self.assertRaises(KeyError, pd.PreparedJoin, right, on='foo')
+        self.assertRaises(ValueError, pd.PreparedJoin, right.key, on='key')
+
+    def test_merge_iter(self):
+        np.random.seed(1234)
+        n = 100
+        left = DataFrame({'key': np.random.randint(0, 30, n),
+                          'key2': np.random.choice(['a', 'b'], n),
+                          'lvalue': np.arange(n)})
+        right = DataFrame({'key': np.arange(20),
+                           'key2': ['a', 'b'] * 10,
+                           'rvalue': np.arange(20),
+                           'flag': [True, False] * 10})
+        chunks = [left.iloc[i:i + 10] for i in range(0, n, 10)]
+
+        for how in ['inner', 'left']:
+            for kwargs in [dict(on='key'), dict(on=['key', 'key2']), {},
+                           dict(left_on='key', right_on='rvalue')]:
+                results = list(pd.merge_iter(iter(chunks), right, how=how,
+                                             **kwargs))
+                self.assertEqual(len(results), len(chunks))
+                for chunk, result in zip(chunks, results):
+                    expected = merge(chunk, right, how=how, **kwargs)
+                    assert_frame_equal(result, expected, check_dtype=False)
+
+                # the same dtypes whether a chunk has unmatched rows or not
+                for result in results[1:]:
+                    assert_series_equal(result.dtypes, results[0].dtypes)
+                if how == 'left':
+                    self.assertEqual(results[0]['flag'].dtype, object)
+
+        reader = pd.read_csv(StringIO(left.to_csv(index=False)),
+                             chunksize=30)
+        result = pd.concat(pd.merge_iter(reader, right, on='key',
+                                         how='left', indicator=True))
+        expected = merge(left, right, on='key', how='left', indicator=True)
+        assert_frame_equal(result.reset_index(drop=True), expected,
+                           check_dtype=False)
+
+        self.assertRaises(MergeError, pd.merge_iter, chunks, right,
+                          how='outer')
+        self.assertRaises(MergeError, pd.merge_iter, chunks, right,
+                          on='key', left_on='key')
+        self.assertRaises(MergeError, pd.merge_iter, chunks, right,
+                          left_on='key')
+        self.assertRaises(ValueError, pd.merge_iter, chunks, right.key,
+                          on='key')
+
+    def test_semi_join(self):
+        np.random.seed(1234)
+        n = 100
+        left = DataFrame({'key': np.random.randint(0, 20, n).astype(float),
+                          'key2': np.random.choice(['a', 'b', None], n),
+                          'value': np.arange(n)},
+                         index=np.random.permutation(n))
+        right = DataFrame({'key': np.random.randint(10, 30, n // 2),
+                           'key2': np.random.choice(['a', 'c', None], n // 2),
+                           'other': np.arange(n // 2)})
+        left.loc[left.index[::7], 'key'] = nan
+        right_nan = right.assign(key=right.key.astype(float))
+        right_nan.loc[::5, 'key'] = nan
+
+        for r in [right, right_nan]:
+            for on in ['key', ['key', 'key2'], ['key2', 'key']]:
+                merged = merge(left.reset_index(), r, on=on, how='left',
+                               indicator=True)
+                matched = merged.groupby('index', sort=False)['_merge'].first()
+                mask = (matched == 'both').reindex(left.index).values
+                assert_frame_equal(left.semi_join(r, on=on), left[mask])
+                assert_frame_equal(left.anti_join(r, on=on), left[~mask])
+
+        # on the indexes
+        keyed = right.set_index(['key', 'key2'])
+        mask = left.semi_join(right, on=['key', 'key2']).index
+        result = left.semi_join(keyed, left_on=['key', 'key2'],
+                                right_index=True)
+        tm.assert_index_equal(result.index, mask)
+        result = left.set_index(['key', 'key2']).semi_join(
+            keyed, left_index=True, right_index=True)
+        tm.assert_numpy_array_equal(result['value'].values,
+                                    left.loc[mask, 'value'].values)
+
+        # on the common columns
+        assert_frame_equal(left.anti_join(right),
+                           left.anti_join(right, on=['key', 'key2']))
+
+        # tz-aware keys
+        dates = pd.date_range('20160101', periods=5, tz='US/Eastern')
+        tz_left = DataFrame({'time': dates, 'value': range(5)})
+        tz_right = DataFrame({'time': dates[[1, 3]]})
+        assert_frame_equal(tz_left.semi_join(tz_right, on='time'),
+                           tz_left.iloc[[1, 3]])
+        assert_frame_equal(tz_left.anti_join(tz_right, on='time'),
+                           tz_left.iloc[[0, 2, 4]])
+
+        self.assertRaises(MergeError, left.semi_join, right, on='key',
+                          left_on='key')
+        self.assertRaises(ValueError, left.semi_join, right,
+                          left_on=['key', 'key2'], right_on='key')
+        self.assertRaises(ValueError, left.semi_join, right.key, on='key')
+
     def test_indicator(self):
         # PR #10054. xref #7412 and closes #8790.
         df1 = DataFrame({'col1': [0, 1], 'col_left': [
@@ -572,6 +572,152 @@ class TestAsOfMerge(tm.TestCase):
 
         assert_frame_equal(result, expected)
 
+    def test_multiby(self):
+        # by several keys, of object dtype
+        trades = pd.DataFrame({
+            'time': pd.to_datetime(['20160525 13:30:00.023',
+                                    '20160525 13:30:00.023',
+                                    '20160525 13:30:00.046',
+                                    '20160525 13:30:00.048',
+                                    '20160525 13:30:00.050']),
+            'ticker': ['MSFT', 'MSFT',
+                       'GOOG', 'GOOG', 'AAPL'],
+            'exch': ['ARCA', 'NSDQ', 'NSDQ', 'BATS', 'NSDQ'],
+            'price': [51.95, 51.95,
+                      720.77, 720.92, 98.00],
+            'quantity': [75, 155,
+                         100, 100, 100]},
+            columns=['time', 'ticker', 'exch',
+                     'price', 'quantity'])
+
+        quotes = pd.DataFrame({
+            'time': pd.to_datetime(['20160525 13:30:00.023',
+                                    '20160525 13:30:00.023',
+                                    '20160525 13:30:00.030',
+                                    '20160525 13:30:00.041',
+                                    '20160525 13:30:00.045',
+                                    '20160525 13:30:00.049']),
+            'ticker': ['GOOG', 'MSFT', 'MSFT',
+                       'MSFT', 'GOOG', 'AAPL'],
+            'exch': ['BATS', 'NSDQ', 'ARCA', 'ARCA',
+                     'NSDQ', 'ARCA'],
+            'bid': [720.51, 51.95, 51.97, 51.99,
+                    720.50, 97.99],
+            'ask': [720.92, 51.96, 51.98, 52.00,
+                    720.93, 98.01]},
+            columns=['time', 'ticker', 'exch', 'bid', 'ask'])
+
+        expected = pd.DataFrame({
+            'time': pd.to_datetime(['20160525 13:30:00.023',
+                                    '20160525 13:30:00.023',
+                                    '20160525 13:30:00.046',
+                                    '20160525 13:30:00.048',
+                                    '20160525 13:30:00.050']),
+            'ticker': ['MSFT', 'MSFT',
+                       'GOOG', 'GOOG', 'AAPL'],
+            'exch': ['ARCA', 'NSDQ', 'NSDQ', 'BATS', 'NSDQ'],
+            'price': [51.95, 51.95,
+                      720.77, 720.92, 98.00],
+            'quantity': [75, 155,
+                         100, 100, 100],
+            'bid': [np.nan, 51.95, 720.50, 720.51, np.nan],
+            'ask': [np.nan, 51.96, 720.93, 720.92, np.nan]},
+            columns=['time', 'ticker', 'exch',
+                     'price', 'quantity', 'bid', 'ask'])
+
+        result = pd.merge_asof(trades, quotes, on='time',
+                               by=['ticker', 'exch'])
+        assert_frame_equal(result, expected)
+
+        # a mix of object and integer keys
+        trades['exch'] = trades['exch'].map({'ARCA': 0, 'NSDQ': 1,
+                                             'BATS': 2})
+        quotes['exch'] = quotes['exch'].map({'ARCA': 0, 'NSDQ': 1,
+                                             'BATS': 2})
+        expected['exch'] = expected['exch'].map({'ARCA': 0, 'NSDQ': 1,
+                                                 'BATS': 2})
+        result = pd.merge_asof(trades, quotes, on='time',
+                               by=['ticker', 'exch'])
+        assert_frame_equal(result, expected)
+
+        result = pd.merge_asof(trades, quotes.rename(columns={'exch': 'ex'}),
+                               on='time', left_by=['ticker', 'exch'],
+                               right_by=['ticker', 'ex'])
+        expected['ex'] = expected['exch'].where(expected['bid'].notnull())
+        assert_frame_equal(result, expected[result.columns])
+
+        self.assertRaises(MergeError, merge_asof, trades, quotes,
+                          on='time', left_by=['ticker', 'exch'],
+                          right_by='ticker')
+
+    def test_by_large_int(self):
+        # integer keys too spread out to be their own group ids
+        df1 = pd.DataFrame({'time': [1, 2, 3, 4],
+                            'key': [2 ** 40, 3, -2 ** 50, 3],
+                            'value1': [1, 2, 3, 4]})
+        df2 = pd.DataFrame({'time': [1, 2, 3],
+                            'key': [3, 2 ** 40, 2 ** 40],
+                            'value2': [5., 6., 7.]})
+        result = pd.merge_asof(df1, df2, on='time', by='key')
+        tm.assert_numpy_array_equal(result['value2'].values,
+                                    np.array([np.nan, 5, np.nan, 5]))
+
+    def test_direction(self):
+        left = pd.DataFrame({'a': [1, 5, 10],
+                             'left_val': ['a', 'b', 'c']})
+        right = pd.DataFrame({'a': [1, 2, 3, 6, 7],
+                              'right_val': [1, 2, 3, 6, 7]})
+
+        result = pd.merge_asof(left, right, on='a', direction='forward')
+        expected = pd.DataFrame({'a': [1, 5, 10],
+                                 'left_val': ['a', 'b', 'c'],
+                                 'right_val': [1, 6, np.nan]})
+        assert_frame_equal(result, expected)
+
+        result = pd.merge_asof(left, right, on='a', direction='forward',
+                               allow_exact_matches=False)
+        expected['right_val'] = [2, 6, np.nan]
+        assert_frame_equal(result, expected)
+
+        result = pd.merge_asof(left, right, on='a', direction='nearest')
+        expected['right_val'] = [1, 6, 7]
+        assert_frame_equal(result, expected)
+
+        # ties go backward
+        result = pd.merge_asof(left, right, on='a', direction='nearest',
+                               allow_exact_matches=False)
+        expected['right_val'] = [2, 6, 7]
+        assert_frame_equal(result, expected)
+
+        result = pd.merge_asof(left, right, on='a', direction='nearest',
+                               tolerance=1)
+        expected['right_val'] = [1, 6, np.nan]
+        assert_frame_equal(result, expected)
+
+        result = pd.merge_asof(left, right, on='a', direction='forward',
+                               tolerance=1, allow_exact_matches=False)
+        expected['right_val'] = [2, 6, np.nan]
+        assert_frame_equal(result, expected)
+
+    def test_direction_by(self):
+        left = pd.DataFrame({'a': [1, 5, 10, 12],
+                             'key': ['x', 'y', 'x', 'y'],
+                             'left_val': [1, 2, 3, 4]})
+        right = pd.DataFrame({'a': [2, 4, 6, 11],
+                              'key': ['x', 'y', 'y', 'x'],
+                              'right_val': [1, 2, 3, 4]})
+        expected = left.copy()
+        for direction, values in [('backward', [np.nan, 2, 1, 3]),
+                                  ('forward', [1, 3, 4, np.nan]),
+                                  ('nearest', [1, 2, 4, 3])]:
+            result = pd.merge_asof(left, right, on='a', by='key',
+                                   direction=direction)
+            expected['right_val'] = values
+            assert_frame_equal(result, expected, check_dtype=False)
+
+        self.assertRaises(MergeError, merge_asof, left, right, on='a',
+                          direction='sideways')
+
 
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
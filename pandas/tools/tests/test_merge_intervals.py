@@ -0,0 +1,173 @@
+import nose
+
+import numpy as np
+
+import pandas as pd
+from pandas import DataFrame, merge, merge_intervals
+from pandas.tools.merge import MergeError
+from pandas.util import testing as tm
+from pandas.util.testing import assert_frame_equal
+
+
+class TestIntervalMerge(tm.TestCase):
+
+    def setUp(self):
+        self.left = DataFrame({'t': [1, 5, 9, 12],
+                               'a': ['a1', 'a2', 'a3', 'a4']},
+                              columns=['t', 'a'])
+        self.right = DataFrame({'start': [0, 4, 8],
+                                'end': [5, 8, 10],
+                                'b': ['b1', 'b2', 'b3']},
+                               columns=['start', 'end', 'b'])
+
+    def cross_join(self, left, right, mask, how='inner'):
+        # the expected result of filtering a cross join
+        left = left.assign(_row=np.arange(len(left)), _key=0)
+        right = right.assign(_key=0)
+        result = merge(left, right, on='_key')
+        result = result[mask(result).values]
+        if how == 'left':
+            unmatched = left[~left._row.isin(result._row)]
+            result = pd.concat([result, unmatched])[result.columns]
+        result = result.sort_values('_row', kind='mergesort')
+        result = result.drop(['_row', '_key'], axis=1)
+        return result.reset_index(drop=True)
+
+    def test_point(self):
+        result = merge_intervals(self.left, self.right, left_on='t',
+                                 right_start='start', right_end='end')
+        expected = DataFrame({'t': [1, 5, 9],
+                              'a': ['a1', 'a2', 'a3'],
+                              'start': [0, 4, 8],
+                              'end': [5, 8, 10],
+                              'b': ['b1', 'b2', 'b3']},
+                             columns=['t', 'a', 'start', 'end', 'b'])
+        assert_frame_equal(result, expected)
+
+        result = merge_intervals(self.left, self.right, left_on='t',
+                                 right_start='start', right_end='end',
+                                 how='left')
+        expected.loc[3] = [12, 'a4', np.nan, np.nan, np.nan]
+        assert_frame_equal(result, expected)
+
+    def test_closed(self):
+        conditions = {
+            'left': lambda df: (df.start <= df.t) & (df.t < df.end),
+            'right': lambda df: (df.start < df.t) & (df.t <= df.end),
+            'both': lambda df: (df.start <= df.t) & (df.t <= df.end),
+            'neither': lambda df: (df.start < df.t) & (df.t < df.end)}
+        left = DataFrame({'t': np.arange(12)})
+        for closed, mask in conditions.items():
+            result = merge_intervals(left, self.right, left_on='t',
+                                     right_start='start', right_end='end',
+                                     closed=closed)
+            expected = self.cross_join(left, self.right, mask)
+            assert_frame_equal(result, expected)
+
+    def test_overlap(self):
+        right = DataFrame({'start': np.random.randint(0, 50, 40)})
+        right['end'] = right['start'] + np.random.randint(0, 10, 40)
+        left = DataFrame({'first': np.random.randint(0, 50, 30)})
+        left['last'] = left['first'] + np.random.randint(0, 10, 30)
+
+        for closed in ['left', 'both']:
+            for how in ['inner', 'left']:
+                result = merge_intervals(left, right, left_start='first',
+                                         left_end='last',
+                                         right_start='start',
+                                         right_end='end', closed=closed,
+                                         how=how)
+                if closed == 'both':
+                    mask = lambda df: ((df.start <= df['last']) &
+                                       (df['first'] <= df.end))
+                else:
+                    mask = lambda df: ((df.start < df['last']) &
+                                       (df['first'] < df.end))
+                expected = self.cross_join(left, right, mask, how=how)
+                assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_by(self):
+        n = 100
+        left = DataFrame({'t': np.random.randint(0, 100, n),
+                          'k1': np.random.choice(['x', 'y', 'z'], n),
+                          'k2': np.random.randint(0, 3, n)})
+        right = DataFrame({'start': np.random.randint(0, 100, 20),
+                           'k1': np.random.choice(['x', 'y'], 20),
+                           'k2': np.random.randint(0, 3, 20)})
+        right['end'] = right['start'] + np.random.randint(0, 30, 20)
+
+        result = merge_intervals(left, right, left_on='t',
+                                 right_start='start', right_end='end',
+                                 by=['k1', 'k2'], how='left')
+        mask = lambda df: ((df.k1 == df.rk1) & (df.k2 == df.rk2) &
+                           (df.start <= df.t) & (df.t < df.end))
+        renamed = right.rename(columns={'k1': 'rk1', 'k2': 'rk2'})
+        expected = self.cross_join(left, renamed, mask, how='left')
+        expected = expected.drop(['rk1', 'rk2'], axis=1)
+        assert_frame_equal(result, expected[result.columns],
+                           check_dtype=False)
+
+        result = merge_intervals(left, right.rename(columns={'k1': 'g'}),
+                                 left_on='t', right_start='start',
+                                 right_end='end', left_by='k1',
+                                 right_by='g')
+        self.assertIn('g', result)
+        self.assertTrue((result['k1'] == result['g']).all())
+
+    def test_missing(self):
+        left = DataFrame({'t': [1., np.nan, 6.]})
+        right = DataFrame({'start': [0, np.nan, 5., 7.],
+                           'end': [10, 10, np.nan, 6.]},
+                          columns=['start', 'end'])
+        result = merge_intervals(left, right, left_on='t',
+                                 right_start='start', right_end='end',
+                                 how='left')
+        expected = DataFrame({'t': [1., np.nan, 6.],
+                              'start': [0., np.nan, 0.],
+                              'end': [10., np.nan, 10.]},
+                             columns=['t', 'start', 'end'])
+        assert_frame_equal(result, expected)
+
+    def test_datetime(self):
+        left = DataFrame({'time': pd.date_range('20160101', periods=5,
+                                                freq='H', tz='US/Eastern')})
+        right = DataFrame({'start': pd.to_datetime(['20160101 00:30',
+                                                    '20160101 02:00']),
+                           'end': pd.to_datetime(['20160101 02:30',
+                                                  '20160101 03:00'])})
+        right = right.apply(lambda x: x.dt.tz_localize('US/Eastern'))
+        result = merge_intervals(left, right, left_on='time',
+                                 right_start='start', right_end='end')
+        self.assertEqual(list(result['time']),
+                         list(left['time'][[1, 2, 2]]))
+        self.assertEqual(list(result['start']),
+                         list(right['start'][[0, 0, 1]]))
+
+        naive = right.apply(lambda x: x.dt.tz_localize(None))
+        with tm.assertRaises(MergeError):
+            merge_intervals(left, naive, left_on='time',
+                            right_start='start', right_end='end')
+
+    def test_invalid(self):
+        left, right = self.left, self.right
+        kwargs = dict(right_start='start', right_end='end')
+
+        self.assertRaises(MergeError, merge_intervals, left, right,
+                          left_on='t')
+        self.assertRaises(MergeError, merge_intervals, left, right,
+                          **kwargs)
+        self.assertRaises(MergeError, merge_intervals, left, right,
+                          left_on='t', left_start='t', **kwargs)
+        self.assertRaises(MergeError, merge_intervals, left, right,
+                          left_on='t', how='outer', **kwargs)
+        self.assertRaises(ValueError, merge_intervals, left, right,
+                          left_on='t', closed='all', **kwargs)
+        self.assertRaises(MergeError, merge_intervals, left, right,
+                          left_on='a', **kwargs)
+        self.assertRaises(MergeError, merge_intervals, left, right,
+                          left_on='t', left_by='a', **kwargs)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
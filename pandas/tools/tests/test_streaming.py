@@ -0,0 +1,106 @@
+import numpy as np
+
+import pandas as pd
+from pandas import DataFrame
+from pandas.compat import StringIO, range
+from pandas.core.common import PerformanceWarning
+from pandas.tools.streaming import streaming_groupby
+import pandas.util.testing as tm
+
+
+class TestStreamingGroupBy(tm.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        n = 1000
+        self.df = DataFrame({'A': np.random.randint(0, 10, n),
+                             'B': np.random.choice(['foo', 'bar'], n),
+                             'C': np.random.randn(n),
+                             'D': np.random.randint(0, 5, n),
+                             'E': np.random.choice(list('xyz'), n)})
+        self.df.loc[::7, 'C'] = np.nan
+        self.df.loc[self.df.A == 3, 'C'] = np.nan
+
+    def chunks(self, size=150):
+        return (self.df.iloc[i:i + size]
+                for i in range(0, len(self.df), size))
+
+    def test_agg_dict(self):
+        agg = {'C': ['count', 'sum', 'prod', 'min', 'max', 'first', 'last',
+                     'mean', 'var', 'std', 'nunique', 'median', 'quantile'],
+               'D': ['sum', 'mean', 'std', 'nunique', 'median'],
+               'E': ['min', 'max', 'first', 'last', 'nunique']}
+        with tm.assert_produces_warning(PerformanceWarning):
+            result = streaming_groupby(self.chunks(), ['A', 'B'], agg)
+        expected = self.df.groupby(['A', 'B']).agg(agg)
+        tm.assert_frame_equal(result, expected[result.columns],
+                              check_dtype=False)
+
+        agg = {'C': 'mean', 'D': 'sum'}
+        with tm.assert_produces_warning(None):
+            result = streaming_groupby(self.chunks(), 'A', agg)
+        expected = self.df.groupby('A').agg(agg)
+        tm.assert_frame_equal(result, expected[result.columns])
+
+    def test_agg_string_and_list(self):
+        for how in ['sum', 'max', 'first', 'std']:
+            result = streaming_groupby(self.chunks(), 'A', how)
+            expected = getattr(self.df.groupby('A'), how)()
+            tm.assert_frame_equal(result, expected)
+
+        result = streaming_groupby(self.chunks(), 'A', ['mean', 'var'])
+        expected = self.df.groupby('A').agg(['mean', 'var'])
+        tm.assert_frame_equal(result, expected)
+
+    def test_quantile(self):
+        for q in [0, 0.1, 0.5, 0.75, 1]:
+            with tm.assert_produces_warning(PerformanceWarning):
+                result = streaming_groupby(self.chunks(), 'A',
+                                           {'C': 'quantile'}, q=q)
+            expected = self.df.groupby('A').C.quantile(q)
+            tm.assert_series_equal(result['C'], expected)
+
+        self.assertRaises(ValueError, streaming_groupby, self.chunks(), 'A',
+                          {'C': 'quantile'}, q=1.5)
+
+    def test_single_chunk(self):
+        # the levels of a single partial are in order of appearance
+        df = DataFrame({'A': [3, 1, 3, 1, 2, 3],
+                        'B': ['y', 'x', 'x', 'y', 'x', 'y'],
+                        'C': [5., 1., 2., 9., 4., 0.]})
+        with tm.assert_produces_warning(PerformanceWarning):
+            result = streaming_groupby([df], 'A', {'C': 'median'})
+        tm.assert_series_equal(result['C'], df.groupby('A').C.median())
+
+        with tm.assert_produces_warning(PerformanceWarning):
+            result = streaming_groupby([df], 'A', {'C': 'quantile'}, q=0.25)
+        tm.assert_series_equal(result['C'], df.groupby('A').C.quantile(0.25))
+
+        result = streaming_groupby([df], ['A', 'B'], 'sum')
+        tm.assert_frame_equal(result, df.groupby(['A', 'B']).sum())
+
+    def test_sort(self):
+        result = streaming_groupby(self.chunks(), 'A', 'sum', sort=False)
+        expected = self.df.groupby('A', sort=False).sum()
+        tm.assert_frame_equal(result, expected)
+
+    def test_text_reader(self):
+        reader = pd.read_csv(StringIO(self.df.to_csv(index=False)),
+                             chunksize=100)
+        result = streaming_groupby(reader, 'B', {'D': ['sum', 'mean']})
+        expected = self.df.groupby('B').agg({'D': ['sum', 'mean']})
+        tm.assert_frame_equal(result, expected)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, streaming_groupby, self.chunks(), 'A',
+                          {'C': 'ohlc'})
+        self.assertRaises(ValueError, streaming_groupby, self.chunks(), 'A',
+                          {'A': 'sum'})
+        self.assertRaises(ValueError, streaming_groupby, [], 'A', 'sum')
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -4,6 +4,7 @@
 from numpy cimport *
 cimport numpy as np
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 
 cimport cython
 
@@ -238,57 +239,200 @@ cdef class VariableWindowIndexer(WindowIndexer):
         self.N = len(index)
         self.minp = _check_minp(win, minp, self.N)
 
-        self.start = np.empty(self.N, dtype='int64')
-        self.start.fill(-1)
+        self.start, self.end = variable_window_bounds(index, win)
+
+        # max window size
+        self.win = (self.end - self.start).max()
+
+
+cdef class GroupedWindowIndexer(WindowIndexer):
+    """
+    create a window indexer object for data sorted by group, where
+    no window reaches across the boundary of its group
+
+    Parameters
+    ----------
+    input: ndarray
+        input data array
+    win: int64_t
+        window size, or the span of the window in units of the index
+    minp: int64_t
+        min number of obs in a window to consider non-NaN
+    index: ndarray, optional
+        index of the input, monotonic within each group
+    groups: ndarray
+        offset at which each group ends
+    floor: optional
+        unit for flooring the unit
 
-        self.end = np.empty(self.N, dtype='int64')
-        self.end.fill(-1)
+    """
+    def __init__(self, ndarray input, int64_t win, int64_t minp,
+                 object index, ndarray groups, object floor=None):
 
-        self.build(index, win)
+        self.is_variable = 1
+        self.N = len(input)
+        self.minp = _check_minp(win, minp, self.N, floor=floor)
+
+        self.start = np.empty(self.N, dtype='int64')
+        self.end = np.arange(1, self.N + 1, dtype='int64')
+
+        if index is None:
+            self.build_fixed(np.asarray(groups, dtype='int64'), win)
+        else:
+            self.start, self.end = variable_window_bounds(index, win,
+                                                          groups=groups)
 
         # max window size
-        self.win = (self.end - self.start).max()
+        self.win = max((self.end - self.start).max() if self.N else 0, 1)
 
-    def build(self, ndarray[int64_t] index, int64_t win):
+    def build_fixed(self, ndarray[int64_t] groups, int64_t win):
 
         cdef:
-            ndarray[int64_t] start, end
-            int64_t start_bound, end_bound, N
-            Py_ssize_t i, j
+            ndarray[int64_t] start
+            int64_t group_start = 0
+            Py_ssize_t i, k, ngroups = len(groups)
 
         start = self.start
-        end = self.end
-        N = self.N
-
-        start[0] = 0
-        end[0] = 1
 
         with nogil:
 
-            # start is start of slice interval (including)
-            # end is end of slice interval (not including)
-            for i in range(1, N):
-                end_bound = index[i]
-                start_bound = index[i] - win
-
-                # advance the start bound until we are
-                # within the constraint
-                start[i] = i
-                for j in range(start[i - 1], i):
-                    if index[j] > start_bound:
-                        start[i] = j
-                        break
+            for k in range(ngroups):
+                for i in range(group_start, groups[k]):
+                    start[i] = i - win + 1
+                    if start[i] < group_start:
+                        start[i] = group_start
+                group_start = groups[k]
+
+
+cdef class BoundsWindowIndexer(WindowIndexer):
+    """
+    create a window indexer object from precomputed start & end
+    offsets of each window, see variable_window_bounds
+
+    Parameters
+    ----------
+    input: ndarray
+        input data array
+    win: int64_t
+        window size, or the span of the window in units of the index
+    minp: int64_t
+        min number of obs in a window to consider non-NaN
+    bounds: tuple of 1d int64 ndarrays
+        the start (including) and end (not including) offsets of each
+        window, both non-decreasing
+    floor: optional
+        unit for flooring the unit
+
+    """
+    def __init__(self, ndarray input, int64_t win, int64_t minp,
+                 object bounds, object floor=None):
+
+        self.is_variable = 1
+        self.N = len(input)
+        self.minp = _check_minp(win, minp, self.N, floor=floor)
+
+        self.start, self.end = [np.asarray(b, dtype='int64') for b in bounds]
+        if len(self.start) != self.N or len(self.end) != self.N:
+            raise ValueError("bounds must be of the length of input")
+
+        # max window size
+        self.win = max((self.end - self.start).max() if self.N else 0, 1)
+
+
+def variable_window_bounds(ndarray[int64_t] index, int64_t win,
+                           object closed=None, bint center=False,
+                           object groups=None):
+    """
+    Compute the bounds of the windows spanning win in units of the index,
+    in a single sweep of the index
+
+    Parameters
+    ----------
+    index: 1d int64 ndarray
+        monotonic increasing within each group
+    win: int64_t
+        the span of the window in units of the index
+    closed: {'right', 'left', 'both', 'neither'}, optional
+        the endpoints of the span included in the window, 'right' by
+        default
+    center: bint, default False
+        center the window on each position rather than end it there
+    groups: 1d int64 ndarray, optional
+        offset at which each group ends, for an index sorted by group;
+        windows are then restricted to their own group
+
+    Returns
+    -------
+    tuple of the start (including) and end (not including) offsets of
+    each window, as 1d int64 ndarrays
+
+    """
+    cdef:
+        ndarray[int64_t] start, end, ends
+        int64_t delta, group_start = 0
+        Py_ssize_t i, j, e, k, N, ngroups
+        bint left_closed, right_closed
+
+    if closed is None:
+        closed = 'right'
+    if closed not in ['right', 'left', 'both', 'neither']:
+        raise ValueError("closed must be 'right', 'left', 'both' "
+                         "or 'neither'")
+    left_closed = closed in ['left', 'both']
+    right_closed = closed in ['right', 'both']
+
+    N = len(index)
+    if groups is None:
+        ends = np.array([N], dtype='int64')
+    else:
+        ends = np.asarray(groups, dtype='int64')
+    ngroups = len(ends)
 
-                # end bound is previous end
-                # or current index
-                if index[end[i - 1]] <= end_bound:
+    start = np.empty(N, dtype='int64')
+    end = np.empty(N, dtype='int64')
+
+    with nogil:
+
+        for k in range(ngroups):
+
+            # j is the first and e one past the last position of the
+            # window, both only move forward within the group
+            j = e = group_start
+            for i in range(group_start, ends[k]):
+
+                # advance the start until we are within the span, which
+                # for a centered window stretches half of it on each side
+                while j < i:
+                    delta = index[i] - index[j]
+                    if center:
+                        delta = 2 * delta
+                    if delta < win or (left_closed and delta == win):
+                        break
+                    j += 1
+                start[i] = j
+
+                if center:
+                    if e < j:
+                        e = j
+                    while e < ends[k]:
+                        delta = 2 * (index[e] - index[i])
+                        if not (delta < win or
+                                (right_closed and delta == win)):
+                            break
+                        e += 1
+                    end[i] = e
+                elif right_closed:
                     end[i] = i + 1
                 else:
-                    end[i] = end[i - 1]
+                    end[i] = i
+
+            group_start = ends[k]
+
+    return start, end
 
 
 def get_window_indexer(input, win, minp, index, floor=None,
-                       use_mock=True):
+                       use_mock=True, groups=None, bounds=None):
     """
     return the correct window indexer for the computation
 
@@ -306,6 +450,12 @@ def get_window_indexer(input, win, minp, index, floor=None,
         instead of the FixedWindow Indexer. This is a type
         compat Indexer that allows us to use a standard
         code path with all of the indexers.
+    groups: 1d int64 ndarray, optional
+        offset at which each group ends, for input sorted by group;
+        windows are then restricted to their own group
+    bounds: tuple of 1d int64 ndarrays, optional
+        precomputed start & end offsets of each window, such as those of
+        variable_window_bounds, used instead of win, index and groups
 
     Returns
     -------
@@ -313,7 +463,12 @@ def get_window_indexer(input, win, minp, index, floor=None,
 
     """
 
-    if index is not None:
+    if bounds is not None:
+        indexer = BoundsWindowIndexer(input, win, minp, bounds, floor)
+    elif groups is not None:
+        indexer = GroupedWindowIndexer(input, win, minp, index, groups,
+                                       floor)
+    elif index is not None:
         indexer = VariableWindowIndexer(input, win, minp, index)
     elif use_mock:
         indexer = MockFixedWindowIndexer(input, win, minp, index, floor)
@@ -327,7 +482,7 @@ def get_window_indexer(input, win, minp, index, floor=None,
 
 
 def roll_count(ndarray[double_t] input, int64_t win, int64_t minp,
-               object index):
+               object index, object groups=None, object bounds=None):
     cdef:
         double val, count_x = 0.0
         int64_t s, e, nobs, N
@@ -336,7 +491,9 @@ def roll_count(ndarray[double_t] input, int64_t win, int64_t minp,
         ndarray[double_t] output
 
     start, end, N, win, minp, _ = get_window_indexer(input, win,
-                                                     minp, index)
+                                                     minp, index,
+                                                     groups=groups,
+                                                     bounds=bounds)
     output = np.empty(N, dtype=float)
 
     with nogil:
@@ -345,7 +502,9 @@ def roll_count(ndarray[double_t] input, int64_t win, int64_t minp,
             s = start[i]
             e = end[i]
 
-            if i == 0:
+            # a window not overlapping the previous one, as at the start
+            # of a group, is computed from scratch
+            if i == 0 or s >= end[i - 1]:
 
                 # setup
                 count_x = 0.0
@@ -408,7 +567,7 @@ cdef inline void remove_sum(double val, int64_t *nobs, double *sum_x) nogil:
 
 
 def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
-             object index):
+             object index, object groups=None, object bounds=None):
     cdef:
         double val, prev_x, sum_x = 0
         int64_t s, e
@@ -418,7 +577,9 @@ def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
         ndarray[double_t] output
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
-                                                               minp, index)
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
     output = np.empty(N, dtype=float)
 
     # for performance we are going to iterate
@@ -434,7 +595,9 @@ def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
                 s = start[i]
                 e = end[i]
 
-                if i == 0:
+                # a window not overlapping the previous one, as at the
+                # start of a group, is computed from scratch
+                if i == 0 or s >= end[i - 1]:
 
                     # setup
                     sum_x = 0.0
@@ -507,8 +670,7 @@ cdef inline void add_mean(double val, Py_ssize_t *nobs, double *sum_x,
     if val == val:
         nobs[0] = nobs[0] + 1
         sum_x[0] = sum_x[0] + val
-        if signbit(val):
-            neg_ct[0] = neg_ct[0] + 1
+        neg_ct[0] = neg_ct[0] + (signbit(val) != 0)
 
 
 cdef inline void remove_mean(double val, Py_ssize_t *nobs, double *sum_x,
@@ -518,12 +680,11 @@ cdef inline void remove_mean(double val, Py_ssize_t *nobs, double *sum_x,
     if val == val:
         nobs[0] = nobs[0] - 1
         sum_x[0] = sum_x[0] - val
-        if signbit(val):
-            neg_ct[0] = neg_ct[0] - 1
+        neg_ct[0] = neg_ct[0] - (signbit(val) != 0)
 
 
 def roll_mean(ndarray[double_t] input, int64_t win, int64_t minp,
-              object index):
+              object index, object groups=None, object bounds=None):
     cdef:
         double val, prev_x, result, sum_x = 0
         int64_t s, e
@@ -533,7 +694,9 @@ def roll_mean(ndarray[double_t] input, int64_t win, int64_t minp,
         ndarray[double_t] output
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
-                                                               minp, index)
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
     output = np.empty(N, dtype=float)
 
     # for performance we are going to iterate
@@ -548,11 +711,14 @@ def roll_mean(ndarray[double_t] input, int64_t win, int64_t minp,
                 s = start[i]
                 e = end[i]
 
-                if i == 0:
+                # a window not overlapping the previous one, as at the
+                # start of a group, is computed from scratch
+                if i == 0 or s >= end[i - 1]:
 
                     # setup
                     sum_x = 0.0
                     nobs = 0
+                    neg_ct = 0
                     for j in range(s, e):
                         val = input[j]
                         add_mean(val, &nobs, &sum_x, &neg_ct)
@@ -647,7 +813,7 @@ cdef inline void remove_var(double val, double *nobs, double *mean_x,
 
 
 def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
-             object index, int ddof=1):
+             object index, int ddof=1, object groups=None, object bounds=None):
     """
     Numerically stable implementation using Welford's method.
     """
@@ -660,7 +826,9 @@ def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
         ndarray[double_t] output
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
-                                                               minp, index)
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
     output = np.empty(N, dtype=float)
 
     # Check for windows larger than array, addresses #7297
@@ -680,9 +848,11 @@ def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed, the same goes for a window not
+                # overlapping the previous one, as at the start of a group
+                if i == 0 or s >= end[i - 1]:
 
+                    nobs = mean_x = ssqdm_x = 0
                     for j in range(s, e):
                         add_var(input[j], &nobs, &mean_x, &ssqdm_x)
 
@@ -789,7 +959,7 @@ cdef inline void remove_skew(double val, int64_t *nobs, double *x, double *xx,
 
 
 def roll_skew(ndarray[double_t] input, int64_t win, int64_t minp,
-              object index):
+              object index, object groups=None, object bounds=None):
     cdef:
         double val, prev
         double x = 0, xx = 0, xxx = 0
@@ -800,7 +970,9 @@ def roll_skew(ndarray[double_t] input, int64_t win, int64_t minp,
         ndarray[double_t] output
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
-                                                               minp, index)
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
     output = np.empty(N, dtype=float)
 
     if is_variable:
@@ -813,9 +985,12 @@ def roll_skew(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed, the same goes for a window not
+                # overlapping the previous one, as at the start of a group
+                if i == 0 or s >= end[i - 1]:
 
+                    nobs = 0
+                    x = xx = xxx = 0
                     for j in range(s, e):
                         val = input[j]
                         add_skew(val, &nobs, &x, &xx, &xxx)
@@ -916,7 +1091,7 @@ cdef inline void remove_kurt(double val, int64_t *nobs, double *x, double *xx,
 
 
 def roll_kurt(ndarray[double_t] input, int64_t win, int64_t minp,
-              object index):
+              object index, object groups=None, object bounds=None):
     cdef:
         double val, prev
         double x = 0, xx = 0, xxx = 0, xxxx = 0
@@ -927,7 +1102,9 @@ def roll_kurt(ndarray[double_t] input, int64_t win, int64_t minp,
         ndarray[double_t] output
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
-                                                               minp, index)
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
     output = np.empty(N, dtype=float)
 
     if is_variable:
@@ -940,9 +1117,12 @@ def roll_kurt(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed, the same goes for a window not
+                # overlapping the previous one, as at the start of a group
+                if i == 0 or s >= end[i - 1]:
 
+                    nobs = 0
+                    x = xx = xxx = xxxx = 0
                     for j in range(s, e):
                         add_kurt(input[j], &nobs, &x, &xx, &xxx, &xxxx)
 
@@ -980,12 +1160,721 @@ def roll_kurt(ndarray[double_t] input, int64_t win, int64_t minp,
 
     return output
 
+# ----------------------------------------------------------------------
+# Rolling sum, mean, var, skew and kurt of 2-d blocks
+# these keep the state of each column in an array and sweep the rows of
+# the block once, computing the window bounds a single time for all
+# of the columns
+
+
+def roll_sum_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                object index, object groups=None, object bounds=None):
+    """
+    roll_sum of each column of a 2-d array
+    """
+    cdef:
+        int64_t s, e
+        int64_t i, j, k, N, K
+        bint is_variable
+        ndarray[int64_t] start, end, nobs
+        ndarray[double_t] sum_x
+        ndarray[double_t, ndim=2] output
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=float)
+    nobs = np.zeros(K, dtype='int64')
+    sum_x = np.zeros(K, dtype=float)
+
+    if is_variable:
+
+        with nogil:
+
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
+
+                if i == 0 or s >= end[i - 1]:
+
+                    for k in range(K):
+                        sum_x[k] = 0.0
+                        nobs[k] = 0
+                    for j in range(s, e):
+                        for k in range(K):
+                            add_sum(input[j, k], &nobs[k], &sum_x[k])
+
+                else:
+
+                    for j in range(start[i - 1], s):
+                        for k in range(K):
+                            remove_sum(input[j, k], &nobs[k], &sum_x[k])
+
+                    for j in range(end[i - 1], e):
+                        for k in range(K):
+                            add_sum(input[j, k], &nobs[k], &sum_x[k])
+
+                for k in range(K):
+                    output[i, k] = calc_sum(minp, nobs[k], sum_x[k])
+
+    else:
+
+        with nogil:
+
+            for i in range(0, minp - 1):
+                for k in range(K):
+                    add_sum(input[i, k], &nobs[k], &sum_x[k])
+                    output[i, k] = NaN
+
+            for i in range(minp - 1, N):
+                for k in range(K):
+                    add_sum(input[i, k], &nobs[k], &sum_x[k])
+
+                    if i > win - 1:
+                        remove_sum(input[i - win, k], &nobs[k], &sum_x[k])
+
+                    output[i, k] = calc_sum(minp, nobs[k], sum_x[k])
+
+    return output
+
+
+def roll_mean_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                 object index, object groups=None, object bounds=None):
+    """
+    roll_mean of each column of a 2-d array
+    """
+    cdef:
+        int64_t s, e
+        bint is_variable
+        Py_ssize_t i, j, k, N, K
+        ndarray[int64_t] start, end
+        ndarray[Py_ssize_t] nobs, neg_ct
+        ndarray[double_t] sum_x
+        ndarray[double_t, ndim=2] output
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=float)
+    nobs = np.zeros(K, dtype=np.intp)
+    neg_ct = np.zeros(K, dtype=np.intp)
+    sum_x = np.zeros(K, dtype=float)
+
+    if is_variable:
+
+        with nogil:
+
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
+
+                if i == 0 or s >= end[i - 1]:
+
+                    for k in range(K):
+                        sum_x[k] = 0.0
+                        nobs[k] = 0
+                        neg_ct[k] = 0
+                    for j in range(s, e):
+                        for k in range(K):
+                            add_mean(input[j, k], &nobs[k], &sum_x[k],
+                                     &neg_ct[k])
+
+                else:
+
+                    for j in range(start[i - 1], s):
+                        for k in range(K):
+                            remove_mean(input[j, k], &nobs[k], &sum_x[k],
+                                        &neg_ct[k])
+
+                    for j in range(end[i - 1], e):
+                        for k in range(K):
+                            add_mean(input[j, k], &nobs[k], &sum_x[k],
+                                     &neg_ct[k])
+
+                for k in range(K):
+                    output[i, k] = calc_mean(minp, nobs[k], neg_ct[k],
+                                             sum_x[k])
+
+    else:
+
+        with nogil:
+
+            for i in range(0, minp - 1):
+                for k in range(K):
+                    add_mean(input[i, k], &nobs[k], &sum_x[k], &neg_ct[k])
+                    output[i, k] = NaN
+
+            for i in range(minp - 1, N):
+                for k in range(K):
+                    add_mean(input[i, k], &nobs[k], &sum_x[k], &neg_ct[k])
+
+                    if i > win - 1:
+                        remove_mean(input[i - win, k], &nobs[k], &sum_x[k],
+                                    &neg_ct[k])
+
+                    output[i, k] = calc_mean(minp, nobs[k], neg_ct[k],
+                                             sum_x[k])
+
+    return output
+
+
+def roll_var_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                object index, int ddof=1, object groups=None,
+                object bounds=None):
+    """
+    roll_var of each column of a 2-d array
+    """
+    cdef:
+        double val, prev, delta
+        int64_t s, e
+        bint is_variable
+        Py_ssize_t i, j, k, N, K
+        ndarray[int64_t] start, end
+        ndarray[double_t] nobs, mean_x, ssqdm_x
+        ndarray[double_t, ndim=2] output
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=float)
+    nobs = np.zeros(K, dtype=float)
+    mean_x = np.zeros(K, dtype=float)
+    ssqdm_x = np.zeros(K, dtype=float)
+
+    # Check for windows larger than array, addresses #7297
+    win = min(win, N)
+
+    if is_variable:
+
+        with nogil:
+
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
+
+                if i == 0 or s >= end[i - 1]:
+
+                    for k in range(K):
+                        nobs[k] = mean_x[k] = ssqdm_x[k] = 0
+                    for j in range(s, e):
+                        for k in range(K):
+                            add_var(input[j, k], &nobs[k], &mean_x[k],
+                                    &ssqdm_x[k])
+
+                else:
+
+                    for j in range(end[i - 1], e):
+                        for k in range(K):
+                            add_var(input[j, k], &nobs[k], &mean_x[k],
+                                    &ssqdm_x[k])
+
+                    for j in range(start[i - 1], s):
+                        for k in range(K):
+                            remove_var(input[j, k], &nobs[k], &mean_x[k],
+                                       &ssqdm_x[k])
+
+                for k in range(K):
+                    output[i, k] = calc_var(minp, ddof, nobs[k], ssqdm_x[k])
+
+    else:
+
+        with nogil:
+
+            for i in range(0, win):
+                for k in range(K):
+                    add_var(input[i, k], &nobs[k], &mean_x[k], &ssqdm_x[k])
+                    output[i, k] = calc_var(minp, ddof, nobs[k], ssqdm_x[k])
+
+            for i in range(win, N):
+                for k in range(K):
+                    val = input[i, k]
+                    prev = input[i - win, k]
+
+                    if val == val:
+                        if prev == prev:
+
+                            # Adding one observation and removing another
+                            delta = val - prev
+                            prev -= mean_x[k]
+                            mean_x[k] += delta / nobs[k]
+                            val -= mean_x[k]
+                            ssqdm_x[k] += (val + prev) * delta
+
+                        else:
+                            add_var(val, &nobs[k], &mean_x[k], &ssqdm_x[k])
+                    elif prev == prev:
+                        remove_var(prev, &nobs[k], &mean_x[k], &ssqdm_x[k])
+
+                    output[i, k] = calc_var(minp, ddof, nobs[k], ssqdm_x[k])
+
+    return output
+
+
+def roll_skew_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                 object index, object groups=None, object bounds=None):
+    """
+    roll_skew of each column of a 2-d array
+    """
+    cdef:
+        int64_t i, j, k, N, K
+        int64_t s, e
+        bint is_variable
+        ndarray[int64_t] start, end, nobs
+        ndarray[double_t] x, xx, xxx
+        ndarray[double_t, ndim=2] output
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=float)
+    nobs = np.zeros(K, dtype='int64')
+    x = np.zeros(K, dtype=float)
+    xx = np.zeros(K, dtype=float)
+    xxx = np.zeros(K, dtype=float)
+
+    if is_variable:
+
+        with nogil:
+
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
+
+                if i == 0 or s >= end[i - 1]:
+
+                    for k in range(K):
+                        nobs[k] = 0
+                        x[k] = xx[k] = xxx[k] = 0
+                    for j in range(s, e):
+                        for k in range(K):
+                            add_skew(input[j, k], &nobs[k], &x[k], &xx[k],
+                                     &xxx[k])
+
+                else:
+
+                    for j in range(end[i - 1], e):
+                        for k in range(K):
+                            add_skew(input[j, k], &nobs[k], &x[k], &xx[k],
+                                     &xxx[k])
+
+                    for j in range(start[i - 1], s):
+                        for k in range(K):
+                            remove_skew(input[j, k], &nobs[k], &x[k], &xx[k],
+                                        &xxx[k])
+
+                for k in range(K):
+                    output[i, k] = calc_skew(minp, nobs[k], x[k], xx[k],
+                                             xxx[k])
+
+    else:
+
+        with nogil:
+
+            for i in range(0, minp - 1):
+                for k in range(K):
+                    add_skew(input[i, k], &nobs[k], &x[k], &xx[k], &xxx[k])
+                    output[i, k] = NaN
+
+            for i in range(minp - 1, N):
+                for k in range(K):
+                    add_skew(input[i, k], &nobs[k], &x[k], &xx[k], &xxx[k])
+
+                    if i > win - 1:
+                        remove_skew(input[i - win, k], &nobs[k], &x[k],
+                                    &xx[k], &xxx[k])
+
+                    output[i, k] = calc_skew(minp, nobs[k], x[k], xx[k],
+                                             xxx[k])
+
+    return output
+
+
+def roll_kurt_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                 object index, object groups=None, object bounds=None):
+    """
+    roll_kurt of each column of a 2-d array
+    """
+    cdef:
+        int64_t i, j, k, N, K
+        int64_t s, e
+        bint is_variable
+        ndarray[int64_t] start, end, nobs
+        ndarray[double_t] x, xx, xxx, xxxx
+        ndarray[double_t, ndim=2] output
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               groups=groups,
+                                                               bounds=bounds)
+    K = input.shape[1]
+    output = np.empty((N, K), dtype=float)
+    nobs = np.zeros(K, dtype='int64')
+    x = np.zeros(K, dtype=float)
+    xx = np.zeros(K, dtype=float)
+    xxx = np.zeros(K, dtype=float)
+    xxxx = np.zeros(K, dtype=float)
+
+    if is_variable:
+
+        with nogil:
+
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
+
+                if i == 0 or s >= end[i - 1]:
+
+                    for k in range(K):
+                        nobs[k] = 0
+                        x[k] = xx[k] = xxx[k] = xxxx[k] = 0
+                    for j in range(s, e):
+                        for k in range(K):
+                            add_kurt(input[j, k], &nobs[k], &x[k], &xx[k],
+                                     &xxx[k], &xxxx[k])
+
+                else:
+
+                    for j in range(end[i - 1], e):
+                        for k in range(K):
+                            add_kurt(input[j, k], &nobs[k], &x[k], &xx[k],
+                                     &xxx[k], &xxxx[k])
+
+                    for j in range(start[i - 1], s):
+                        for k in range(K):
+                            remove_kurt(input[j, k], &nobs[k], &x[k], &xx[k],
+                                        &xxx[k], &xxxx[k])
+
+                for k in range(K):
+                    output[i, k] = calc_kurt(minp, nobs[k], x[k], xx[k],
+                                             xxx[k], xxxx[k])
+
+    else:
+
+        with nogil:
+
+            for i in range(0, minp - 1):
+                for k in range(K):
+                    add_kurt(input[i, k], &nobs[k], &x[k], &xx[k], &xxx[k],
+                             &xxxx[k])
+                    output[i, k] = NaN
+
+            for i in range(minp - 1, N):
+                for k in range(K):
+                    add_kurt(input[i, k], &nobs[k], &x[k], &xx[k], &xxx[k],
+                             &xxxx[k])
+
+                    if i > win - 1:
+                        remove_kurt(input[i - win, k], &nobs[k], &x[k],
+                                    &xx[k], &xxx[k], &xxxx[k])
+
+                    output[i, k] = calc_kurt(minp, nobs[k], x[k], xx[k],
+                                             xxx[k], xxxx[k])
+
+    return output
+
+# ----------------------------------------------------------------------
+# Rolling covariance and correlation of each pair of columns
+# these sweep the rows once for all of the pairs, with the updates of
+# roll_mean and roll_var of the two columns masked by one another
+
+
+cdef inline void mask_pair(double *x, double *y) nogil:
+    """ mask both values of a pair unless both are valid """
+    if x[0] != x[0] or y[0] != y[0]:
+        x[0] = y[0] = NaN
+
+
+cdef inline void add_cov(double x, double y, Py_ssize_t *nobs, double *sum_x,
+                         double *sum_y, double *sum_xy, Py_ssize_t *neg_x,
+                         Py_ssize_t *neg_y, Py_ssize_t *neg_xy) nogil:
+    """ add a pair of masked values, both valid or both NaN, to the means """
+    cdef double xy
+
+    # Not NaN
+    if x == x:
+        xy = x * y
+        nobs[0] = nobs[0] + 1
+        sum_x[0] = sum_x[0] + x
+        sum_y[0] = sum_y[0] + y
+        sum_xy[0] = sum_xy[0] + xy
+        neg_x[0] = neg_x[0] + (signbit(x) != 0)
+        neg_y[0] = neg_y[0] + (signbit(y) != 0)
+        neg_xy[0] = neg_xy[0] + (signbit(xy) != 0)
+
+
+cdef inline void remove_cov(double x, double y, Py_ssize_t *nobs,
+                            double *sum_x, double *sum_y, double *sum_xy,
+                            Py_ssize_t *neg_x, Py_ssize_t *neg_y,
+                            Py_ssize_t *neg_xy) nogil:
+    """ remove a pair of masked values from the means """
+    cdef double xy
+
+    if x == x:
+        xy = x * y
+        nobs[0] = nobs[0] - 1
+        sum_x[0] = sum_x[0] - x
+        sum_y[0] = sum_y[0] - y
+        sum_xy[0] = sum_xy[0] - xy
+        neg_x[0] = neg_x[0] - (signbit(x) != 0)
+        neg_y[0] = neg_y[0] - (signbit(y) != 0)
+        neg_xy[0] = neg_xy[0] - (signbit(xy) != 0)
+
+
+cdef inline void replace_var(double val, double prev, double *nobs,
+                             double *mean_x, double *ssqdm_x) nogil:
+    """ add a value to the var calc and remove another one """
+    cdef double delta
+
+    if val == val:
+        if prev == prev:
+
+            # Adding one observation and removing another one
+            delta = val - prev
+            prev -= mean_x[0]
+            mean_x[0] += delta / nobs[0]
+            val -= mean_x[0]
+            ssqdm_x[0] += (val + prev) * delta
+
+        else:
+            add_var(val, nobs, mean_x, ssqdm_x)
+    elif prev == prev:
+        remove_var(prev, nobs, mean_x, ssqdm_x)
+
+
+def roll_cov_pairwise(ndarray[double_t, ndim=2] input_x,
+                      ndarray[double_t, ndim=2] input_y, int64_t win,
+                      int64_t minp, int ddof=1, bint corr=False,
+                      bint symmetric=False, object bounds=None):
+    """
+    Rolling covariance, or correlation, of each column of input_x with each
+    column of input_y over a fixed window, or over the variable windows of
+    bounds, from the rows where both are valid.
+
+    Parameters
+    ----------
+    input_x: 2-d ndarray (float64 type)
+    input_y: 2-d ndarray (float64 type)
+        with the rows of input_x
+    win: int64_t
+        window size
+    minp: int64_t
+        min number of obs in a window to consider non-NaN
+    ddof: int, default 1
+        delta degrees of freedom of the covariance
+    corr: bint, default False
+        compute the correlation, from the covariance and the variances with
+        1 degree of freedom, rather than the covariance
+    symmetric: bint, default False
+        input_y is input_x, only the pairs of the upper triangle are then
+        computed and mirrored
+    bounds: tuple of 1d int64 ndarrays, optional
+        the start and end offsets of each window, see
+        variable_window_bounds
+
+    Returns
+    -------
+    3-d ndarray (float64 type) of shape (rows, columns of input_x,
+    columns of input_y)
+    """
+    cdef:
+        double x, y, prev_x, prev_y, count, cov, var_x, var_y
+        Py_ssize_t i, j, a, b, p, N, Kx, Ky, var_win, b_start = 0
+        int64_t s, e
+        bint is_variable
+        ndarray[int64_t] start, end
+        ndarray[Py_ssize_t] nobs, neg_x, neg_y, neg_xy
+        ndarray[double_t] sum_x, sum_y, sum_xy
+        ndarray[double_t] nobs_x, mean_x, ssqdm_x, nobs_y, mean_y, ssqdm_y
+        ndarray[double_t, ndim=3] output
+
+    N, Kx = input_x.shape[0], input_x.shape[1]
+    Ky = input_y.shape[1]
+    if input_y.shape[0] != N:
+        raise ValueError("input_x and input_y must have the same rows")
+    if corr:
+        ddof = 1
+
+    start, end, N, win, minp, is_variable = get_window_indexer(
+        input_x, win, minp, None, bounds=bounds)
+    output = np.empty((N, Kx, Ky), dtype=float)
+
+    # the means of the products and of each column of a pair, the count
+    # of the rows where both are valid is their number of observations
+    nobs = np.zeros(Kx * Ky, dtype=np.intp)
+    neg_x = np.zeros(Kx * Ky, dtype=np.intp)
+    neg_y = np.zeros(Kx * Ky, dtype=np.intp)
+    neg_xy = np.zeros(Kx * Ky, dtype=np.intp)
+    sum_x = np.zeros(Kx * Ky, dtype=float)
+    sum_y = np.zeros(Kx * Ky, dtype=float)
+    sum_xy = np.zeros(Kx * Ky, dtype=float)
+
+    # the variances of each column of a pair, for the correlation
+    nobs_x = np.zeros(Kx * Ky, dtype=float)
+    mean_x = np.zeros(Kx * Ky, dtype=float)
+    ssqdm_x = np.zeros(Kx * Ky, dtype=float)
+    nobs_y = np.zeros(Kx * Ky, dtype=float)
+    mean_y = np.zeros(Kx * Ky, dtype=float)
+    ssqdm_y = np.zeros(Kx * Ky, dtype=float)
+
+    if is_variable:
+
+        with nogil:
+
+            for i in range(N):
+                s = start[i]
+                e = end[i]
+
+                for a in range(Kx):
+                    if symmetric:
+                        b_start = a
+                    for b in range(b_start, Ky):
+                        p = a * Ky + b
+
+                        # a window not overlapping the previous one, as at
+                        # the start of a group, is computed from scratch
+                        if i == 0 or s >= end[i - 1]:
+
+                            nobs[p] = neg_x[p] = neg_y[p] = neg_xy[p] = 0
+                            sum_x[p] = sum_y[p] = sum_xy[p] = 0
+                            nobs_x[p] = mean_x[p] = ssqdm_x[p] = 0
+                            nobs_y[p] = mean_y[p] = ssqdm_y[p] = 0
+                            for j in range(s, e):
+                                x = input_x[j, a]
+                                y = input_y[j, b]
+                                mask_pair(&x, &y)
+                                add_cov(x, y, &nobs[p], &sum_x[p],
+                                        &sum_y[p], &sum_xy[p], &neg_x[p],
+                                        &neg_y[p], &neg_xy[p])
+                                if corr:
+                                    add_var(x, &nobs_x[p], &mean_x[p],
+                                            &ssqdm_x[p])
+                                    add_var(y, &nobs_y[p], &mean_y[p],
+                                            &ssqdm_y[p])
+
+                        else:
+
+                            # the deletes then the adds of roll_mean
+                            for j in range(start[i - 1], s):
+                                x = input_x[j, a]
+                                y = input_y[j, b]
+                                mask_pair(&x, &y)
+                                remove_cov(x, y, &nobs[p], &sum_x[p],
+                                           &sum_y[p], &sum_xy[p], &neg_x[p],
+                                           &neg_y[p], &neg_xy[p])
+                            for j in range(end[i - 1], e):
+                                x = input_x[j, a]
+                                y = input_y[j, b]
+                                mask_pair(&x, &y)
+                                add_cov(x, y, &nobs[p], &sum_x[p],
+                                        &sum_y[p], &sum_xy[p], &neg_x[p],
+                                        &neg_y[p], &neg_xy[p])
+
+                            # the adds then the deletes of roll_var
+                            if corr:
+                                for j in range(end[i - 1], e):
+                                    x = input_x[j, a]
+                                    y = input_y[j, b]
+                                    mask_pair(&x, &y)
+                                    add_var(x, &nobs_x[p], &mean_x[p],
+                                            &ssqdm_x[p])
+                                    add_var(y, &nobs_y[p], &mean_y[p],
+                                            &ssqdm_y[p])
+                                for j in range(start[i - 1], s):
+                                    x = input_x[j, a]
+                                    y = input_y[j, b]
+                                    mask_pair(&x, &y)
+                                    remove_var(x, &nobs_x[p], &mean_x[p],
+                                               &ssqdm_x[p])
+                                    remove_var(y, &nobs_y[p], &mean_y[p],
+                                               &ssqdm_y[p])
+
+                        count = <double>nobs[p]
+                        cov = ((calc_mean(minp, nobs[p], neg_xy[p],
+                                          sum_xy[p]) -
+                                calc_mean(minp, nobs[p], neg_x[p], sum_x[p]) *
+                                calc_mean(minp, nobs[p], neg_y[p], sum_y[p])) *
+                               (count / (count - ddof)))
+
+                        if corr:
+                            var_x = calc_var(minp, 1, nobs_x[p], ssqdm_x[p])
+                            var_y = calc_var(minp, 1, nobs_y[p], ssqdm_y[p])
+                            cov = cov / (sqrt(var_x) * sqrt(var_y))
+
+                        output[i, a, b] = cov
+                        if symmetric:
+                            output[i, b, a] = cov
+
+        return output
+
+    # Check for windows larger than array, addresses #7297
+    var_win = min(win, N)
+
+    with nogil:
+
+        for i in range(N):
+            for a in range(Kx):
+                if symmetric:
+                    b_start = a
+                for b in range(b_start, Ky):
+                    p = a * Ky + b
+
+                    x = input_x[i, a]
+                    y = input_y[i, b]
+                    mask_pair(&x, &y)
+                    add_cov(x, y, &nobs[p], &sum_x[p], &sum_y[p],
+                            &sum_xy[p], &neg_x[p], &neg_y[p], &neg_xy[p])
+
+                    if i > win - 1:
+                        prev_x = input_x[i - win, a]
+                        prev_y = input_y[i - win, b]
+                        mask_pair(&prev_x, &prev_y)
+                        remove_cov(prev_x, prev_y, &nobs[p], &sum_x[p],
+                                   &sum_y[p], &sum_xy[p], &neg_x[p],
+                                   &neg_y[p], &neg_xy[p])
+
+                    # the mean of the products less the product of the
+                    # means, with the bias adjustment
+                    count = <double>nobs[p]
+                    cov = ((calc_mean(minp, nobs[p], neg_xy[p], sum_xy[p]) -
+                            calc_mean(minp, nobs[p], neg_x[p], sum_x[p]) *
+                            calc_mean(minp, nobs[p], neg_y[p], sum_y[p])) *
+                           (count / (count - ddof)))
+
+                    if corr:
+                        if i < var_win:
+                            add_var(x, &nobs_x[p], &mean_x[p], &ssqdm_x[p])
+                            add_var(y, &nobs_y[p], &mean_y[p], &ssqdm_y[p])
+                        else:
+                            replace_var(x, prev_x, &nobs_x[p], &mean_x[p],
+                                        &ssqdm_x[p])
+                            replace_var(y, prev_y, &nobs_y[p], &mean_y[p],
+                                        &ssqdm_y[p])
+
+                        var_x = calc_var(minp, 1, nobs_x[p], ssqdm_x[p])
+                        var_y = calc_var(minp, 1, nobs_y[p], ssqdm_y[p])
+                        cov = cov / (sqrt(var_x) * sqrt(var_y))
+
+                    output[i, a, b] = cov
+                    if symmetric:
+                        output[i, b, a] = cov
+
+    return output
+
+
 # ----------------------------------------------------------------------
 # Rolling median, min, max
 
 
 def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
-                  object index):
+                  object index, object groups=None, object bounds=None):
     cdef:
         double val, res, prev
         bint err=0, is_variable
@@ -1002,7 +1891,7 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
     start, end, N, win, minp, is_variable = get_window_indexer(
         input, win,
         minp, index,
-        use_mock=False)
+        use_mock=False, groups=groups, bounds=bounds)
     output = np.empty(N, dtype=float)
 
     sl = skiplist_init(<int>win)
@@ -1018,24 +1907,26 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
             if i == 0:
 
                 # setup
-                val = input[i]
-                if val == val:
-                    nobs += 1
-                    err = skiplist_insert(sl, val) != 1
-                    if err:
-                        break
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
 
             else:
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
+                # calculate deletes, up to the end of the previous window
+                # if it does not overlap this one
+                for j in range(start[i - 1], min(s, end[i - 1])):
                     val = input[j]
                     if val == val:
                         skiplist_remove(sl, val)
                         nobs -= 1
 
                 # calculate adds
-                for j in range(end[i - 1], e):
+                for j in range(max(end[i - 1], s), e):
                     val = input[j]
                     if val == val:
                         nobs += 1
@@ -1111,7 +2002,7 @@ cdef inline numeric calc_mm(int64_t minp, Py_ssize_t nobs,
 
 
 def roll_max(ndarray[numeric] input, int64_t win, int64_t minp,
-             object index):
+             object index, object groups=None, object bounds=None):
     """
     Moving max of 1d array of any numeric type along axis=0 ignoring NaNs.
 
@@ -1123,12 +2014,17 @@ def roll_max(ndarray[numeric] input, int64_t win, int64_t minp,
           is below this, output a NaN
     index: ndarray, optional
        index for window computation
+    groups: ndarray, optional
+       offset at which each group ends, for input sorted by group
+    bounds: tuple of ndarrays, optional
+       start and end offsets of each window, see variable_window_bounds
     """
-    return _roll_min_max(input, win, minp, index, is_max=1)
+    return _roll_min_max(input, win, minp, index, groups, bounds,
+                         is_max=1)
 
 
 def roll_min(ndarray[numeric] input, int64_t win, int64_t minp,
-             object index):
+             object index, object groups=None, object bounds=None):
     """
     Moving max of 1d array of any numeric type along axis=0 ignoring NaNs.
 
@@ -1140,12 +2036,17 @@ def roll_min(ndarray[numeric] input, int64_t win, int64_t minp,
           is below this, output a NaN
     index: ndarray, optional
        index for window computation
+    groups: ndarray, optional
+       offset at which each group ends, for input sorted by group
+    bounds: tuple of ndarrays, optional
+       start and end offsets of each window, see variable_window_bounds
     """
-    return _roll_min_max(input, win, minp, index, is_max=0)
+    return _roll_min_max(input, win, minp, index, groups, bounds,
+                         is_max=0)
 
 
 cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
-                   object index, bint is_max):
+                   object index, object groups, object bounds, bint is_max):
     """
     Moving min/max of 1d array of any numeric type along axis=0
     ignoring NaNs.
@@ -1170,7 +2071,7 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
 
     starti, endi, N, win, minp, is_variable = get_window_indexer(
         input, win,
-        minp, index)
+        minp, index, groups=groups, bounds=bounds)
 
     output = np.empty(N, dtype=input.dtype)
 
@@ -1182,9 +2083,17 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
                 s = starti[i]
                 e = endi[i]
 
-                r = input[s]
+                # an empty window, as may be excluding its right endpoint
+                if s >= e:
+                    if numeric in cython.floating:
+                        output[i] = NaN
+                    else:
+                        output[i] = 0
+                    continue
+
                 nobs = 0
-                for j in range(s, e):
+                r = init_mm(input[s], &nobs, is_max)
+                for j in range(s + 1, e):
 
                     # adds, death at the i offset
                     ai = init_mm(input[j], &nobs, is_max)
@@ -1272,69 +2181,106 @@ cdef _roll_min_max(ndarray[numeric] input, int64_t win, int64_t minp,
 
 
 def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
-                  int64_t minp, object index, double quantile):
+                  int64_t minp, object index, double quantile,
+                  object groups=None, object bounds=None):
     """
     O(N log(window)) implementation using skip list
     """
+    return roll_quantiles(input, win, minp, index,
+                          np.array([quantile], dtype=np.float64),
+                          groups=groups, bounds=bounds).ravel()
+
+
+def roll_quantiles(ndarray[float64_t, cast=True] input, int64_t win,
+                   int64_t minp, object index,
+                   ndarray[float64_t] quantiles, object groups=None,
+                   object bounds=None):
+    """
+    O(N log(window)) implementation using a single skip list for all of
+    the quantiles
+
+    Returns
+    -------
+    2-d ndarray with a column for each of the quantiles
+    """
     cdef:
-        double val, prev, midpoint
-        IndexableSkiplist skiplist
-        int64_t nobs = 0, i, j, s, e, N
-        Py_ssize_t idx
-        bint is_variable
+        double val
+        bint err=0, is_variable
+        int ret=0
+        skiplist_t *sl
+        Py_ssize_t i, j, k, nq
+        int64_t nobs = 0, N, s, e
         ndarray[int64_t] start, end
-        ndarray[double_t] output
+        ndarray[double_t, ndim=2] output
 
     # we use the Fixed/Variable Indexer here as the
     # actual skiplist ops outweigh any window computation costs
     start, end, N, win, minp, is_variable = get_window_indexer(
         input, win,
         minp, index,
-        use_mock=False)
-    output = np.empty(N, dtype=float)
-    skiplist = IndexableSkiplist(win)
+        use_mock=False, groups=groups, bounds=bounds)
+    nq = len(quantiles)
+    output = np.empty((N, nq), dtype=float)
 
-    for i in range(0, N):
-        s = start[i]
-        e = end[i]
+    sl = skiplist_init(<int>win)
+    if sl == NULL:
+        raise MemoryError("skiplist_init failed")
 
-        if i == 0:
+    with nogil:
 
-            # setup
-            val = input[i]
-            if val == val:
-                nobs += 1
-                skiplist.insert(val)
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-        else:
+            if i == 0:
 
-            # calculate deletes
-            for j in range(start[i - 1], s):
-                val = input[j]
-                if val == val:
-                    skiplist.remove(val)
-                    nobs -= 1
+                # setup
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
 
-            # calculate adds
-            for j in range(end[i - 1], e):
-                val = input[j]
-                if val == val:
-                    nobs += 1
-                    skiplist.insert(val)
+            else:
 
-        if nobs >= minp:
-            idx = int(quantile * <double>(nobs - 1))
-            output[i] = skiplist.get(idx)
-        else:
-            output[i] = NaN
+                # calculate deletes, up to the end of the previous window
+                # if it does not overlap this one
+                for j in range(start[i - 1], min(s, end[i - 1])):
+                    val = input[j]
+                    if val == val:
+                        skiplist_remove(sl, val)
+                        nobs -= 1
 
+                # calculate adds
+                for j in range(max(end[i - 1], s), e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
+
+            if nobs >= minp:
+                for k in range(nq):
+                    output[i, k] = skiplist_get(
+                        sl, <int>(quantiles[k] * <double>(nobs - 1)), &ret)
+            else:
+                for k in range(nq):
+                    output[i, k] = NaN
+
+    skiplist_destroy(sl)
+    if err:
+        raise MemoryError("skiplist_insert failed")
     return output
 
 
 def roll_generic(ndarray[float64_t, cast=True] input,
                  int64_t win, int64_t minp, object index,
                  int offset, object func,
-                 object args, object kwargs):
+                 object args, object kwargs, object groups=None,
+                 object bounds=None):
     cdef:
         ndarray[double_t] output, counts, bufarr
         float64_t *buf
@@ -1352,12 +2298,14 @@ def roll_generic(ndarray[float64_t, cast=True] input,
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
                                                                minp, index,
-                                                               floor=0)
+                                                               floor=0,
+                                                               groups=groups,
+                                                               bounds=bounds)
     output = np.empty(N, dtype=float)
 
     counts = roll_sum(np.concatenate([np.isfinite(input).astype(float),
                                       np.array([0.] * offset)]),
-                      win, minp, index)[offset:]
+                      win, minp, index, groups, bounds)[offset:]
 
     if is_variable:
 
@@ -1408,6 +2356,88 @@ def roll_generic(ndarray[float64_t, cast=True] input,
     return output
 
 
+def roll_generic_batch(ndarray[float64_t, cast=True] input,
+                       int64_t win, int64_t minp, object index,
+                       int offset, object func,
+                       object args, object kwargs, object groups=None,
+                       object bounds=None, int64_t batch_size=1 << 20):
+    """
+    roll_generic calling func on many windows at once rather than once
+    per window
+
+    The windows of the same length are passed to func as the rows of a
+    2-d read-only array, a strided view of the input when their starts
+    are consecutive, in blocks of about batch_size values. func must
+    return a 1-d array of one value per row. A window of a length of its
+    own, as the truncated windows at the ends of a fixed window, is
+    passed as a single row.
+    """
+    cdef:
+        ndarray[double_t] output
+        ndarray[int64_t] start, end, lengths, counts, csum, rows, starts
+        int64_t N, length, nrows, b
+        bint is_variable
+
+    if not input.flags.c_contiguous:
+        input = input.copy('C')
+
+    n = len(input)
+    if n == 0:
+        return input
+
+    fixed_win = win
+    start, end, N, win, minp, is_variable = get_window_indexer(input, win,
+                                                               minp, index,
+                                                               floor=0,
+                                                               groups=groups,
+                                                               bounds=bounds)
+
+    if is_variable:
+        if offset != 0:
+            raise ValueError("unable to roll_generic with a non-zero offset")
+    else:
+        # the windows of roll_generic, truncated at both ends
+        end = np.arange(offset + 1, N + offset + 1, dtype=np.int64)
+        start = (end - fixed_win).clip(0, N)
+        end = end.clip(0, N)
+
+    csum = np.concatenate([[0], np.isfinite(input).cumsum()]).astype(
+        np.int64)
+    counts = csum[end] - csum[start]
+    lengths = end - start
+
+    output = np.empty(N, dtype=float)
+    output.fill(NaN)
+
+    for length in np.unique(lengths[counts >= minp]):
+        if length <= 0:
+            continue
+
+        windows = as_strided(input, shape=(N - length + 1, length),
+                             strides=(input.strides[0], input.strides[0]))
+        windows.flags.writeable = False
+
+        rows = (lengths == length).nonzero()[0].astype(np.int64)
+        nrows = max(batch_size // length, 1)
+        for b in range(0, len(rows), nrows):
+            block = rows[b:b + nrows]
+            starts = start[block]
+            if starts[len(starts) - 1] - starts[0] == len(starts) - 1:
+                values = windows[starts[0]:starts[0] + len(starts)]
+            else:
+                values = windows[starts]
+                values.flags.writeable = False
+
+            result = np.asarray(func(values, *args, **kwargs), dtype=float)
+            if result.shape != (len(block),):
+                raise ValueError("func must return a 1-d array of one "
+                                 "value per window")
+            output[block] = result
+
+    output[counts < minp] = NaN
+    return output
+
+
 def roll_window(ndarray[float64_t, ndim=1, cast=True] input,
                 ndarray[float64_t, ndim=1, cast=True] weights,
                 int minp, bint avg=True):
@@ -1476,8 +2506,17 @@ def roll_window(ndarray[float64_t, ndim=1, cast=True] input,
 # Exponentially weighted moving average
 
 
+def ewma_state():
+    """
+    the state of ewma before any input: the number of observations, the
+    weighted average and the weight of the previous observations
+    """
+    return np.array([0, NaN, 1.], dtype=float)
+
+
 def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
-         int minp):
+         int minp, ndarray[double_t] state=None,
+         ndarray[double_t] deltas=None):
     """
     Compute exponentially-weighted moving average using center-of-mass.
 
@@ -1488,6 +2527,14 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
     adjust: int
     ignore_na: int
     minp: int
+    state: ndarray (float64 type), optional
+        the state left by a call on the preceding data, see ewma_state;
+        updated in place to the state at the end of input
+    deltas: ndarray (float64 type), optional
+        the time elapsed since the previous position; the weights then
+        decay by (com / (1 + com)) ** deltas[i] at each position, so by
+        the elapsed time rather than by the number of positions, whatever
+        ignore_na
 
     Returns
     -------
@@ -1496,33 +2543,38 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
 
     cdef Py_ssize_t N = len(input)
     cdef ndarray[double_t] output = np.empty(N, dtype=float)
-    if N == 0:
-        return output
 
     minp = max(minp, 1)
 
     cdef double alpha, old_wt_factor, new_wt, weighted_avg, old_wt, cur
     cdef Py_ssize_t i, nobs
+    cdef bint is_observation, use_deltas = deltas is not None
+
+    if use_deltas and len(deltas) != N:
+        raise ValueError("deltas must be of the length of input")
 
     alpha = 1. / (1. + com)
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    weighted_avg = input[0]
-    is_observation = (weighted_avg == weighted_avg)
-    nobs = int(is_observation)
-    output[0] = weighted_avg if (nobs >= minp) else NaN
-    old_wt = 1.
+    if state is None:
+        state = ewma_state()
+    nobs = <Py_ssize_t>state[0]
+    weighted_avg = state[1]
+    old_wt = state[2]
 
-    for i from 1 <= i < N:
+    for i from 0 <= i < N:
         cur = input[i]
         is_observation = (cur == cur)
         nobs += int(is_observation)
         if weighted_avg == weighted_avg:
 
-            if is_observation or (not ignore_na):
+            if is_observation or (not ignore_na) or use_deltas:
 
-                old_wt *= old_wt_factor
+                if use_deltas:
+                    old_wt *= old_wt_factor ** deltas[i]
+                else:
+                    old_wt *= old_wt_factor
                 if is_observation:
 
                     # avoid numerical errors on constant series
@@ -1538,14 +2590,27 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
 
         output[i] = weighted_avg if (nobs >= minp) else NaN
 
+    state[0] = nobs
+    state[1] = weighted_avg
+    state[2] = old_wt
     return output
 
 # ----------------------------------------------------------------------
 # Exponentially weighted moving covariance
 
 
+def ewmcov_state():
+    """
+    the state of ewmcov before any input: the number of observations, the
+    means of x and y, the covariance, the sums of the weights and of the
+    squared weights and the weight of the previous observations
+    """
+    return np.array([0, NaN, NaN, 0., 1., 1., 1.], dtype=float)
+
+
 def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
-           double_t com, int adjust, int ignore_na, int minp, int bias):
+           double_t com, int adjust, int ignore_na, int minp, int bias,
+           ndarray[double_t] state=None, ndarray[double_t] deltas=None):
     """
     Compute exponentially-weighted moving variance using center-of-mass.
 
@@ -1558,6 +2623,14 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
     ignore_na: int
     minp: int
     bias: int
+    state: ndarray (float64 type), optional
+        the state left by a call on the preceding data, see ewmcov_state;
+        updated in place to the state at the end of input
+    deltas: ndarray (float64 type), optional
+        the time elapsed since the previous position; the weights then
+        decay by (com / (1 + com)) ** deltas[i] at each position, so by
+        the elapsed time rather than by the number of positions, whatever
+        ignore_na
 
     Returns
     -------
@@ -1569,42 +2642,46 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
         raise ValueError("arrays are of different lengths "
                          "(%d and %d)" % (N, len(input_y)))
     cdef ndarray[double_t] output = np.empty(N, dtype=float)
-    if N == 0:
-        return output
 
     minp = max(minp, 1)
 
     cdef double alpha, old_wt_factor, new_wt, mean_x, mean_y, cov
     cdef double sum_wt, sum_wt2, old_wt, cur_x, cur_y, old_mean_x, old_mean_y
+    cdef double numerator, denominator, wt_factor
     cdef Py_ssize_t i, nobs
+    cdef bint is_observation, use_deltas = deltas is not None
+
+    if use_deltas and len(deltas) != N:
+        raise ValueError("deltas must be of the length of input")
 
     alpha = 1. / (1. + com)
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    mean_x = input_x[0]
-    mean_y = input_y[0]
-    is_observation = ((mean_x == mean_x) and (mean_y == mean_y))
-    nobs = int(is_observation)
-    if not is_observation:
-        mean_x = NaN
-        mean_y = NaN
-    output[0] = (0. if bias else NaN) if (nobs >= minp) else NaN
-    cov = 0.
-    sum_wt = 1.
-    sum_wt2 = 1.
-    old_wt = 1.
-
-    for i from 1 <= i < N:
+    if state is None:
+        state = ewmcov_state()
+    nobs = <Py_ssize_t>state[0]
+    mean_x = state[1]
+    mean_y = state[2]
+    cov = state[3]
+    sum_wt = state[4]
+    sum_wt2 = state[5]
+    old_wt = state[6]
+
+    for i from 0 <= i < N:
         cur_x = input_x[i]
         cur_y = input_y[i]
         is_observation = ((cur_x == cur_x) and (cur_y == cur_y))
         nobs += int(is_observation)
         if mean_x == mean_x:
-            if is_observation or (not ignore_na):
-                sum_wt *= old_wt_factor
-                sum_wt2 *= (old_wt_factor * old_wt_factor)
-                old_wt *= old_wt_factor
+            if is_observation or (not ignore_na) or use_deltas:
+                if use_deltas:
+                    wt_factor = old_wt_factor ** deltas[i]
+                else:
+                    wt_factor = old_wt_factor
+                sum_wt *= wt_factor
+                sum_wt2 *= (wt_factor * wt_factor)
+                old_wt *= wt_factor
                 if is_observation:
                     old_mean_x = mean_x
                     old_mean_y = mean_y
@@ -1646,4 +2723,11 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
         else:
             output[i] = NaN
 
+    state[0] = nobs
+    state[1] = mean_x
+    state[2] = mean_y
+    state[3] = cov
+    state[4] = sum_wt
+    state[5] = sum_wt2
+    state[6] = old_wt
     return output